@@ -10,7 +10,12 @@ Exit Codes:
   3 - Script execution error
 
 Usage:
-  python3 project_scanner.py [options]
+  python3 project_scanner.py [options] [ROOT ...]
+
+Each ROOT (default: current directory) and its immediate subdirectories are
+surveyed. Every project directory is listed once with os.scandir() and all
+existence checks are answered from that listing; projects are analyzed
+concurrently.
 
 Options:
   --quiet, -q      Minimal output (just summary)
@@ -18,6 +23,7 @@ Options:
   --json           Output in JSON format
   --no-save        Don't save report to .aget/project_scan.json
   --exit-zero      Always exit with 0 (for CI/CD compatibility)
+  --jobs N         Projects analyzed concurrently (default: min(32, 4 x CPUs))
 """
 
 import os
@@ -25,6 +31,7 @@ import sys
 import json
 import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
@@ -42,11 +49,68 @@ class MigrationStatus(Enum):
         return self.value
 
 
+# Subdirectories of a root that are never projects themselves
+SKIP_DIRS = ['scripts', 'patterns', 'SESSION_NOTES', '.git', '__pycache__',
+             'scripts.backup', '.aget', 'node_modules', '.venv', 'venv']
+
+# Configuration files of other coding agents
+COMPATIBILITY_FILES = ['.cursorrules', '.aider.conf.yml', '.aider.conf.yaml',
+                       '.claude.md', 'cursor.toml', 'aider.toml']
+
+
+class _DirListing:
+    """Existence checks under one project, one os.scandir() per directory.
+
+    Names map to 'dir', 'file' or 'other' (symlinks followed); dangling
+    symlinks are omitted so answers match Path.exists().
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._dirs = {}
+
+    def entries(self, rel: str = '') -> Optional[Dict[str, str]]:
+        """{name: kind} for root/rel, or None if it is not a readable directory"""
+        if rel not in self._dirs:
+            listing = None
+            try:
+                with os.scandir(self.root / rel if rel else self.root) as it:
+                    listing = {}
+                    for entry in it:
+                        try:
+                            if entry.is_dir():
+                                listing[entry.name] = 'dir'
+                            elif entry.is_file():
+                                listing[entry.name] = 'file'
+                            elif not entry.is_symlink() or os.path.exists(entry.path):
+                                listing[entry.name] = 'other'
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+            self._dirs[rel] = listing
+        return self._dirs[rel]
+
+    def kind(self, rel: str) -> Optional[str]:
+        parent, _, name = rel.rpartition('/')
+        listing = self.entries(parent)
+        return listing.get(name) if listing is not None else None
+
+    def exists(self, rel: str) -> bool:
+        return self.kind(rel) is not None
+
+
 class ProjectScanner:
     """Scans projects for AGET compatibility and migration status"""
 
-    def __init__(self, root_path = None):
-        self.root = Path(root_path) if root_path else Path.cwd()
+    def __init__(self, root_path = None, roots: Optional[List] = None,
+                 max_workers: Optional[int] = None):
+        if roots:
+            self.roots = [Path(r) for r in roots]
+        else:
+            self.roots = [Path(root_path) if root_path else Path.cwd()]
+        self.root = self.roots[0]
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
         self.projects = {}
         self.summary = {
             'total_projects': 0,
@@ -58,6 +122,7 @@ class ProjectScanner:
         self.results = {
             'scan_date': datetime.now().isoformat(),
             'root_path': str(self.root),
+            'roots': [str(r) for r in self.roots],
             'projects': {},
             'summary': {
                 'total': 0,
@@ -71,74 +136,59 @@ class ProjectScanner:
             }
         }
 
-    def is_git_repo(self, path: Path) -> bool:
+    def _listing(self, path: Path, listing: Optional[_DirListing]) -> _DirListing:
+        return listing if listing is not None else _DirListing(path)
+
+    def is_git_repo(self, path: Path, listing: Optional[_DirListing] = None) -> bool:
         """Check if directory is a git repository"""
-        return (path / '.git').exists()
+        return self._listing(path, listing).exists('.git')
 
-    def check_file_exists(self, path: Path, filename: str) -> bool:
+    def check_file_exists(self, path: Path, filename: str,
+                          listing: Optional[_DirListing] = None) -> bool:
         """Check if a file exists in the given path"""
-        return (path / filename).exists()
+        return self._listing(path, listing).exists(filename)
 
-    def read_aget_version(self, path: Path) -> Optional[Dict]:
+    def read_aget_version(self, path: Path, listing: Optional[_DirListing] = None) -> Optional[Dict]:
         """Read AGET version info if present"""
-        version_file = path / '.aget' / 'version.json'
-        if version_file.exists():
-            try:
-                with open(version_file) as f:
-                    return json.load(f)
-            except:
-                return None
-        return None
+        if not self._listing(path, listing).exists('.aget/version.json'):
+            return None
+        try:
+            with open(path / '.aget' / 'version.json') as f:
+                return json.load(f)
+        except:
+            return None
 
-    def check_agents_md_header(self, path: Path) -> Optional[str]:
+    def check_agents_md_header(self, path: Path,
+                               listing: Optional[_DirListing] = None) -> Optional[str]:
         """Check AGENTS.md for @aget-version header"""
-        agents_file = path / 'AGENTS.md'
-        if agents_file.exists():
-            try:
-                with open(agents_file) as f:
-                    for line in f:
-                        if '@aget-version:' in line:
-                            return line.strip()
-                        if line.startswith('##'):  # Stop at first section
-                            break
-            except:
-                pass
+        if not self._listing(path, listing).exists('AGENTS.md'):
+            return None
+        try:
+            with open(path / 'AGENTS.md') as f:
+                for line in f:
+                    if '@aget-version:' in line:
+                        return line.strip()
+                    if line.startswith('##'):  # Stop at first section
+                        break
+        except:
+            pass
         return None
 
-    def extract_version_from_agents_md(self, path: Path) -> Optional[str]:
+    @staticmethod
+    def _header_version(header: Optional[str]) -> Optional[str]:
+        """Version from a header line like "# @aget-version: 2.1.0-beta" """
+        return header.split('@aget-version:')[1].strip() if header else None
+
+    def extract_version_from_agents_md(self, path: Path,
+                                       listing: Optional[_DirListing] = None) -> Optional[str]:
         """Extract version number from AGENTS.md header"""
-        agents_file = path / 'AGENTS.md'
-        if agents_file.exists():
-            try:
-                with open(agents_file) as f:
-                    for line in f:
-                        if '@aget-version:' in line:
-                            # Extract version from line like "# @aget-version: 2.1.0-beta"
-                            version = line.split('@aget-version:')[1].strip()
-                            return version
-                        if line.startswith('##'):  # Stop at first section
-                            break
-            except:
-                pass
-        return None
+        return self._header_version(self.check_agents_md_header(path, listing))
 
-    def detect_compatibility_files(self, path: Path) -> List[str]:
+    def detect_compatibility_files(self, path: Path,
+                                   listing: Optional[_DirListing] = None) -> List[str]:
         """Detect compatibility files for other agents"""
-        compatibility_files = []
-        known_files = [
-            '.cursorrules',
-            '.aider.conf.yml',
-            '.aider.conf.yaml',
-            '.claude.md',
-            'cursor.toml',
-            'aider.toml'
-        ]
-
-        for filename in known_files:
-            if (path / filename).exists():
-                compatibility_files.append(filename)
-
-        return compatibility_files
+        listing = self._listing(path, listing)
+        return [name for name in COMPATIBILITY_FILES if listing.exists(name)]
 
     def calculate_migration_score(self, analysis: Dict) -> int:
         """Calculate migration score based on project analysis"""
@@ -171,65 +221,65 @@ class ProjectScanner:
 
         return min(100, score)
 
-    def detect_pattern_categories(self, path: Path) -> List[str]:
+    def detect_pattern_categories(self, path: Path,
+                                  listing: Optional[_DirListing] = None) -> List[str]:
         """Detect pattern categories in patterns directory"""
-        patterns_dir = path / 'patterns'
-        if not patterns_dir.exists():
-            return []
-
-        categories = []
-        for item in patterns_dir.iterdir():
-            if item.is_dir():
-                categories.append(item.name)
-        return categories
+        entries = self._listing(path, listing).entries('patterns') or {}
+        return [name for name, kind in entries.items() if kind == 'dir']
 
     def analyze_project(self, project_path: Path) -> Dict:
-        """Analyze a single project for AGET status"""
+        """Analyze a single project for AGET status
+
+        Existence checks come from one os.scandir() listing per directory
+        (project root, scripts/, patterns/, .aget/) and AGENTS.md and
+        .aget/version.json are each read at most once.
+        """
         project_name = project_path.name if project_path.name != '.' else project_path.parent.name
 
-        # Skip non-directories and hidden directories (except current directory)
-        if not project_path.is_dir() or (project_name.startswith('.') and project_name != '.'):
+        # Skip hidden directories (except current directory)
+        if project_name.startswith('.') and project_name != '.':
+            return None
+        listing = _DirListing(project_path)
+        if listing.entries() is None:  # not a directory
             return None
 
         # Basic file checks
-        has_claude_md = self.check_file_exists(project_path, 'CLAUDE.md')
-        has_agents_md = self.check_file_exists(project_path, 'AGENTS.md')
-        has_patterns_dir = self.check_file_exists(project_path, 'patterns')
-        has_scripts_dir = self.check_file_exists(project_path, 'scripts')
-        has_aget_dir = self.check_file_exists(project_path, '.aget')
+        has_claude_md = self.check_file_exists(project_path, 'CLAUDE.md', listing)
+        has_agents_md = self.check_file_exists(project_path, 'AGENTS.md', listing)
+        has_patterns_dir = self.check_file_exists(project_path, 'patterns', listing)
+        has_scripts_dir = self.check_file_exists(project_path, 'scripts', listing)
+        has_aget_dir = self.check_file_exists(project_path, '.aget', listing)
 
         # Session protocol checks
         has_session_protocols = (
-            self.check_file_exists(project_path, 'scripts/aget_session_protocol.py') or
-            self.check_file_exists(project_path, 'scripts/session_protocol.py')
+            self.check_file_exists(project_path, 'scripts/aget_session_protocol.py', listing) or
+            self.check_file_exists(project_path, 'scripts/session_protocol.py', listing)
         )
-        has_housekeeping_protocols = self.check_file_exists(project_path, 'scripts/health_check.py')
-
-        # Get pattern categories
-        pattern_categories = self.detect_pattern_categories(project_path)
+        has_housekeeping_protocols = self.check_file_exists(project_path, 'scripts/health_check.py', listing)
 
-        # Get compatibility files
-        compatibility_files = self.detect_compatibility_files(project_path)
+        pattern_categories = self.detect_pattern_categories(project_path, listing)
+        compatibility_files = self.detect_compatibility_files(project_path, listing)
 
         # Get AGET version info
-        aget_info = self.read_aget_version(project_path)
+        aget_info = self.read_aget_version(project_path, listing)
         aget_version = None
         migration_date = None
         if aget_info:
             aget_version = aget_info.get('aget_version') or aget_info.get('version')
             migration_date = aget_info.get('migration_date')
 
-        # Try to extract version from AGENTS.md if not in .aget/version.json
-        if not aget_version and has_agents_md:
-            aget_version = self.extract_version_from_agents_md(project_path)
+        # One read of AGENTS.md serves both the header and the version fallback
+        header = self.check_agents_md_header(project_path, listing)
+        if not aget_version:
+            aget_version = self._header_version(header)
 
         analysis = {
             'name': project_name,
             'path': str(project_path),
-            'is_git_repo': self.is_git_repo(project_path),
+            'is_git_repo': self.is_git_repo(project_path, listing),
             'has_claude_md': has_claude_md,
             'has_agents_md': has_agents_md,
-            'has_makefile': self.check_file_exists(project_path, 'Makefile'),
+            'has_makefile': self.check_file_exists(project_path, 'Makefile', listing),
             'has_patterns_dir': has_patterns_dir,
             'has_scripts_dir': has_scripts_dir,
             'has_aget_dir': has_aget_dir,
@@ -242,7 +292,7 @@ class ProjectScanner:
             'legacy_files': [],
             'patterns_adopted': [],
             'patterns_missing': [],
-            'agents_md_header': self.check_agents_md_header(project_path)
+            'agents_md_header': header
         }
 
         # Determine legacy files
@@ -303,24 +353,35 @@ class ProjectScanner:
         """Alias for analyze_project to maintain backwards compatibility"""
         return self.analyze_project(project_path)
 
-    def scan_all_projects(self) -> Dict:
-        """Scan all subdirectories for projects"""
-        # Check if the root directory itself is a project
-        root_analysis = self.analyze_project(self.root)
-        if root_analysis and root_analysis['is_git_repo']:
-            self.projects['.'] = root_analysis
-            self.update_new_summary(root_analysis)
-
-        # Scan subdirectories
-        for item in self.root.iterdir():
-            # Skip certain directories
-            if item.name in ['scripts', 'patterns', 'SESSION_NOTES', '.git', '__pycache__',
-                            'scripts.backup', '.aget', 'node_modules', '.venv', 'venv']:
+    def _candidates(self) -> List[Tuple[str, Path]]:
+        """(project key, path) for each root and its subdirectories, in listing order
+
+        With one root, keys are '.' for the root and the subdirectory name
+        otherwise; with several roots, keys are full paths so they cannot collide.
+        """
+        multi = len(self.roots) > 1
+        candidates = []
+        for root in self.roots:
+            candidates.append((str(root) if multi else '.', root))
+            try:
+                with os.scandir(root) as it:
+                    subdirs = [entry.name for entry in it
+                               if entry.name not in SKIP_DIRS and entry.is_dir()]
+            except OSError:
                 continue
+            for name in subdirs:
+                candidates.append((str(root / name) if multi else name, root / name))
+        return candidates
+
+    def scan_all_projects(self) -> Dict:
+        """Scan every root and its subdirectories for projects, concurrently"""
+        candidates = self._candidates()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            analyses = list(pool.map(lambda c: self.analyze_project(c[1]), candidates))
 
-            analysis = self.analyze_project(item)
+        for (key, _), analysis in zip(candidates, analyses):
             if analysis and analysis['is_git_repo']:
-                self.projects[item.name] = analysis
+                self.projects[key] = analysis
                 self.update_new_summary(analysis)
 
         return self.results
@@ -517,15 +578,20 @@ Exit Codes:
                         help="Don't save report to .aget/project_scan.json")
     parser.add_argument('--exit-zero', action='store_true',
                         help='Always exit with 0 (for CI/CD compatibility)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Projects analyzed concurrently (default: min(32, 4 x CPUs))')
+    parser.add_argument('roots', nargs='*', metavar='ROOT',
+                        help='Directories to survey (default: current directory)')
 
     args = parser.parse_args()
 
     try:
-        scanner = ProjectScanner()
+        scanner = ProjectScanner(roots=args.roots or None, max_workers=args.jobs)
 
         # Set verbosity level
         if args.verbose:
-            print(f"[DEBUG] Scanning root directory: {scanner.root}", file=sys.stderr)
+            for root in scanner.roots:
+                print(f"[DEBUG] Scanning root directory: {root}", file=sys.stderr)
 
         results = scanner.scan_all_projects()
 
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Agent Service - Optional Warm Process for Repeated Session Scripts
+
+Session scripts (wake_up, health_check, study_topic, close_gate_check) fire
+dozens of times per session, and each run pays interpreter start-up,
+imports and cold file reads. With AGET_SERVICE=1 those scripts become thin
+clients: they send argv, cwd and environment over a Unix socket to a
+long-lived service that runs the same main() in its warm interpreter and
+returns the exact stdout/stderr bytes and exit code.
+
+Opt-in and fail-soft (ADR-004):
+  - AGET_SERVICE unset: scripts run in-process as before (no socket I/O)
+  - No service listening: the client starts one in the background and runs
+    in-process this time; later invocations are served warm
+  - Service unreachable or mid-upgrade: in-process execution
+
+Semantics stay identical to a direct run: each request executes a fresh
+copy of the script module (per-run globals are new), under the client's
+cwd, environment and sys.argv, with stdin empty. What stays warm is the
+interpreter, imported modules (yaml, study_index, ...), the re module's
+compiled-pattern cache and the OS page cache; parsed agent state persists
+through the scripts' own .aget/cache files. A sibling module that changes
+on disk is re-imported; a changed agent_service.py retires the service.
+
+One service per scripts directory; it exits after AGET_SERVICE_IDLE seconds
+(default 300) without a request. Socket: $XDG_RUNTIME_DIR (else $TMPDIR or
+/tmp)/aget-service-<uid>/<hash of scripts dir>.sock, in a 0700 directory.
+
+Trust boundary: both ends refuse a socket directory that is not a real
+directory owned by the current user with mode 0700 (a pre-created
+/tmp/aget-service-<uid> from another account is never used), and, where
+the platform reports peer credentials (SO_PEERCRED), each side checks the
+other runs as the same uid. Only SERVICE_ENV_KEYS / SERVICE_ENV_PREFIXES
+of the client environment are sent, never the whole environment.
+
+Usage:
+    AGET_SERVICE=1 python3 scripts/health_check.py --json  # thin client
+    python3 scripts/agent_service.py serve [--idle SECONDS]
+    python3 scripts/agent_service.py status
+    python3 scripts/agent_service.py stop
+
+Exit codes (serve/status/stop):
+    0: Success
+    1: No service running (status/stop), or untrusted socket directory (serve)
+
+Author: aget-framework (canonical template)
+Version: 1.0.0 (v3.27.0)
+"""
+
+import os
+import sys
+
+# json/socket/hashlib are imported where used: with AGET_SERVICE unset the
+# thin client must cost the scripts nothing beyond this module's own load.
+
+SERVICE_ENV = 'AGET_SERVICE'
+IDLE_ENV = 'AGET_SERVICE_IDLE'
+DEFAULT_IDLE_SECONDS = 300
+CONNECT_TIMEOUT = 0.5
+REQUEST_TIMEOUT = 2.0  # service side: seconds a client has to send its request line
+# Client side: seconds to wait for a served run before running in-process
+# instead (wake_up's own probe deadline is 15s; study_topic may reindex).
+RUN_TIMEOUTS = {'wake_up': 30, 'health_check': 60, 'study_topic': 120, 'close_gate_check': 30}
+
+# Scripts the service may run, and argv flags that must stay in-process
+# (--stream flushes incrementally and the service replies once at the end;
+# --jobs worker processes must import the script by name).
+SERVICE_SCRIPTS = ('wake_up', 'health_check', 'study_topic', 'close_gate_check')
+LOCAL_ONLY_FLAGS = {'study_topic': ('--stream', '--jobs')}
+
+# Client environment forwarded to a served run: what the scripts and the
+# git / python subprocesses they spawn read. Everything else (tokens,
+# credentials, unrelated tooling) stays in the client.
+SERVICE_ENV_KEYS = ('HOME', 'PATH', 'USER', 'LOGNAME', 'SHELL', 'TERM', 'TZ', 'LANG',
+                    'LANGUAGE', 'NO_COLOR', 'COLUMNS', 'TMPDIR', 'XDG_RUNTIME_DIR',
+                    'XDG_CONFIG_HOME', 'XDG_CACHE_HOME', 'PYTHONPATH', 'PYTHONIOENCODING',
+                    'PYTHONUTF8')
+SERVICE_ENV_PREFIXES = ('LC_', 'AGET_', 'GIT_')
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# =============================================================================
+# Wire Protocol
+# =============================================================================
+# Request: one JSON line. Reply: one JSON header line, then exactly
+# header['stdout'] + header['stderr'] bytes of captured output.
+
+def socket_path(scripts_dir: str = _SCRIPTS_DIR) -> str:
+    """Per-user, per-scripts-directory socket path."""
+    import hashlib
+    base = os.environ.get('XDG_RUNTIME_DIR') or os.environ.get('TMPDIR') or '/tmp'
+    digest = hashlib.sha1(os.path.realpath(scripts_dir).encode()).hexdigest()[:16]
+    return os.path.join(base, f'aget-service-{os.getuid()}', f'{digest}.sock')
+
+
+def _secure_dir(path: str, create: bool = False) -> None:
+    """Require path to be a real directory owned by this user with mode 0700.
+
+    Raises:
+        OSError: Missing (and not created), a symlink, foreign-owned, or
+            accessible to group/other
+    """
+    import stat
+    if create:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f'{path} is not a directory')
+    if st.st_uid != os.getuid():
+        raise PermissionError(f'{path} is owned by uid {st.st_uid}, not {os.getuid()}')
+    if stat.S_IMODE(st.st_mode) != 0o700:
+        raise PermissionError(f'{path} has mode {stat.S_IMODE(st.st_mode):o}, expected 700')
+
+
+def _peer_uid(conn):
+    """uid of the process at the other end of a Unix socket, or None if unknown."""
+    import socket
+    import struct
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None  # e.g. macOS: the 0700 directory is the boundary
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', creds)[1]
+
+
+def _check_peer(conn) -> None:
+    """Raise PermissionError unless the peer runs as this user (when knowable)."""
+    uid = _peer_uid(conn)
+    if uid is not None and uid != os.getuid():
+        raise PermissionError(f'agent service peer runs as uid {uid}, not {os.getuid()}')
+
+
+def service_env(environ=None) -> dict:
+    """The subset of environ forwarded to a served run."""
+    environ = os.environ if environ is None else environ
+    return {k: v for k, v in environ.items()
+            if k in SERVICE_ENV_KEYS or k.startswith(SERVICE_ENV_PREFIXES)}
+
+
+def _recv_line(conn, buffer: bytearray) -> bytes:
+    while b'\n' not in buffer:
+        chunk = conn.recv(65536)
+        if not chunk:
+            raise ConnectionError('connection closed mid-message')
+        buffer.extend(chunk)
+    line, _, rest = bytes(buffer).partition(b'\n')
+    buffer[:] = rest
+    return line
+
+
+def _recv_exact(conn, buffer: bytearray, n: int) -> bytes:
+    while len(buffer) < n:
+        chunk = conn.recv(max(65536, n - len(buffer)))
+        if not chunk:
+            raise ConnectionError('connection closed mid-message')
+        buffer.extend(chunk)
+    data = bytes(buffer[:n])
+    del buffer[:n]
+    return data
+
+
+def _request(message: dict, timeout=None) -> tuple:
+    """Send one request; returns (header dict, stdout bytes, stderr bytes).
+
+    Raises:
+        OSError: No service listening, an untrusted socket directory or
+            peer, or the exchange failed
+    """
+    import json
+    import socket
+    path = socket_path()
+    _secure_dir(os.path.dirname(path))
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(CONNECT_TIMEOUT)
+        conn.connect(path)
+        _check_peer(conn)
+        conn.settimeout(timeout)
+        conn.sendall(json.dumps(message).encode() + b'\n')
+        buffer = bytearray()
+        header = json.loads(_recv_line(conn, buffer))
+        out = _recv_exact(conn, buffer, header.get('stdout', 0))
+        err = _recv_exact(conn, buffer, header.get('stderr', 0))
+        return header, out, err
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+def service_enabled() -> bool:
+    if os.environ.get(SERVICE_ENV, '').lower() not in ('1', 'on', 'true', 'yes'):
+        return False
+    import socket
+    return hasattr(socket, 'AF_UNIX')
+
+
+def start_service(scripts_dir: str = _SCRIPTS_DIR) -> None:
+    """Launch `agent_service.py serve` detached from this process (fail-soft)."""
+    import subprocess
+    try:
+        subprocess.Popen([sys.executable, os.path.join(scripts_dir, 'agent_service.py'),
+                          'serve'],
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True, close_fds=True)
+    except OSError:
+        pass
+
+
+def run_via_service(script_file: str, argv=None):
+    """Thin-client entry point: run a script in the warm service.
+
+    Called at the top of a script, before its own imports, so a served run
+    costs only interpreter start-up plus one socket round trip.
+
+    Args:
+        script_file: The calling script's __file__
+        argv: Arguments (default sys.argv[1:])
+
+    Returns:
+        Exit code when served; None when the caller should run in-process
+        (service disabled, not running, retiring, busy past RUN_TIMEOUTS,
+        or flags that must stay local). A missing service is started in the
+        background for next time.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    script = os.path.splitext(os.path.basename(script_file))[0]
+    if (not service_enabled() or script not in SERVICE_SCRIPTS
+            or any(arg == flag or arg.startswith(flag + '=') for arg in argv
+                   for flag in LOCAL_ONLY_FLAGS.get(script, ()))
+            or os.path.dirname(os.path.abspath(script_file)) != _SCRIPTS_DIR):
+        return None
+    import socket
+    try:
+        header, out, err = _request({
+            'op': 'run', 'script': script, 'argv': argv, 'cwd': os.getcwd(),
+            'env': service_env(), 'encoding': sys.stdout.encoding or 'utf-8',
+        }, timeout=RUN_TIMEOUTS[script])
+    except socket.timeout:
+        return None  # service stalled or the run hung: it is alive, do not start another
+    except (OSError, ValueError):
+        start_service()
+        return None
+    if header.get('status') != 'ok':
+        return None  # retiring (upgrade) or refused: run locally
+    sys.stdout.flush()
+    sys.stdout.buffer.write(out)
+    sys.stdout.buffer.flush()
+    sys.stderr.flush()
+    sys.stderr.buffer.write(err)
+    sys.stderr.buffer.flush()
+    return header.get('exit', 0)
+
+
+# =============================================================================
+# Service
+# =============================================================================
+
+def _exit_code(code) -> tuple:
+    """sys.exit() semantics: (exit code, message for stderr or None)."""
+    if code is None:
+        return 0, None
+    if isinstance(code, int):
+        return code, None
+    return 1, str(code)
+
+
+def _run_script(scripts_dir: str, request: dict) -> tuple:
+    """Execute one script run in this process; returns (exit, stdout, stderr)."""
+    import importlib.util
+    import io
+    import traceback
+
+    path = os.path.join(scripts_dir, request['script'] + '.py')
+    encoding = request.get('encoding') or 'utf-8'
+    out = io.TextIOWrapper(io.BytesIO(), encoding=encoding, errors='backslashreplace',
+                           write_through=True)
+    err = io.TextIOWrapper(io.BytesIO(), encoding=encoding, errors='backslashreplace',
+                           write_through=True)
+    saved = (os.getcwd(), dict(os.environ), sys.argv, sys.stdin, sys.stdout, sys.stderr)
+    try:
+        os.chdir(request['cwd'])
+        os.environ.clear()
+        os.environ.update(request.get('env') or {})
+        sys.argv = [path] + list(request.get('argv') or [])
+        sys.stdin, sys.stdout, sys.stderr = io.StringIO(''), out, err
+        try:
+            spec = importlib.util.spec_from_file_location(
+                f"_aget_service_{request['script']}", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            code, message = _exit_code(module.main())
+        except SystemExit as e:
+            code, message = _exit_code(e.code)
+        except BaseException:
+            traceback.print_exc()
+            code, message = 1, None
+        if message is not None:
+            print(message, file=sys.stderr)
+    finally:
+        cwd, env, sys.argv, sys.stdin, sys.stdout, sys.stderr = saved
+        os.environ.clear()
+        os.environ.update(env)
+        try:
+            os.chdir(cwd)
+        except OSError:
+            pass
+    return code, out.buffer.getvalue(), err.buffer.getvalue()
+
+
+def _module_mtimes(scripts_dir: str) -> dict:
+    """{module name: mtime_ns} for imported modules loaded from scripts_dir."""
+    mtimes = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if os.path.dirname(os.path.abspath(path)) == scripts_dir:
+            try:
+                mtimes[name] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[name] = None
+    return mtimes
+
+
+def _bind(path: str):
+    """Listening socket at path, or None when a live service already owns it.
+
+    Raises:
+        OSError: The socket directory is not ours alone (see _secure_dir)
+    """
+    import socket
+    _secure_dir(os.path.dirname(path), create=True)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(CONNECT_TIMEOUT)
+        probe.connect(path)
+        return None  # already served
+    except OSError:
+        pass
+    finally:
+        probe.close()
+    try:
+        os.unlink(path)  # stale socket from a crashed service
+    except FileNotFoundError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(16)
+    return server
+
+
+def serve(scripts_dir: str = _SCRIPTS_DIR, idle: float = None) -> int:
+    """Accept requests serially until idle for `idle` seconds or stopped.
+
+    Requests are handled one at a time: a run swaps process-global state
+    (cwd, environment, sys.std*), so runs must not overlap.
+    """
+    import json
+    import socket
+    import time
+    if idle is None:
+        try:
+            idle = float(os.environ.get(IDLE_ENV, DEFAULT_IDLE_SECONDS))
+        except ValueError:
+            idle = DEFAULT_IDLE_SECONDS
+    path = socket_path(scripts_dir)
+    try:
+        server = _bind(path)
+    except OSError as e:
+        print(f'agent service: refusing to serve: {e}', file=sys.stderr)
+        return 1
+    if server is None:
+        return 0
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    self_stat = os.stat(os.path.abspath(__file__)).st_mtime_ns
+    started, served = time.time(), 0
+    loaded = _module_mtimes(scripts_dir)
+    server.settimeout(idle)
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                return 0
+            with conn:
+                # Bounded: a client that never sends (or never reads) cannot
+                # hold the serial loop and keep the idle exit from firing
+                conn.settimeout(REQUEST_TIMEOUT)
+                try:
+                    _check_peer(conn)
+                except OSError:
+                    continue  # another user's process: no reply
+                try:
+                    request = json.loads(_recv_line(conn, bytearray()))
+                except (OSError, ValueError):
+                    continue
+                op = request.get('op')
+                retiring = os.stat(os.path.abspath(__file__)).st_mtime_ns != self_stat
+                out = err = b''
+                if op == 'status':
+                    header = {'status': 'ok', 'pid': os.getpid(), 'served': served,
+                              'scripts_dir': scripts_dir, 'started': started, 'idle': idle}
+                elif op == 'stop' or retiring:
+                    header = {'status': 'stopping' if op == 'stop' else 'retiring'}
+                elif op == 'run' and request.get('script') in SERVICE_SCRIPTS:
+                    # Sibling modules edited since import are re-imported fresh
+                    current = _module_mtimes(scripts_dir)
+                    for name, mtime in current.items():
+                        if loaded.get(name, mtime) != mtime:
+                            sys.modules.pop(name, None)
+                    code, out, err = _run_script(scripts_dir, request)
+                    loaded = _module_mtimes(scripts_dir)
+                    served += 1
+                    header = {'status': 'ok', 'exit': code}
+                else:
+                    header = {'status': 'refused'}
+                header.update(stdout=len(out), stderr=len(err))
+                try:
+                    conn.sendall(json.dumps(header).encode() + b'\n' + out + err)
+                except OSError:
+                    pass
+                if header['status'] in ('stopping', 'retiring'):
+                    return 0
+    finally:
+        server.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def main(argv=None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(
+        description='Optional warm service for AGET session scripts')
+    parser.add_argument('command', choices=['serve', 'status', 'stop'])
+    parser.add_argument('--idle', type=float, default=None,
+                        help=f'Seconds without a request before exiting '
+                             f'(default ${IDLE_ENV} or {DEFAULT_IDLE_SECONDS})')
+    args = parser.parse_args(argv)
+    import json
+
+    if args.command == 'serve':
+        return serve(idle=args.idle)
+    try:
+        header, _, _ = _request({'op': args.command}, timeout=5)
+    except (OSError, ValueError):
+        print('No agent service running', file=sys.stderr)
+        return 1
+    print(json.dumps(header))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
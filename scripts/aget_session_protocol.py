@@ -110,6 +110,19 @@ def run_command(cmd, check=False):
         return None
 
 
+def git_probe_status():
+    """One-process git status for the cwd (scripts/git_probe.py), or None.
+
+    None when git_probe is not deployed alongside this script or the probe
+    fails; callers then fall back to run_command().
+    """
+    try:
+        import git_probe
+    except ImportError:
+        return None
+    return git_probe.status(Path.cwd())
+
+
 def organize_session_notes():
     """Organize SESSION_NOTES into dated subdirectories"""
     session_dir = Path('SESSION_NOTES')
@@ -315,17 +328,24 @@ def sign_off(force_push=False, status_only=False):
 
     # Phase 3: Status check mode
     if status_only:
-        git_status = run_command("git status --short")
-        unpushed = run_command("git log @{u}..HEAD --oneline 2>/dev/null")
+        probe = git_probe_status()
+        if probe is not None:
+            uncommitted, unpushed = len(probe['changes']), probe['ahead'] or 0
+        else:
+            git_status = run_command("git status --short")
+            ahead = run_command("git log @{u}..HEAD --oneline 2>/dev/null")
+            uncommitted = len(git_status.splitlines()) if git_status else 0
+            unpushed = len(ahead.splitlines()) if ahead else 0
         print(f"📊 Status:")
-        print(f"  • Uncommitted: {len(git_status.splitlines()) if git_status else 0} files")
-        print(f"  • Unpushed: {len(unpushed.splitlines()) if unpushed else 0} commits")
+        print(f"  • Uncommitted: {uncommitted} files")
+        print(f"  • Unpushed: {unpushed} commits")
         if config.get('default_branch'):
             print(f"  • Default branch: {config['default_branch']}")
         return
 
     # Quick commit
-    git_status = run_command("git status --short")
+    probe = git_probe_status()
+    git_status = probe['changes'] if probe is not None else run_command("git status --short")
 
     if git_status:
         run_command("git add -A")
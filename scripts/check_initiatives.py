@@ -148,7 +148,29 @@ def current_version():
 
 
 def last_commit_dt(path):
-    """ISO datetime of the last commit touching path, or None if untracked/error."""
+    """ISO datetime of the last commit touching path, or None if untracked/error.
+
+    Served from the HEAD-keyed commit-date index over planning/initiatives
+    (git_probe.commit_date_index, .aget/cache/commit_dates.json) rather than
+    one `git log -1` per manifest: a run costs the same few git calls
+    whatever the number of initiatives.
+    """
+    try:
+        import git_probe
+    except ImportError:
+        git_probe = None
+    if git_probe is not None:
+        try:
+            rel = Path(path).resolve().relative_to(REPO).as_posix()
+        except ValueError:
+            rel = None
+        if rel is not None:
+            stamp = git_probe.last_commit_date(REPO, rel, pathspec="planning/initiatives",
+                                              indexed=True)
+            try:
+                return datetime.fromisoformat(stamp) if stamp else None
+            except ValueError:
+                return None
     try:
         out = subprocess.run(
             ["git", "log", "-1", "--format=%aI", "--", str(path)],
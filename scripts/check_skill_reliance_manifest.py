@@ -123,18 +123,36 @@ def _result(findings, **extra) -> dict:
     }
 
 
+def report_lines(res: dict) -> list[str]:
+    """Human-readable report: a status line followed by one line per finding."""
+    status = "PASS" if res["ok"] else "FAIL"
+    unreach = f", {res['unreachable']} UNREACHABLE" if res.get('unreachable') else ""
+    lines = [f"Skill Reliance Manifest: {status} "
+             f"({res.get('declared', 0)} declared / {res.get('on_disk', 0)} on disk; "
+             f"{res['errors']} errors, {res['warnings']} warnings{unreach})"]
+    lines.extend(f"  [{f['level']}] {f['check']}: {f['msg']}" for f in res["findings"])
+    return lines
+
+
+def attest() -> tuple[bool, str]:
+    """In-process attestation for health_check.py and wake_up.py.
+
+    Same verdict a caller reads from running this script: ok mirrors exit
+    code 0, and the summary is the last line of the human report. Saves
+    callers an interpreter start per attestation; they keep the subprocess
+    as a fallback for validators that predate this function.
+    """
+    res = validate()
+    return res["ok"], report_lines(res)[-1]
+
+
 def main(argv: list[str]) -> int:
     res = validate()
     if "--json" in argv:
         print(json.dumps(res, indent=2))
     else:
-        status = "PASS" if res["ok"] else "FAIL"
-        unreach = f", {res['unreachable']} UNREACHABLE" if res.get('unreachable') else ""
-        print(f"Skill Reliance Manifest: {status} "
-              f"({res.get('declared', 0)} declared / {res.get('on_disk', 0)} on disk; "
-              f"{res['errors']} errors, {res['warnings']} warnings{unreach})")
-        for f in res["findings"]:
-            print(f"  [{f['level']}] {f['check']}: {f['msg']}")
+        for line in report_lines(res):
+            print(line)
     return 0 if res["ok"] else 1
 
 
@@ -21,9 +21,22 @@ Exit codes:
 
 Owning initiative: INIT-PRINCIPLED-EXECUTION (Healthy Friction).
 """
+import os
+import sys
+
+# Thin client (scripts/agent_service.py): with AGET_SERVICE=1 a warm service
+# runs this script, so hand off before paying for the imports below.
+if __name__ == '__main__' and os.environ.get('AGET_SERVICE'):
+    try:
+        from agent_service import run_via_service
+    except ImportError:
+        run_via_service = None
+    _served = run_via_service(__file__) if run_via_service else None
+    if _served is not None:
+        sys.exit(_served)
+
 import argparse
 import re
-import sys
 from pathlib import Path
 
 # Closure/Finalization checklist section headers whose unchecked items block COMPLETE.
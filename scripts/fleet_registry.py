@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Fleet Registry - Parsed FLEET_STATE.yaml Shared by Every Consumer
+
+fleet_scope.py and wake_up.compute_active_agents_from_fleet_state() both
+read the supervising seat's FLEET_STATE.yaml. On large registries PyYAML
+parsing dominates their run time, so the parsed document is compiled once
+into a sidecar under ~/.aget/cache/fleet_registry/ (one per registry path,
+shared by all consumers) together with the agent records fleet_scope walks
+the document for.
+
+The sidecar is reused while the registry's (size, mtime_ns) is unchanged;
+when only the mtime moved (touch, checkout) a content hash still matches
+and the parse is skipped. Cold parses use the libyaml CSafeLoader when
+PyYAML was built with it. Sidecars are pickles (YAML dates and other
+non-JSON scalars survive the round trip), so they are only read from or
+written to a cache directory that is a real directory owned by the user
+with mode 0700; any other cache directory is bypassed and the registry is
+parsed directly. Unreadable sidecars are ignored and rebuilt (ADR-004
+fail-soft).
+
+Usage (library):
+    import fleet_registry
+    data = fleet_registry.load_registry(path)        # parsed document
+    recs = fleet_registry.registry_records(path)     # [(name, location)]
+
+Usage (CLI):
+    python3 scripts/fleet_registry.py PATH           # cache status as JSON
+
+Author: aget-framework (canonical template)
+Version: 1.0.0 (v3.27.0)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_DIR = Path(os.path.expanduser('~/.aget/cache/fleet_registry'))
+CACHE_VERSION = 1
+
+# In-process memo: {realpath: (size, mtime_ns, entry)}
+_memo: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+class RegistryError(ValueError):
+    """FLEET_STATE.yaml could not be parsed (or PyYAML is unavailable)."""
+
+
+def safe_loader():
+    """yaml.CSafeLoader when PyYAML has libyaml, else yaml.SafeLoader."""
+    import yaml  # type: ignore[import-untyped]
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _records(data: Any) -> List[Tuple[Any, str]]:
+    """(name, location) for every mapping carrying `location` or `path`, document order."""
+    found = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if 'location' in node or 'path' in node:
+                found.append((node.get('name'), str(node.get('location') or node.get('path'))))
+            for v in node.values():
+                walk(v)
+        elif isinstance(node, list):
+            for v in node:
+                walk(v)
+
+    walk(data)
+    return found
+
+
+def _sidecar(registry: Path, cache_dir: Optional[Path]) -> Path:
+    digest = hashlib.sha1(os.path.realpath(registry).encode()).hexdigest()[:16]
+    return Path(cache_dir or CACHE_DIR) / f'{digest}.pickle'
+
+
+def _secure_dir(path: Path, create: bool = False) -> None:
+    """Require path to be a real directory owned by this user with mode 0700.
+
+    Unpickling runs code, so sidecars are never loaded from a directory
+    another user could write to (same rule as agent_service's socket dir).
+
+    Raises:
+        OSError: Missing (and not created), a symlink, foreign-owned, or
+            accessible to group/other
+    """
+    import stat
+    if create:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f'{path} is not a directory')
+    if st.st_uid != os.getuid():
+        raise PermissionError(f'{path} is owned by uid {st.st_uid}, not {os.getuid()}')
+    if stat.S_IMODE(st.st_mode) != 0o700:
+        raise PermissionError(f'{path} has mode {stat.S_IMODE(st.st_mode):o}, expected 700')
+
+
+def _read_sidecar(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        _secure_dir(path.parent)
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:  # insecure dir, missing, truncated, or incompatible Python
+        return None
+    if not isinstance(entry, dict) or entry.get('version') != CACHE_VERSION:
+        return None
+    return entry
+
+
+def _write_sidecar(path: Path, entry: Dict[str, Any]) -> bool:
+    """Atomically write the sidecar. Returns False on failure (fail-soft)."""
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        _secure_dir(path.parent, create=True)
+        with open(tmp, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        return True
+    except (OSError, pickle.PicklingError, TypeError, RecursionError):
+        return False
+
+
+def _entry(registry, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Cached {'data', 'records', ...} for registry; parses only on a content change."""
+    registry = Path(registry)
+    st = registry.stat()  # OSError propagates: no registry is the caller's call
+    key = os.path.realpath(registry)
+    memo = _memo.get(key)
+    if memo and memo[:2] == (st.st_size, st.st_mtime_ns):
+        return memo[2]
+
+    sidecar = _sidecar(registry, cache_dir)
+    entry = _read_sidecar(sidecar)
+    if entry and (entry['size'], entry['mtime_ns']) == (st.st_size, st.st_mtime_ns):
+        entry['source'] = 'cache'
+    else:
+        raw = registry.read_bytes()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if entry and entry.get('sha256') == sha256:
+            entry['source'] = 'cache'  # touched, not edited
+        else:
+            try:
+                import yaml  # type: ignore[import-untyped]
+            except ImportError:
+                raise RegistryError('PyYAML required (pip install pyyaml)') from None
+            try:
+                data = yaml.load(raw, Loader=safe_loader())
+            except yaml.YAMLError as e:
+                raise RegistryError(f'{registry}: {e}') from None
+            entry = {'version': CACHE_VERSION, 'data': data, 'records': _records(data),
+                     'sha256': sha256, 'source': 'parsed'}
+        entry.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+        _write_sidecar(sidecar, {k: v for k, v in entry.items() if k != 'source'})
+    _memo[key] = (st.st_size, st.st_mtime_ns, entry)
+    return entry
+
+
+def load_registry(registry, cache_dir: Optional[Path] = None) -> Any:
+    """Parsed FLEET_STATE.yaml document (shared; treat as read-only).
+
+    Args:
+        registry: Path to FLEET_STATE.yaml
+        cache_dir: Sidecar directory (default ~/.aget/cache/fleet_registry)
+
+    Returns:
+        The document, as yaml.safe_load would return it
+
+    Raises:
+        OSError: registry missing or unreadable
+        RegistryError: invalid YAML, or PyYAML needed and not installed
+    """
+    return _entry(registry, cache_dir)['data']
+
+
+def registry_records(registry, cache_dir: Optional[Path] = None) -> List[Tuple[Any, str]]:
+    """[(name or None, location)] for every record with a `location`/`path` key.
+
+    Same errors as load_registry().
+    """
+    return _entry(registry, cache_dir)['records']
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 1:
+        print('usage: fleet_registry.py PATH', file=sys.stderr)
+        return 2
+    try:
+        entry = _entry(argv[0])
+    except (OSError, RegistryError) as e:
+        print(json.dumps({'error': str(e)}))
+        return 1
+    print(json.dumps({'registry': argv[0], 'source': entry['source'],
+                      'sidecar': str(_sidecar(Path(argv[0]), None)),
+                      'records': len(entry['records'])}, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
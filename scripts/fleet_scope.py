@@ -21,16 +21,65 @@ Usage
     python3 scripts/fleet_scope.py --resolves scripts/health_check.py:SOP_permission_cleanup:sops/SOP_permission_cleanup.md
     python3 scripts/fleet_scope.py --diverge scripts/record_invocation.py
     python3 scripts/fleet_scope.py --has sops/SOP_permission_cleanup.md --json
+    python3 scripts/fleet_scope.py --queries fleet_questions.txt [--json]
+    python3 scripts/fleet_scope.py --diverge scripts/record_invocation.py --digest crc32
+    python3 scripts/fleet_scope.py --diverge-all --glob 'scripts/*.py' --since m.json --snapshot m.json
+
+Scanning
+--------
+Seats are probed concurrently (--jobs, I/O-sized thread pool) with a per-seat
+deadline (--timeout): a seat on a hung network home directory is reported as
+timed out instead of stalling the whole fleet. Each seat is visited once per
+run however many questions are asked; --queries FILE batches them, one per
+line (`has REL`, `lacks REL`, `diverge REL`, `diverge-all GLOB`,
+`resolves FILE:NEEDLE:REFERENT`; blank lines and `#` comments ignored).
+
+--diverge-all hashes every seat file matching --glob in the same sweep and
+reports a seat x artifact matrix: divergent artifacts, seats clustered by
+identical version vectors, and (--csv) the matrix as CSV. --snapshot FILE
+saves the matrix; --since FILE diffs the current one against a saved one,
+so drift can be tracked run over run (unchanged files are served from the
+hash cache, not re-hashed).
+
+--diverge digests are streamed in chunks and cached in ~/.aget/cache/
+keyed by (seat, relpath, size, mtime_ns, inode), so a repeat sweep over an
+unchanged fleet costs one stat per seat. --digest picks md5 (default),
+crc32 (stdlib zlib) or xxh64 (needs the xxhash package); the latter two are
+non-cryptographic and faster — fine for grouping versions, not for trust.
 
 Refs: gh#1813 (meta-invariant family), FLEET_STATE_SPEC v1.0 (supervising seat).
 """
 
 import argparse
+import csv
 import hashlib
 import json
 import os
 import pathlib
+import queue
 import sys
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+
+import fleet_registry
+
+# Per-seat deadline (seconds) and default worker count for the fleet scan.
+# Workers mostly wait on stat()/read() against home directories, so the pool
+# is sized for I/O, not CPU.
+SEAT_TIMEOUT_S = 10.0
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+QUERY_KINDS = ("has", "lacks", "diverge", "diverge-all", "resolves")
+DEFAULT_MATRIX_GLOB = "scripts/*.py"
+MATRIX_SNAPSHOT_VERSION = 1
+SHORT_DIGEST = 8
+
+DIGESTS = ("md5", "crc32", "xxh64")
+HASH_CHUNK_BYTES = 1 << 20
+HASH_CACHE = pathlib.Path(os.path.expanduser("~/.aget/cache/fleet_scope_hashes.json"))
+HASH_CACHE_VERSION = 1
+HASH_CACHE_MAX_ENTRIES = 50_000  # oldest entries beyond this are evicted on save
 
 def _find_registry() -> pathlib.Path:
     """Resolve FLEET_STATE.yaml: env override, else discover under ~/github.
@@ -51,11 +100,12 @@ REGISTRY = _find_registry()
 
 
 def load_agents(registry: pathlib.Path):
-    """Return [(name, path)] for every agent with a resolvable location in the registry."""
-    try:
-        import yaml
-    except ImportError:
-        sys.exit("fleet_scope: PyYAML required (pip install pyyaml)")
+    """Return [(name, path)] for every agent with a resolvable location in the registry.
+
+    The parsed registry and its location records come from the shared
+    fleet_registry sidecar cache, so an unchanged FLEET_STATE.yaml is not
+    re-parsed.
+    """
     if not registry.is_file():
         sys.exit(
             f"fleet_scope: registry not found at {registry}\n"
@@ -63,33 +113,467 @@ def load_agents(registry: pathlib.Path):
             "  Do NOT fall back to a path glob — that is the defect this exists to prevent.\n"
             "  Locate the registry and pass --registry, or fix the path here."
         )
-    data = yaml.safe_load(registry.read_text())
-
-    found = []
-
-    def walk(node):
-        if isinstance(node, dict):
-            if "location" in node or "path" in node:
-                found.append(node)
-            for v in node.values():
-                walk(v)
-        elif isinstance(node, list):
-            for v in node:
-                walk(v)
-
-    walk(data)
+    try:
+        records = fleet_registry.registry_records(registry)
+    except fleet_registry.RegistryError as e:
+        sys.exit(f"fleet_scope: {e}")
 
     agents = []
-    for rec in found:
-        loc = str(rec.get("location") or rec.get("path"))
-        p = pathlib.Path(os.path.expanduser(loc.replace("~", "~")))
+    for name, loc in records:
         p = pathlib.Path(os.path.expanduser(loc))
-        agents.append((rec.get("name") or p.name, p))
+        agents.append((name or p.name, p))
     return agents
 
 
+def file_digest(p: pathlib.Path, algo: str = "md5") -> str:
+    """Hex digest of a file, read in HASH_CHUNK_BYTES chunks."""
+    if algo == "crc32":
+        crc = 0
+        with open(p, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                crc = zlib.crc32(chunk, crc)
+        return f"{crc:08x}"
+    if algo == "xxh64":
+        import xxhash  # optional; main() checks availability before scanning
+        h = xxhash.xxh64()
+    else:
+        h = hashlib.md5()
+    with open(p, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def md5(p: pathlib.Path):
-    return hashlib.md5(p.read_bytes()).hexdigest()
+    return file_digest(p, "md5")
+
+
+class HashCache:
+    """Persistent content digests keyed by (seat, relpath) + (size, mtime_ns, inode).
+
+    Shared by the scan workers (lock-guarded). A digest is reused only while
+    the file's stat signature is unchanged; with path=None the cache lives
+    for the run only. Load and save fail soft: a missing, corrupt or
+    unwritable cache just means hashing again. save() evicts entries of
+    scanned seats the run did not ask for (deleted or renamed files) and
+    then the oldest entries beyond HASH_CACHE_MAX_ENTRIES (removed seats,
+    other fleets), so the file stays bounded.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        self.hits = self.misses = 0
+        self.touched = set()  # keys looked up this run
+        self._lock = threading.Lock()
+        if path is not None:
+            try:
+                data = json.loads(pathlib.Path(path).read_text())
+                if data.get("version") == HASH_CACHE_VERSION:
+                    self.entries = data.get("entries", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    def digest(self, seat: pathlib.Path, rel: str, st, algo: str = "md5") -> str:
+        """Digest of seat/rel whose stat is st, hashing only on a signature change."""
+        key = f"{seat}\0{rel}"
+        sig = [st.st_size, st.st_mtime_ns, st.st_ino]
+        with self._lock:
+            self.touched.add(key)
+            entry = self.entries.get(key)
+            if entry and entry.get("sig") == sig and algo in entry:
+                self.hits += 1
+                return entry[algo]
+        value = file_digest(seat / rel, algo)
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry or entry.get("sig") != sig:
+                self.entries.pop(key, None)  # re-inserted last: newest
+                entry = self.entries[key] = {"sig": sig}
+            entry[algo] = value
+            self.misses += 1
+            self.dirty = True
+        return value
+
+    def evict(self, scanned=(), max_entries: int = HASH_CACHE_MAX_ENTRIES) -> int:
+        """Drop untouched entries of the fully scanned seats, then the oldest
+        entries beyond max_entries, sparing this run's. Returns the number dropped."""
+        prefixes = tuple(f"{seat}\0" for seat in scanned)
+        with self._lock:
+            stale = [k for k in self.entries if k.startswith(prefixes) and k not in self.touched]
+            excess = len(self.entries) - len(stale) - max_entries
+            if excess > 0:  # untouched before touched, each oldest first (insertion order)
+                stale_set = set(stale)
+                rest = [k for k in self.entries if k not in stale_set]
+                stale += sorted(rest, key=lambda k: k in self.touched)[:excess]
+            for k in stale:
+                del self.entries[k]
+            if stale:
+                self.dirty = True
+        return len(stale)
+
+    def save(self, scanned=()) -> bool:
+        """Evict (see evict()) and atomically persist when anything changed.
+
+        Args:
+            scanned: Seat paths whose probe completed this run
+
+        Returns:
+            False on failure
+        """
+        if self.path is None:
+            return True
+        self.evict(scanned)
+        if not self.dirty:
+            return True
+        path = pathlib.Path(self.path)
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                tmp.write_text(json.dumps({"version": HASH_CACHE_VERSION, "entries": self.entries}))
+            os.replace(tmp, path)
+            self.dirty = False
+            return True
+        except (OSError, TypeError, ValueError):
+            return False
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+def parse_query(kind: str, arg: str) -> dict:
+    """One artifact question -> {'kind', 'arg', ...}. Raises ValueError if malformed."""
+    if kind not in QUERY_KINDS:
+        raise ValueError(f"unknown query kind {kind!r} (expected one of {', '.join(QUERY_KINDS)})")
+    if not arg:
+        raise ValueError(f"{kind} needs an argument")
+    query = {"kind": kind, "arg": arg}
+    if kind == "diverge-all" and (os.path.isabs(arg) or ".." in pathlib.PurePath(arg).parts):
+        raise ValueError(f"diverge-all glob must stay inside the seat: {arg}")
+    if kind == "diverge-all":
+        try:  # pathlib parses the pattern on first use; a file yields no matches
+            next(pathlib.Path(os.devnull).glob(arg), None)
+        except ValueError as e:
+            raise ValueError(f"invalid diverge-all glob {arg!r}: {e}") from None
+    if kind == "resolves":
+        try:
+            query["file"], query["needle"], query["referent"] = arg.split(":", 2)
+        except ValueError:
+            raise ValueError("resolves expects FILE:NEEDLE:REFERENT") from None
+    return query
+
+
+def load_queries(path: pathlib.Path) -> list:
+    """Parse a --queries file: `<kind> <arg>` per line, `#` comments ignored."""
+    queries = []
+    for lineno, line in enumerate(path.read_text().splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        kind, _, arg = line.partition(" ")
+        try:
+            queries.append(parse_query(kind.lstrip("-"), arg.strip()))
+        except ValueError as e:
+            raise ValueError(f"{path}:{lineno}: {e}") from None
+    return queries
+
+
+def probe_seat(path: pathlib.Path, queries: list, hashes: HashCache = None) -> dict:
+    """Answer every query for one seat, touching each file at most once.
+
+    Returns:
+        {'exists': bool, 'answers': [...]} with one answer per query:
+        has/lacks -> REL exists; diverge -> digest of REL (query 'digest',
+        default md5; via hashes when given) or None if not a file;
+        diverge-all -> {relpath: digest} for the files matching the glob;
+        resolves -> None (FILE does not emit NEEDLE), True (REFERENT resolves)
+        or False (dangling)
+    """
+    if not path.exists():
+        return {"exists": False, "answers": [None] * len(queries)}
+    stats, texts = {}, {}
+
+    def stat(rel):
+        if rel not in stats:
+            try:
+                stats[rel] = (path / rel).stat()
+            except OSError:
+                stats[rel] = None
+        return stats[rel]
+
+    def is_file(rel):
+        st = stat(rel)
+        return st is not None and (st.st_mode & 0o170000) == 0o100000
+
+    def digest(rel, algo):
+        try:
+            if not is_file(rel):
+                return None
+            if hashes is not None:
+                return hashes.digest(path, rel, stat(rel), algo)
+            return file_digest(path / rel, algo)
+        except OSError:
+            return None  # unreadable counts as not held
+
+    answers = []
+    for q in queries:
+        if q["kind"] in ("has", "lacks"):
+            answers.append(stat(q["arg"]) is not None)
+        elif q["kind"] == "diverge":
+            answers.append(digest(q["arg"], q.get("digest", "md5")))
+        elif q["kind"] == "diverge-all":
+            try:
+                rels = sorted(m.relative_to(path).as_posix() for m in path.glob(q["arg"]))
+            except OSError:
+                rels = []
+            row = {rel: digest(rel, q.get("digest", "md5")) for rel in rels}
+            answers.append({rel: d for rel, d in row.items() if d is not None})
+        else:
+            if q["file"] not in texts:
+                try:
+                    texts[q["file"]] = ((path / q["file"]).read_text(errors="ignore")
+                                        if is_file(q["file"]) else None)
+                except OSError:
+                    texts[q["file"]] = None
+            text = texts[q["file"]]
+            answers.append(stat(q["referent"]) is not None
+                           if text is not None and q["needle"] in text else None)
+    return {"exists": True, "answers": answers}
+
+
+# =============================================================================
+# Concurrent fleet scan
+# =============================================================================
+
+def scan_fleet(agents, queries, jobs: int = DEFAULT_JOBS,
+               timeout: float = SEAT_TIMEOUT_S, hashes: HashCache = None) -> list:
+    """Probe every seat concurrently; probe_seat() per agent, None if it timed out.
+
+    Workers are daemon threads: a seat stuck past its deadline (e.g. a hung
+    NFS stat) is abandoned and its worker replaced, so neither the remaining
+    seats nor interpreter exit wait on it. A probe that raises counts as an
+    unreadable seat ({'exists': False}).
+    """
+    results = [None] * len(agents)
+    if not agents:
+        return results
+    done = 0
+    todo = queue.Queue()
+    for i, (_, path) in enumerate(agents):
+        todo.put((i, path))
+    started = {}  # index -> start time, for seats in flight
+    lock = threading.Condition()
+
+    def worker():
+        nonlocal done
+        while True:
+            try:
+                i, path = todo.get_nowait()
+            except queue.Empty:
+                return
+            with lock:
+                started[i] = time.monotonic()
+                lock.notify()
+            try:
+                res = probe_seat(path, queries, hashes)
+            except (OSError, ValueError):
+                res = {"exists": False, "answers": [None] * len(queries)}
+            with lock:
+                if started.pop(i, None) is not None:  # None: already timed out
+                    results[i] = res
+                    done += 1
+                lock.notify()
+
+    def spawn():
+        threading.Thread(target=worker, daemon=True).start()
+
+    for _ in range(max(1, min(jobs, len(agents)))):
+        spawn()
+    with lock:
+        while done < len(agents):
+            now = time.monotonic()
+            for i, t0 in list(started.items()):
+                if now - t0 >= timeout:
+                    del started[i]
+                    done += 1  # results[i] stays None
+                    spawn()  # the stuck worker is abandoned, keep the pool full
+            if done >= len(agents):
+                break
+            deadline = min(started.values(), default=now) + timeout
+            lock.wait(timeout=max(0.01, min(deadline - now, timeout)))
+    return results
+
+
+def summarize(query: dict, seats) -> dict:
+    """Fleet answer to one query from [(name, answer)] over live seats."""
+    kind = query["kind"]
+    if kind in ("has", "lacks"):
+        hit = [n for n, a in seats if a]
+        miss = [n for n, a in seats if not a]
+        return {"artifact": query["arg"], "holding": len(hit), "lacking": len(miss),
+                "selected": hit if kind == "has" else miss}
+    if kind == "diverge":
+        groups = {}
+        for n, digest in seats:
+            if digest is not None:
+                groups.setdefault(digest, []).append(n)
+        return {"artifact": query["arg"], "holding": sum(len(v) for v in groups.values()),
+                "distinct_versions": len(groups),
+                "groups": [{query.get("digest", "md5"): k[:8], "seats": v} for k, v in groups.items()]}
+    if kind == "diverge-all":
+        return build_matrix(query, seats)
+    emits = [n for n, a in seats if a is not None]
+    dangling = [n for n, a in seats if a is False]
+    return {"control": query["file"], "needle": query["needle"], "referent": query["referent"],
+            "emitting": len(emits), "dangling": len(dangling), "dangling_seats": dangling}
+
+
+# =============================================================================
+# Divergence matrix (--diverge-all)
+# =============================================================================
+
+def build_matrix(query: dict, seats) -> dict:
+    """Seat x artifact matrix from [(name, {relpath: digest})] over live seats.
+
+    Returns:
+        {'glob', 'digest', 'artifacts': sorted relpaths,
+         'matrix': {seat: [short digest or None per artifact]},
+         'divergent': [{'artifact', 'distinct_versions', 'groups'}] for
+         artifacts held in more than one version,
+         'clusters': [{'seats', 'holding'}] seats with identical version
+         vectors, largest first,
+         '_full': {seat: {relpath: digest}} (for snapshots; not printed)}
+    """
+    algo = query.get("digest", "md5")
+    rows = {n: row or {} for n, row in seats}
+    artifacts = sorted({rel for row in rows.values() for rel in row})
+    divergent = []
+    for rel in artifacts:
+        groups = {}
+        for n, row in rows.items():
+            if rel in row:
+                groups.setdefault(row[rel], []).append(n)
+        if len(groups) > 1:
+            divergent.append({"artifact": rel, "distinct_versions": len(groups),
+                              "groups": [{algo: k[:SHORT_DIGEST], "seats": v}
+                                         for k, v in sorted(groups.items(), key=lambda x: -len(x[1]))]})
+    clusters = {}
+    for n, row in rows.items():
+        clusters.setdefault(tuple(row.get(rel) for rel in artifacts), []).append(n)
+    return {
+        "glob": query["arg"],
+        "digest": algo,
+        "artifacts": artifacts,
+        "matrix": {n: [row[rel][:SHORT_DIGEST] if rel in row else None for rel in artifacts]
+                   for n, row in rows.items()},
+        "divergent": divergent,
+        "clusters": [{"seats": v, "holding": sum(d is not None for d in k)}
+                     for k, v in sorted(clusters.items(), key=lambda x: -len(x[1]))],
+        "_full": rows,
+    }
+
+
+def matrix_csv(out: dict, stream) -> None:
+    """Write the matrix as CSV: one row per seat, one column per artifact."""
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(["seat"] + out["artifacts"])
+    for seat, cells in out["matrix"].items():
+        writer.writerow([seat] + [c or "" for c in cells])
+
+
+def save_matrix_snapshot(out: dict, path: pathlib.Path) -> bool:
+    """Atomically write the full-digest matrix. Returns False on failure."""
+    snapshot = {"version": MATRIX_SNAPSHOT_VERSION, "glob": out["glob"], "digest": out["digest"],
+                "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "seats": out["_full"]}
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(snapshot, indent=1, sort_keys=True))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        return False
+
+
+def load_matrix_snapshot(path: pathlib.Path) -> dict:
+    """Read a --snapshot file. Raises ValueError when unusable."""
+    try:
+        snapshot = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        raise ValueError(f"cannot read matrix snapshot {path}: {e}") from None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != MATRIX_SNAPSHOT_VERSION:
+        raise ValueError(f"{path} is not a v{MATRIX_SNAPSHOT_VERSION} matrix snapshot")
+    return snapshot
+
+
+def diff_matrix(snapshot: dict, out: dict) -> dict:
+    """Drift between a saved snapshot and the current matrix.
+
+    Returns:
+        {'since', 'seats_added', 'seats_removed',
+         'changes': [{'seat', 'artifact', 'was', 'now'}] with short digests,
+         None meaning absent} over seats present in both
+    """
+    if snapshot.get("digest") != out["digest"]:
+        raise ValueError(f"snapshot digest {snapshot.get('digest')} != --digest {out['digest']}")
+    old, new = snapshot.get("seats", {}), out["_full"]
+    short = lambda d: d[:SHORT_DIGEST] if d else None  # noqa: E731
+    changes = []
+    for seat in sorted(set(old) & set(new)):
+        for rel in sorted(set(old[seat]) | set(new[seat])):
+            was, now = old[seat].get(rel), new[seat].get(rel)
+            if was != now:
+                changes.append({"seat": seat, "artifact": rel, "was": short(was), "now": short(now)})
+    return {"since": snapshot.get("generated"), "seats_added": sorted(set(new) - set(old)),
+            "seats_removed": sorted(set(old) - set(new)), "changes": changes}
+
+
+def render_matrix(out: dict, live: int):
+    print(f"divergence matrix: {out['glob']}  ({len(out['artifacts'])} artifacts x {live} seats, {out['digest']})")
+    print(f"  {len(out['divergent'])} divergent artifact(s)")
+    for d in out["divergent"]:
+        groups = " | ".join(f"{g[out['digest']]} x{len(g['seats'])} ({', '.join(g['seats'])})"
+                            for g in d["groups"])
+        print(f"    {d['artifact']}  {d['distinct_versions']} versions: {groups}")
+    print(f"  {len(out['clusters'])} version cluster(s)")
+    for i, c in enumerate(out["clusters"], 1):
+        print(f"    #{i:<3} x{len(c['seats']):<3} holds {c['holding']:<3} {', '.join(c['seats'])}")
+    drift = out.get("drift")
+    if drift is not None:
+        print(f"  drift since {drift['since']}: {len(drift['changes'])} change(s), "
+              f"{len(drift['seats_added'])} seat(s) added, {len(drift['seats_removed'])} removed")
+        for c in drift["changes"]:
+            print(f"    {c['seat']:<24} {c['artifact']}  {c['was'] or '-'} -> {c['now'] or '-'}")
+
+
+def render(query: dict, out: dict, live: int):
+    """Print the human-readable answer for one query."""
+    kind = query["kind"]
+    if kind in ("has", "lacks"):
+        want_hit = kind == "has"
+        print(f"artifact: {out['artifact']}")
+        print(f"  holding: {out['holding']}/{live}   lacking: {out['lacking']}/{live}")
+        for n in out["selected"]:
+            print(f"    {'HAS ' if want_hit else 'LACKS'}  {n}")
+    elif kind == "diverge":
+        tot, groups = out["holding"], out["groups"]
+        print(f"artifact: {out['artifact']}")
+        print(f"  held by {tot}/{live} seats in {len(groups)} distinct version(s)")
+        if len(groups) > 1:
+            print(f"  ** DIVERGENT ** {len(groups)} versions across {tot} seats — shadow-channel signature")
+        for g in sorted(groups, key=lambda g: -len(g["seats"])):
+            label = g[query.get("digest", "md5")]
+            print(f"    {label}  x{len(g['seats']):<3} {', '.join(g['seats'])}")
+    elif kind == "diverge-all":
+        render_matrix(out, live)
+    else:
+        print(f"L211 invariant: {out['control']} emits '{out['needle']}' => {out['referent']} must resolve")
+        print(f"  emitting: {out['emitting']}/{live}   DANGLING: {out['dangling']}")
+        for n in out["dangling_seats"]:
+            print(f"    DANGLING  {n}")
 
 
 def main():
@@ -105,83 +589,101 @@ def main():
         metavar="FILE:NEEDLE:REFERENT",
         help="L211 invariant: seats where FILE contains NEEDLE but REFERENT is absent",
     )
+    g.add_argument("--diverge-all", action="store_true",
+                   help="seat x artifact hash matrix over every file matching --glob, in one sweep")
+    g.add_argument("--queries", metavar="FILE", type=pathlib.Path,
+                   help="answer every question in FILE (one `KIND ARG` per line) in one fleet pass")
+    ap.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help=f"seats probed concurrently (default {DEFAULT_JOBS})")
+    ap.add_argument("--timeout", type=float, default=SEAT_TIMEOUT_S,
+                    help=f"per-seat deadline in seconds (default {SEAT_TIMEOUT_S:g})")
+    ap.add_argument("--digest", choices=DIGESTS, default="md5", help="--diverge content digest (default md5)")
+    ap.add_argument("--hash-cache", type=pathlib.Path, default=HASH_CACHE,
+                    help=f"persistent --diverge digest cache (default {HASH_CACHE})")
+    ap.add_argument("--no-hash-cache", action="store_true", help="hash every file afresh, persist nothing")
+    ap.add_argument("--glob", default=DEFAULT_MATRIX_GLOB,
+                    help=f"--diverge-all artifact pattern, relative to each seat (default {DEFAULT_MATRIX_GLOB})")
+    ap.add_argument("--csv", action="store_true", help="--diverge-all: print the matrix as CSV")
+    ap.add_argument("--snapshot", metavar="FILE", type=pathlib.Path,
+                    help="--diverge-all: save the matrix to FILE (after any --since diff)")
+    ap.add_argument("--since", metavar="FILE", type=pathlib.Path,
+                    help="--diverge-all: report drift against a matrix saved with --snapshot")
     ap.add_argument("--json", action="store_true")
     a = ap.parse_args()
 
+    try:
+        if a.queries:
+            queries = load_queries(a.queries)
+        else:
+            queries = [parse_query(k, a.glob if k == "diverge-all" else getattr(a, k))
+                       for k in QUERY_KINDS if getattr(a, k.replace("-", "_"))]
+        snapshot = load_matrix_snapshot(a.since) if a.since and a.diverge_all else None
+    except (OSError, ValueError) as e:
+        sys.exit(f"fleet_scope: {e}" if a.queries or a.diverge_all else f"--{e}")
+    if a.digest == "xxh64":
+        try:
+            import xxhash  # noqa: F401
+        except ImportError:
+            sys.exit("fleet_scope: --digest xxh64 requires xxhash (pip install xxhash)")
+    for q in queries:
+        if q["kind"] in ("diverge", "diverge-all"):
+            q["digest"] = a.digest
+
     agents = load_agents(a.registry)
-    absent = [(n, p) for n, p in agents if not p.exists()]
-    live = [(n, p) for n, p in agents if p.exists()]
+    hashes = None
+    if any(q["kind"] in ("diverge", "diverge-all") for q in queries):
+        hashes = HashCache(None if a.no_hash_cache else a.hash_cache)
+    probes = scan_fleet(agents, queries, jobs=a.jobs, timeout=a.timeout, hashes=hashes)
+    if hashes is not None:
+        hashes.save([p for (_, p), r in zip(agents, probes) if r and r["exists"]])
+    timed_out = [n for (n, _), r in zip(agents, probes) if r is None]
+    absent = [(n, p) for (n, p), r in zip(agents, probes) if r and not r["exists"]]
+    live = [(n, p, r) for (n, p), r in zip(agents, probes) if r and r["exists"]]
     out = {"registry": str(a.registry), "agents": len(agents), "resolvable": len(live), "unresolvable": len(absent)}
+    if timed_out:
+        out["timed_out"] = timed_out
+        print(f"fleet_scope: {len(timed_out)} seat(s) timed out after {a.timeout:g}s: "
+              f"{', '.join(timed_out)}", file=sys.stderr)
 
     if a.list:
-        rows = [{"name": n, "path": str(p), "exists": p.exists()} for n, p in agents]
+        rows = [{"name": n, "path": str(p), "exists": r["exists"] if r else None}
+                for (n, p), r in zip(agents, probes)]
         out["seats"] = rows
         if not a.json:
             print(f"FLEET_STATE: {len(agents)} agents ({len(live)} resolvable, {len(absent)} not)")
             for r in rows:
-                print(f"  {'ok ' if r['exists'] else 'MISS'}  {r['name']:<36} {r['path']}")
-            return
-    elif a.has or a.lacks:
-        rel = a.has or a.lacks
-        hit = [n for n, p in live if (p / rel).exists()]
-        miss = [n for n, p in live if not (p / rel).exists()]
-        want_hit = bool(a.has)
-        sel = hit if want_hit else miss
-        out.update({"artifact": rel, "holding": len(hit), "lacking": len(miss), "selected": sel})
-        if not a.json:
-            print(f"artifact: {rel}")
-            print(f"  holding: {len(hit)}/{len(live)}   lacking: {len(miss)}/{len(live)}")
-            for n in sel:
-                print(f"    {'HAS ' if want_hit else 'LACKS'}  {n}")
-            return
-    elif a.diverge:
-        rel = a.diverge
-        groups = {}
-        for n, p in live:
-            f = p / rel
-            if f.is_file():
-                groups.setdefault(md5(f), []).append(n)
-        out.update({"artifact": rel, "holding": sum(len(v) for v in groups.values()), "distinct_versions": len(groups)})
-        out["groups"] = [{"md5": k[:8], "seats": v} for k, v in groups.items()]
-        if not a.json:
-            tot = sum(len(v) for v in groups.values())
-            print(f"artifact: {rel}")
-            print(f"  held by {tot}/{len(live)} seats in {len(groups)} distinct version(s)")
-            if len(groups) > 1:
-                print(f"  ** DIVERGENT ** {len(groups)} versions across {tot} seats — shadow-channel signature")
-            for k, v in sorted(groups.items(), key=lambda x: -len(x[1])):
-                print(f"    {k[:8]}  x{len(v):<3} {', '.join(v)}")
+                mark = "T/O " if r["exists"] is None else "ok " if r["exists"] else "MISS"
+                print(f"  {mark}  {r['name']:<36} {r['path']}")
             return
-    elif a.resolves:
-        try:
-            fname, needle, referent = a.resolves.split(":", 2)
-        except ValueError:
-            sys.exit("--resolves expects FILE:NEEDLE:REFERENT")
-        emits, dangling = [], []
-        for n, p in live:
-            f = p / fname
-            if f.is_file() and needle in f.read_text(errors="ignore"):
-                emits.append(n)
-                if not (p / referent).exists():
-                    dangling.append(n)
-        out.update(
-            {
-                "control": fname,
-                "needle": needle,
-                "referent": referent,
-                "emitting": len(emits),
-                "dangling": len(dangling),
-                "dangling_seats": dangling,
-            }
-        )
+    else:
+        answers = [summarize(q, [(n, r["answers"][i]) for n, _, r in live])
+                   for i, q in enumerate(queries)]
+        if a.diverge_all:
+            matrix = answers[0]
+            if snapshot is not None:
+                try:
+                    matrix["drift"] = diff_matrix(snapshot, matrix)
+                except ValueError as e:
+                    sys.exit(f"fleet_scope: {e}")
+            if a.snapshot and not save_matrix_snapshot(matrix, a.snapshot):
+                print(f"fleet_scope: could not write snapshot {a.snapshot}", file=sys.stderr)
+            if a.csv:
+                matrix_csv(matrix, sys.stdout)
+                return
+        for ans in answers:
+            ans.pop("_full", None)
         if not a.json:
-            print(f"L211 invariant: {fname} emits '{needle}' => {referent} must resolve")
-            print(f"  emitting: {len(emits)}/{len(live)}   DANGLING: {len(dangling)}")
-            for n in dangling:
-                print(f"    DANGLING  {n}")
+            for i, (q, ans) in enumerate(zip(queries, answers)):
+                if i:
+                    print()
+                render(q, ans, len(live))
             return
+        if a.queries:
+            out["queries"] = [{"query": f"{q['kind']} {q['arg']}", **ans} for q, ans in zip(queries, answers)]
+        else:
+            out.update(answers[0])
 
-    print(json.dumps(out, indent=2))
+    # The matrix is meant for machines and diffing: keep it on one line.
+    print(json.dumps(out, indent=None if a.diverge_all else 2))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Git Probe - Batched Git Queries for the Session Scripts
+
+One `git status --porcelain=v2 --branch` answers branch, upstream,
+ahead/behind and the change list, which wake_up, wind_down and
+aget_session_protocol used to assemble from separate rev-parse, status and
+`log @{u}..HEAD` processes. Per-file last-commit dates come from one
+`git log --name-only` pass instead of one `git log -1 -- <file>` per file,
+memoized for the life of the process and, via commit_date_index(), persisted
+under .aget/cache keyed by HEAD so later runs walk only new commits.
+
+Fail-soft (ADR-004): outside a work tree, without git, or on timeout the
+probes return None / {} and callers degrade as they did before.
+
+Usage (library):
+    import git_probe
+    git_probe.status(agent_path)            # {'branch', 'upstream', 'ahead', ...}
+    git_probe.last_commit_dates(repo, 'planning/initiatives')
+    git_probe.commit_date_index(repo, 'planning/initiatives')   # persisted
+
+Usage (CLI):
+    python3 scripts/git_probe.py [--dir PATH]   # status as JSON
+
+Author: aget-framework (canonical template)
+Version: 1.0.0 (v3.27.0)
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+
+def _git(repo_path, args: List[str], timeout: float) -> Optional[str]:
+    """stdout of `git <args>` in repo_path, or None on any failure."""
+    try:
+        result = subprocess.run(['git'] + args, capture_output=True, text=True,
+                                timeout=timeout, cwd=str(repo_path))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+# =============================================================================
+# Working-tree status (porcelain v2)
+# =============================================================================
+
+def _v1_path(path: str) -> str:
+    """v1 porcelain also quotes paths containing spaces; v2 quotes only specials."""
+    return f'"{path}"' if ' ' in path and not path.startswith('"') else path
+
+
+def _v1_line(line: str) -> Optional[str]:
+    """A porcelain-v2 entry as the equivalent `git status --porcelain` (v1) line."""
+    kind = line[:1]
+    if kind == '1':
+        fields = line.split(' ', 8)
+        return f"{fields[1].replace('.', ' ')} {_v1_path(fields[8])}"
+    if kind == '2':
+        fields = line.split(' ', 9)
+        path, orig = fields[9].split('\t', 1)
+        return f"{fields[1].replace('.', ' ')} {_v1_path(orig)} -> {_v1_path(path)}"
+    if kind == 'u':
+        fields = line.split(' ', 10)
+        return f"{fields[1]} {_v1_path(fields[10])}"
+    if kind == '?':
+        return f"?? {_v1_path(line[2:])}"
+    return None
+
+
+def parse_status_v2(output: str) -> Dict[str, Any]:
+    """Parse `git status --porcelain=v2 --branch` output.
+
+    Returns:
+        {'branch': name ('HEAD' when detached, as rev-parse reports it),
+         'oid': commit or None before the first commit,
+         'upstream': tracking ref or None,
+         'ahead' / 'behind': ints, or None without an upstream,
+         'changes': porcelain v1 lines ("XY path", "R  old -> new", "?? path")}
+    """
+    data: Dict[str, Any] = {'branch': 'unknown', 'oid': None, 'upstream': None,
+                            'ahead': None, 'behind': None, 'changes': []}
+    for line in output.splitlines():
+        if line.startswith('# branch.oid '):
+            oid = line[len('# branch.oid '):]
+            data['oid'] = None if oid == '(initial)' else oid
+        elif line.startswith('# branch.head '):
+            head = line[len('# branch.head '):]
+            data['branch'] = 'HEAD' if head == '(detached)' else head
+        elif line.startswith('# branch.upstream '):
+            data['upstream'] = line[len('# branch.upstream '):]
+        elif line.startswith('# branch.ab '):
+            ahead, behind = line[len('# branch.ab '):].split()
+            data['ahead'], data['behind'] = int(ahead), abs(int(behind))
+        elif line and not line.startswith('#'):
+            entry = _v1_line(line)
+            if entry is not None:
+                data['changes'].append(entry)
+    return data
+
+
+def status(repo_path, timeout: float = 5) -> Optional[Dict[str, Any]]:
+    """Branch, upstream, ahead/behind and changes from one git process.
+
+    Args:
+        repo_path: Any directory inside the work tree
+        timeout: Seconds before giving up
+
+    Returns:
+        parse_status_v2() dict, or None outside a work tree / on failure
+    """
+    output = _git(repo_path, ['status', '--porcelain=v2', '--branch'], timeout)
+    return None if output is None else parse_status_v2(output)
+
+
+# =============================================================================
+# Last-commit dates (one history walk)
+# =============================================================================
+
+_dates_cache: Dict[tuple, Dict[str, str]] = {}
+
+# Persistent index: {pathspec: {'head': oid, 'dates': {...}}}, rebuilt on a
+# version bump; lives with the other derived caches (gitignored).
+COMMIT_INDEX_RELPATH = os.path.join('.aget', 'cache', 'commit_dates.json')
+COMMIT_INDEX_VERSION = 1
+
+
+def _walk_dates(repo_path, pathspec: Optional[str], timeout: float,
+                revisions: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """{path: newest author date} over one `git log --name-only`, or None."""
+    args = ['-c', 'core.quotePath=false', 'log', '--format=%x00%aI', '--name-only',
+            '--relative']
+    if revisions:
+        args.append(revisions)
+    if pathspec:
+        args += ['--', pathspec]
+    output = _git(repo_path, args, timeout)
+    if output is None:
+        return None
+    dates: Dict[str, str] = {}
+    stamp = None
+    for line in output.splitlines():
+        if line.startswith('\x00'):
+            stamp = line[1:]
+        elif line and stamp is not None:
+            dates.setdefault(line, stamp)  # newest first: keep the first seen
+    return dates
+
+
+def last_commit_dates(repo_path, pathspec: Optional[str] = None,
+                      timeout: float = 30) -> Dict[str, str]:
+    """{path: ISO author date of the newest commit touching it} in one `git log`.
+
+    Paths are relative to repo_path (--relative), POSIX separators, limited
+    to pathspec when given. Memoized per (repo, pathspec) for the process.
+    Returns {} outside a work tree or on failure.
+    """
+    key = (os.path.realpath(str(repo_path)), pathspec)
+    if key in _dates_cache:
+        return _dates_cache[key]
+    dates = _walk_dates(repo_path, pathspec, timeout)
+    if dates is None:
+        return {}
+    _dates_cache[key] = dates
+    return dates
+
+
+def _load_index(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get('version') != COMMIT_INDEX_VERSION:
+        return {}
+    return index.get('indexes', {})
+
+
+def _save_index(path: str, indexes: Dict[str, Any]) -> bool:
+    """Atomically write the index. Returns False on failure (fail-soft)."""
+    tmp = path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': COMMIT_INDEX_VERSION, 'indexes': indexes}, f)
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+def commit_date_index(repo_path, pathspec: Optional[str] = None,
+                      index_path: Optional[str] = None,
+                      timeout: float = 30) -> Dict[str, str]:
+    """last_commit_dates(), persisted across runs and keyed by HEAD.
+
+    The index is stored at index_path (default .aget/cache/commit_dates.json
+    under repo_path). At the recorded HEAD it costs one `rev-parse`; when
+    HEAD has advanced only the new commits are walked (`old..HEAD`) and
+    merged over the recorded dates; after a rewrite (old HEAD no longer an
+    ancestor) the history is walked once more in full. The subprocess count
+    is therefore constant in the number of files.
+
+    Args:
+        repo_path: Work-tree directory the paths are relative to
+        pathspec: Limit to paths under this pathspec
+        index_path: Index file (default repo_path/.aget/cache/commit_dates.json)
+        timeout: Seconds per git call
+
+    Returns:
+        {path: ISO author date}, or {} outside a work tree / before the first commit
+    """
+    key = (os.path.realpath(str(repo_path)), pathspec)
+    if key in _dates_cache:
+        return _dates_cache[key]
+    head = (_git(repo_path, ['rev-parse', 'HEAD'], timeout) or '').strip()
+    if not head:
+        return {}
+    index_path = index_path or os.path.join(str(repo_path), COMMIT_INDEX_RELPATH)
+    indexes = _load_index(index_path)
+    entry = indexes.get(pathspec or '')
+    dates = None
+    if isinstance(entry, dict) and isinstance(entry.get('dates'), dict):
+        old = entry.get('head')
+        if old == head:
+            dates = entry['dates']
+        elif old and _git(repo_path, ['merge-base', '--is-ancestor', old, head],
+                          timeout) is not None:
+            newer = _walk_dates(repo_path, pathspec, timeout, f'{old}..{head}')
+            if newer is not None:
+                dates = {**entry['dates'], **newer}
+    if dates is None:
+        dates = _walk_dates(repo_path, pathspec, timeout)
+        if dates is None:
+            return {}
+    if not (isinstance(entry, dict) and entry.get('head') == head):
+        indexes[pathspec or ''] = {'head': head, 'dates': dates}
+        _save_index(index_path, indexes)
+    _dates_cache[key] = dates
+    return dates
+
+
+def last_commit_date(repo_path, rel_path: str, pathspec: Optional[str] = None,
+                     indexed: bool = False) -> Optional[str]:
+    """ISO date of the newest commit touching rel_path, or None if untracked.
+
+    With indexed, dates come from the persistent commit_date_index().
+    """
+    lookup = commit_date_index if indexed else last_commit_dates
+    return lookup(repo_path, pathspec).get(rel_path.replace(os.sep, '/'))
+
+
+def main(argv: List[str]) -> int:
+    repo = argv[argv.index('--dir') + 1] if '--dir' in argv else os.getcwd()
+    probe = status(repo)
+    if probe is None:
+        print(json.dumps({'error': 'not a git work tree'}))
+        return 1
+    print(json.dumps(probe, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
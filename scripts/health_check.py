@@ -15,6 +15,8 @@ Usage:
     python3 health_check.py --json --pretty    # Pretty-printed JSON
     python3 health_check.py --dir /path/agent  # Run on specific agent
     python3 health_check.py --fix              # Attempt auto-fixes
+    python3 health_check.py --slowest          # Also report the 5 slowest checks
+    python3 health_check.py --incremental      # Reuse results for unchanged inputs
 
 Exit codes:
     0: All checks passed
@@ -35,16 +37,29 @@ Author: aget-framework (canonical template)
 Version: 1.0.0 (v3.1.0)
 """
 
+import os
+import sys
+
+# Thin client (scripts/agent_service.py): with AGET_SERVICE=1 a warm service
+# runs this script, so hand off before paying for the imports below.
+if __name__ == '__main__' and os.environ.get('AGET_SERVICE'):
+    try:
+        from agent_service import run_via_service
+    except ImportError:
+        run_via_service = None
+    _served = run_via_service(__file__) if run_via_service else None
+    if _served is not None:
+        sys.exit(_served)
+
 import argparse
-import importlib.util
+import fnmatch
 import json
-import os
 import re
-import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 
 # =============================================================================
@@ -68,12 +83,14 @@ class CheckResult:
     """Result of a single check."""
 
     def __init__(self, name: str, passed: bool, message: str = "",
-                 severity: str = "info", fixable: bool = False):
+                 severity: str = "info", fixable: bool = False,
+                 duration_ms: Optional[float] = None):
         self.name = name
         self.passed = passed
         self.message = message
         self.severity = severity  # info, warning, error
         self.fixable = fixable
+        self.duration_ms = duration_ms  # set by run_housekeeping
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -82,16 +99,133 @@ class CheckResult:
             'message': self.message,
             'severity': self.severity,
             'fixable': self.fixable,
+            'duration_ms': self.duration_ms,
         }
 
 
+# =============================================================================
+# Filesystem Snapshot
+# =============================================================================
+
+SNAPSHOT_HEAD_BYTES = 8192
+
+
+class FsSnapshot:
+    """Lazily built, cached view of an agent tree for one housekeeping run.
+
+    Each directory is listed at most once (os.scandir, recording every
+    entry's kind, size and mtime), and file heads and contents are read at
+    most once, however many checks ask. Checks run on a thread pool: the
+    shared lock only guards the per-path lock table, and each fill holds
+    just its own path's lock, so checks reading different paths overlap
+    their I/O. Paths are agent-root relative.
+    """
+
+    def __init__(self, agent_path: Path):
+        self.root = Path(agent_path)
+        self._listings: Dict[str, Optional[Dict[str, Tuple[bool, int, int]]]] = {}
+        self._texts: Dict[str, Optional[str]] = {}
+        self._heads: Dict[Tuple[str, int], Optional[bytes]] = {}
+        self._lock = threading.Lock()
+        self._fill_locks: Dict[Tuple[str, Any], threading.Lock] = {}
+
+    def _once(self, kind: str, cache: dict, key, load: Callable[[], Any]):
+        """cache[key], computing it with load() at most once across threads."""
+        if key in cache:
+            return cache[key]
+        with self._lock:
+            fill_lock = self._fill_locks.setdefault((kind, key), threading.Lock())
+        with fill_lock:  # I/O under this path's lock only
+            if key not in cache:
+                cache[key] = load()
+        return cache[key]
+
+    def listing(self, rel: str = '.') -> Optional[Dict[str, Tuple[bool, int, int]]]:
+        """{name: (is_dir, size, mtime_ns)} of a directory (None if not a directory)."""
+        rel = os.path.normpath(rel)
+
+        def scan() -> Optional[Dict[str, Tuple[bool, int, int]]]:
+            entries = {}
+            try:
+                with os.scandir(self.root / rel) as it:
+                    for entry in it:
+                        try:
+                            st = entry.stat()
+                            entries[entry.name] = (entry.is_dir(), st.st_size, st.st_mtime_ns)
+                        except OSError:
+                            continue  # dangling symlink / vanished mid-scan
+            except OSError:
+                return None
+            return entries
+
+        return self._once('listing', self._listings, rel, scan)
+
+    def entry(self, rel: str) -> Optional[Tuple[bool, int, int]]:
+        """(is_dir, size, mtime_ns) for a path, from its parent's listing."""
+        rel = os.path.normpath(rel)
+        if rel == '.':
+            try:
+                st = self.root.stat()
+            except OSError:
+                return None
+            return (True, st.st_size, st.st_mtime_ns)
+        parent, name = os.path.split(rel)
+        if name == '..':
+            try:
+                st = (self.root / rel).stat()
+            except OSError:
+                return None
+            return (os.path.isdir(self.root / rel), st.st_size, st.st_mtime_ns)
+        listing = self.listing(parent or '.')
+        return listing.get(name) if listing is not None else None
+
+    def exists(self, rel: str) -> bool:
+        return self.entry(rel) is not None
+
+    def is_dir(self, rel: str) -> bool:
+        found = self.entry(rel)
+        return found is not None and found[0]
+
+    def is_file(self, rel: str) -> bool:
+        found = self.entry(rel)
+        return found is not None and not found[0]
+
+    def glob(self, rel: str, pattern: str) -> List[str]:
+        """Sorted names in directory rel matching a shell pattern (case-sensitive)."""
+        listing = self.listing(rel) or {}
+        return sorted(name for name in listing if fnmatch.fnmatchcase(name, pattern))
+
+    def head(self, rel: str, n: int = SNAPSHOT_HEAD_BYTES) -> Optional[bytes]:
+        """First n bytes of a file (None if unreadable)."""
+        def read() -> Optional[bytes]:
+            try:
+                with open(self.root / rel, 'rb') as f:
+                    return f.read(n)
+            except OSError:
+                return None
+
+        return self._once('head', self._heads, (os.path.normpath(rel), n), read)
+
+    def read_text(self, rel: str) -> Optional[str]:
+        """Whole file as UTF-8 text, undecodable bytes ignored (None if unreadable)."""
+        rel = os.path.normpath(rel)
+
+        def read() -> Optional[str]:
+            try:
+                return (self.root / rel).read_text(encoding='utf-8', errors='ignore')
+            except OSError:
+                return None
+
+        return self._once('text', self._texts, rel, read)
+
+
 # =============================================================================
 # Checks
 # =============================================================================
 
-def check_aget_directory(agent_path: Path) -> CheckResult:
+def check_aget_directory(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L021 Check 1: Verify .aget/ directory exists."""
-    exists = (agent_path / '.aget').is_dir()
+    exists = (fs or FsSnapshot(agent_path)).is_dir('.aget')
     return CheckResult(
         name=".aget_directory",
         passed=exists,
@@ -100,11 +234,11 @@ def check_aget_directory(agent_path: Path) -> CheckResult:
     )
 
 
-def check_version_json(agent_path: Path) -> CheckResult:
+def check_version_json(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L021 Check 2: Verify version.json exists and is valid."""
-    version_file = agent_path / '.aget' / 'version.json'
+    text = (fs or FsSnapshot(agent_path)).read_text('.aget/version.json')
 
-    if not version_file.exists():
+    if text is None:
         return CheckResult(
             name="version_json",
             passed=False,
@@ -113,8 +247,7 @@ def check_version_json(agent_path: Path) -> CheckResult:
         )
 
     try:
-        with open(version_file) as f:
-            data = json.load(f)
+        data = json.loads(text)
 
         if 'aget_version' not in data:
             return CheckResult(
@@ -140,11 +273,11 @@ def check_version_json(agent_path: Path) -> CheckResult:
         )
 
 
-def check_identity_json(agent_path: Path) -> CheckResult:
+def check_identity_json(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L021 Check 3: Verify identity.json exists and has north_star."""
-    identity_file = agent_path / '.aget' / 'identity.json'
+    text = (fs or FsSnapshot(agent_path)).read_text('.aget/identity.json')
 
-    if not identity_file.exists():
+    if text is None:
         return CheckResult(
             name="identity_json",
             passed=False,
@@ -154,8 +287,7 @@ def check_identity_json(agent_path: Path) -> CheckResult:
         )
 
     try:
-        with open(identity_file) as f:
-            data = json.load(f)
+        data = json.loads(text)
 
         if 'north_star' not in data:
             return CheckResult(
@@ -180,11 +312,11 @@ def check_identity_json(agent_path: Path) -> CheckResult:
         )
 
 
-def check_governance_directory(agent_path: Path) -> CheckResult:
+def check_governance_directory(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L021 Check 4: Verify governance/ directory and required files."""
-    gov_dir = agent_path / 'governance'
+    fs = fs or FsSnapshot(agent_path)
 
-    if not gov_dir.is_dir():
+    if not fs.is_dir('governance'):
         return CheckResult(
             name="governance_directory",
             passed=False,
@@ -194,7 +326,7 @@ def check_governance_directory(agent_path: Path) -> CheckResult:
         )
 
     required_files = ['CHARTER.md', 'MISSION.md', 'SCOPE_BOUNDARIES.md']
-    missing = [f for f in required_files if not (gov_dir / f).exists()]
+    missing = [f for f in required_files if not fs.exists(f'governance/{f}')]
 
     if missing:
         return CheckResult(
@@ -212,24 +344,23 @@ def check_governance_directory(agent_path: Path) -> CheckResult:
     )
 
 
-def check_evolution_directory(agent_path: Path) -> CheckResult:
+def check_evolution_directory(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L021 Check 5: Check evolution/ for L-doc count and index."""
-    evolution_dir = agent_path / '.aget' / 'evolution'
+    fs = fs or FsSnapshot(agent_path)
 
-    if not evolution_dir.is_dir():
+    if not fs.is_dir('.aget/evolution'):
         return CheckResult(
             name="evolution_directory",
             passed=True,
             message="No evolution/ directory (OK for new agents)"
         )
 
-    l_docs = list(evolution_dir.glob('L*.md'))
+    l_docs = fs.glob('.aget/evolution', 'L*.md')
     count = len(l_docs)
 
     # Check if index is needed (>50 L-docs)
     if count > 50:
-        index_file = evolution_dir / 'index.json'
-        if not index_file.exists():
+        if not fs.exists('.aget/evolution/index.json'):
             return CheckResult(
                 name="evolution_directory",
                 passed=False,
@@ -245,12 +376,12 @@ def check_evolution_directory(agent_path: Path) -> CheckResult:
     )
 
 
-def check_5d_structure(agent_path: Path) -> CheckResult:
+def check_5d_structure(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """Check 5D directory structure (v3.0 requirement)."""
     dimensions = ['persona', 'memory', 'reasoning', 'skills', 'context']
-    aget_dir = agent_path / '.aget'
+    fs = fs or FsSnapshot(agent_path)
 
-    present = [d for d in dimensions if (aget_dir / d).is_dir()]
+    present = [d for d in dimensions if fs.is_dir(f'.aget/{d}')]
     missing = [d for d in dimensions if d not in present]
 
     if not missing:
@@ -277,11 +408,11 @@ def check_5d_structure(agent_path: Path) -> CheckResult:
     )
 
 
-def check_sessions_directory(agent_path: Path) -> CheckResult:
+def check_sessions_directory(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """Check sessions/ directory exists."""
-    sessions_dir = agent_path / 'sessions'
+    fs = fs or FsSnapshot(agent_path)
 
-    if not sessions_dir.is_dir():
+    if not fs.is_dir('sessions'):
         return CheckResult(
             name="sessions_directory",
             passed=False,
@@ -291,9 +422,9 @@ def check_sessions_directory(agent_path: Path) -> CheckResult:
         )
 
     # SC-011: Use correct SESSION_*.md convention with legacy fallback
-    session_files = list(sessions_dir.glob('SESSION_*.md'))
+    session_files = fs.glob('sessions', 'SESSION_*.md')
     if not session_files:
-        session_files = list(sessions_dir.glob('session_*.md'))  # legacy fallback
+        session_files = fs.glob('sessions', 'session_*.md')  # legacy fallback
     return CheckResult(
         name="sessions_directory",
         passed=True,
@@ -301,11 +432,11 @@ def check_sessions_directory(agent_path: Path) -> CheckResult:
     )
 
 
-def check_planning_directory(agent_path: Path) -> CheckResult:
+def check_planning_directory(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """Check planning/ directory exists."""
-    planning_dir = agent_path / 'planning'
+    fs = fs or FsSnapshot(agent_path)
 
-    if not planning_dir.is_dir():
+    if not fs.is_dir('planning'):
         return CheckResult(
             name="planning_directory",
             passed=False,
@@ -314,7 +445,7 @@ def check_planning_directory(agent_path: Path) -> CheckResult:
             fixable=True
         )
 
-    plans = list(planning_dir.glob('PROJECT_PLAN_*.md'))
+    plans = fs.glob('planning', 'PROJECT_PLAN_*.md')
     return CheckResult(
         name="planning_directory",
         passed=True,
@@ -322,21 +453,21 @@ def check_planning_directory(agent_path: Path) -> CheckResult:
     )
 
 
-def check_duplicate_ldoc_ids(agent_path: Path) -> CheckResult:
+def check_duplicate_ldoc_ids(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L131: Detect duplicate L-doc IDs (two distinct lessons sharing one L###).
 
     Presence/count checks cannot catch ID collisions. This check CAN fail on a
     real, independently-detectable defect — the test L131/L671 demand of every
     health check ("what real failure turns this RED?").
     """
-    evolution_dir = agent_path / '.aget' / 'evolution'
-    if not evolution_dir.is_dir():
+    fs = fs or FsSnapshot(agent_path)
+    if not fs.is_dir('.aget/evolution'):
         return CheckResult("duplicate_ldoc_ids", True,
                            "No evolution/ directory", "info")
 
     seen: Dict[str, int] = {}
-    for f in evolution_dir.glob('L*.md'):
-        m = re.match(r'(L\d+)_', f.name)
+    for name in fs.glob('.aget/evolution', 'L*.md'):
+        m = re.match(r'(L\d+)_', name)
         if m:
             seen[m.group(1)] = seen.get(m.group(1), 0) + 1
 
@@ -356,13 +487,13 @@ def check_duplicate_ldoc_ids(agent_path: Path) -> CheckResult:
     )
 
 
-def check_config_size(agent_path: Path) -> CheckResult:
+def check_config_size(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L146: AGENTS.md must stay under the 40k hard limit (30k recommended)."""
-    agents_md = agent_path / 'AGENTS.md'
-    if not agents_md.exists():
+    agents_md = (fs or FsSnapshot(agent_path)).entry('AGENTS.md')
+    if agents_md is None:
         return CheckResult("config_size", True, "No AGENTS.md", "info")
 
-    size = agents_md.stat().st_size
+    size = agents_md[1]
     if size > 40000:
         return CheckResult(
             name="config_size",
@@ -396,29 +527,35 @@ D71_STRUCTURAL_SKILLS = (
 )
 
 
-def check_structural_skill_frontmatter(agent_path: Path) -> CheckResult:
+def check_structural_skill_frontmatter(agent_path: Path,
+                                       fs: Optional[FsSnapshot] = None) -> CheckResult:
     """D71 invariant: no D71-STRUCTURAL skill may carry `disable-model-invocation`.
 
     The flag blocks model (agent) invocation, but D71 mandates the agent MUST
     invoke these skills; a drifted flag makes D71 unsatisfiable on this instance.
     Ref: gmelli/aget-aget#1489 (SGR remediation F2).
     """
-    skills_dir = agent_path / ".claude" / "skills"
-    if not skills_dir.is_dir():
+    fs = fs or FsSnapshot(agent_path)
+    if not fs.is_dir(".claude/skills"):
         return CheckResult("structural_skill_frontmatter", True,
                            "No .claude/skills/ — not applicable", "info")
     offenders = []
     absent = []
     for skill in D71_STRUCTURAL_SKILLS:
-        sk = skills_dir / skill / "SKILL.md"
-        if not sk.is_file():
+        sk = f".claude/skills/{skill}/SKILL.md"
+        if not fs.is_file(sk):
             absent.append(skill)
             continue
-        try:
-            text = sk.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+        # inspect only the frontmatter (between the first two '---' markers);
+        # the snapshot's head holds it unless it is longer than the head, or
+        # absent (then the whole file is scanned)
+        head = fs.head(sk)
+        if head is None:
             continue
-        # inspect only the frontmatter (between the first two '---' markers)
+        text = head.decode("utf-8", errors="ignore")
+        if len(head) == SNAPSHOT_HEAD_BYTES and not (
+                text.startswith("---") and len(text.split("---", 2)) >= 3):
+            text = fs.read_text(sk) or ""
         parts = text.split("---", 2)
         front = parts[1] if text.startswith("---") and len(parts) >= 3 else text
         for line in front.splitlines():
@@ -445,20 +582,21 @@ def check_structural_skill_frontmatter(agent_path: Path) -> CheckResult:
                        "carry no disable-model-invocation", "info")
 
 
-def check_permission_accumulation(agent_path: Path) -> CheckResult:
+def check_permission_accumulation(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """L500/L027 (#1516, v3.25 C-25-06): permission-file accumulation gate.
 
     WARN over 100 permissions or 30KB; ERROR over 200 or 50KB. Previously a
     documented threshold with no failing check — HEALTHY-through (L671).
     """
+    fs = fs or FsSnapshot(agent_path)
     worst = None
     for name in ('settings.local.json', 'settings.json'):
-        f = agent_path / '.claude' / name
-        if not f.exists():
+        found = fs.entry(f'.claude/{name}')
+        if found is None:
             continue
-        size = f.stat().st_size
+        size = found[1]
         try:
-            allow = json.loads(f.read_text()).get('permissions', {}).get('allow', [])
+            allow = json.loads(fs.read_text(f'.claude/{name}')).get('permissions', {}).get('allow', [])
         except Exception:
             allow = []
         n = len(allow)
@@ -473,29 +611,24 @@ def check_permission_accumulation(agent_path: Path) -> CheckResult:
     return CheckResult('permission_accumulation', True, 'within L500 thresholds')
 
 
-def check_reliance_manifest(agent_path: Path) -> CheckResult:
+def check_reliance_manifest(agent_path: Path, fs: Optional[FsSnapshot] = None) -> CheckResult:
     """R-BND-001-03 (v3.25, gh#1787): self-attest reliance-manifest conformance.
 
     Graceful: agents without a manifest (pre-adoption) PASS with an advisory
     message — absence is expected lag, not an error (L601). When both the
     manifest and its validator are present, the validator's verdict is the check.
     """
-    manifest = agent_path / '.aget' / 'skill_reliance_manifest.yaml'
+    fs = fs or FsSnapshot(agent_path)
     validator = agent_path / 'scripts' / 'check_skill_reliance_manifest.py'
-    if not manifest.exists():
+    if not fs.exists('.aget/skill_reliance_manifest.yaml'):
         return CheckResult('reliance_manifest', True,
                            'no manifest (pre-adoption — advisory, not required)')
-    if not validator.exists():
+    if not fs.exists('scripts/check_skill_reliance_manifest.py'):
         return CheckResult('reliance_manifest', False,
                            'manifest present but validator missing (R-BND-001-03 wiring gap)',
                            severity='warning')
-    import subprocess
     try:
-        r = subprocess.run([sys.executable, str(validator)], capture_output=True,
-                           text=True, timeout=15, cwd=str(agent_path))
-        ok = r.returncode == 0
-        tail = (r.stdout or r.stderr).strip().splitlines()
-        msg = tail[-1] if tail else f'exit {r.returncode}'
+        ok, msg = attest_reliance(agent_path, validator)
         return CheckResult('reliance_manifest', ok, msg,
                            severity='info' if ok else 'warning')
     except Exception as e:
@@ -503,12 +636,251 @@ def check_reliance_manifest(agent_path: Path) -> CheckResult:
                            severity='warning')
 
 
-def run_housekeeping(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
+def load_script_module(script_path: Path, name: str):
+    """Import a sibling framework script in-process by file path.
+
+    Not registered in sys.modules: each load sees the script as deployed in
+    that agent, and module-level paths resolve against its own location.
+    """
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(name, str(script_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def attest_reliance(agent_path: Path, validator: Path) -> Tuple[bool, str]:
+    """Run the reliance-manifest validator; returns (ok, summary line).
+
+    In-process via the validator's attest() when it has one. Validators that
+    predate it, or that fail to import, run as a subprocess instead (the
+    pre-gh#1787 path) so the verdict is the same either way.
+    """
+    try:
+        attest = getattr(load_script_module(validator, '_reliance_validator'), 'attest', None)
+        if attest is not None:
+            return attest()
+    except Exception:
+        pass
+    import subprocess
+    r = subprocess.run([sys.executable, str(validator)], capture_output=True,
+                       text=True, timeout=15, cwd=str(agent_path))
+    tail = (r.stdout or r.stderr).strip().splitlines()
+    return r.returncode == 0, tail[-1] if tail else f'exit {r.returncode}'
+
+
+# =============================================================================
+# Check Registry
+# =============================================================================
+
+# (key, check function, keys it depends on). Dependencies only order
+# execution: a check starts once every check it requires has finished.
+# Report order is registry order regardless of completion order.
+# Every check is called as fn(agent_path, fs) with the run's FsSnapshot.
+CHECK_REGISTRY: List[Tuple[str, Callable[..., CheckResult], Tuple[str, ...]]] = [
+    ('aget_directory', check_aget_directory, ()),
+    ('version_json', check_version_json, ('aget_directory',)),
+    ('identity_json', check_identity_json, ('aget_directory',)),
+    ('governance_directory', check_governance_directory, ()),
+    ('evolution_directory', check_evolution_directory, ('aget_directory',)),
+    ('5d_structure', check_5d_structure, ('aget_directory',)),
+    ('sessions_directory', check_sessions_directory, ()),
+    ('planning_directory', check_planning_directory, ()),
+    ('duplicate_ldoc_ids', check_duplicate_ldoc_ids, ('evolution_directory',)),
+    ('config_size', check_config_size, ()),
+    ('structural_skill_frontmatter', check_structural_skill_frontmatter, ()),
+    ('reliance_manifest', check_reliance_manifest, ('aget_directory',)),
+    ('permission_accumulation', check_permission_accumulation, ()),
+]
+
+# Reported CheckResult.name where it differs from the registry key (the
+# historical output), so a check that raises keeps the name it reports.
+CHECK_NAMES: Dict[str, str] = {'aget_directory': '.aget_directory'}
+
+DEFAULT_CHECK_WORKERS = 8
+
+
+def _timed_check(key: str, check_fn: Callable[..., CheckResult],
+                 agent_path: Path, fs: FsSnapshot) -> CheckResult:
+    """Run one check, recording duration_ms; a raising check fails soft (ADR-004)."""
+    started = time.perf_counter()
+    try:
+        result = check_fn(agent_path, fs)
+    except Exception as e:
+        result = CheckResult(CHECK_NAMES.get(key, key), False, f'check raised {type(e).__name__}: {e}',
+                             severity='error')
+    result.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def run_checks(agent_path: Path, registry=None, max_workers: Optional[int] = None,
+               verbose: bool = False,
+               reuse: Optional[Dict[str, CheckResult]] = None,
+               fs: Optional[FsSnapshot] = None) -> List[CheckResult]:
+    """Run registered checks concurrently, honouring declared dependencies.
+
+    Checks are I/O-bound (L-doc globbing, skill frontmatter reads, the
+    reliance validator), so a thread pool overlaps them; each is submitted
+    as soon as its dependencies complete.
+
+    Args:
+        agent_path: Agent root directory
+        registry: (key, fn, requires) entries (default CHECK_REGISTRY)
+        max_workers: Thread-pool size (default DEFAULT_CHECK_WORKERS; 1 = serial)
+        verbose: Emit L039 diagnostics to stderr
+        reuse: {key: CheckResult} to report without running (--incremental);
+            they count as complete for dependants
+        fs: Snapshot shared by every check (default: a new one)
+
+    Returns:
+        CheckResults in registry order
+
+    Raises:
+        ValueError: A dependency is unknown or the dependencies form a cycle
+    """
+    registry = CHECK_REGISTRY if registry is None else registry
+    keys = [key for key, _, _ in registry]
+    for key, _, requires in registry:
+        unknown = [r for r in requires if r not in keys]
+        if unknown:
+            raise ValueError(f"check {key} requires unknown check(s): {', '.join(unknown)}")
+
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    fs = fs or FsSnapshot(agent_path)
+    results: Dict[str, CheckResult] = dict(reuse or {})
+    pending = [entry for entry in registry if entry[0] not in results]
+    workers = max(1, min(max_workers or DEFAULT_CHECK_WORKERS, len(registry) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while pending or running:
+            for entry in [e for e in pending if all(r in results for r in e[2])]:
+                key, check_fn, _ = entry
+                pending.remove(entry)
+                if verbose:
+                    log_diagnostic(f"Running {check_fn.__name__}")
+                running[pool.submit(_timed_check, key, check_fn, agent_path, fs)] = key
+            if not running:
+                raise ValueError("dependency cycle among checks: "
+                                 + ', '.join(key for key, _, _ in pending))
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    return [results[key] for key in keys]
+
+
+# =============================================================================
+# Incremental Journal (--incremental)
+# =============================================================================
+
+CHECK_JOURNAL_RELPATH = Path('.aget') / 'cache' / 'health_journal.json'
+CHECK_JOURNAL_VERSION = 1
+
+_ARCHETYPE_INDEX_RELPATHS = [
+    '../aget/specs/ARCHETYPE_SKILLS_INDEX.yaml',
+    '../aget-framework/aget/specs/ARCHETYPE_SKILLS_INDEX.yaml',
+    str(Path.home() / 'github' / 'aget-framework' / 'aget' / 'specs'
+        / 'ARCHETYPE_SKILLS_INDEX.yaml'),
+]
+
+# Paths each registered check reads, relative to the agent root. A
+# directory's mtime moves when entries are added, removed or renamed, which
+# covers checks that only list or test for presence. Checks absent here
+# (e.g. extension-registered ones) are never cached.
+CHECK_INPUTS: Dict[str, List[str]] = {
+    'aget_directory': ['.aget'],
+    'version_json': ['.aget/version.json'],
+    'identity_json': ['.aget/identity.json'],
+    'governance_directory': ['governance', 'governance/CHARTER.md',
+                             'governance/MISSION.md', 'governance/SCOPE_BOUNDARIES.md'],
+    'evolution_directory': ['.aget/evolution', '.aget/evolution/index.json'],
+    '5d_structure': ['.aget'] + [f'.aget/{d}' for d in
+                                 ('persona', 'memory', 'reasoning', 'skills', 'context')],
+    'sessions_directory': ['sessions'],
+    'planning_directory': ['planning'],
+    'duplicate_ldoc_ids': ['.aget/evolution'],
+    'config_size': ['AGENTS.md'],
+    'structural_skill_frontmatter': ['.claude/skills'] + [
+        f'.claude/skills/{skill}/SKILL.md' for skill in D71_STRUCTURAL_SKILLS],
+    'reliance_manifest': ['.aget/skill_reliance_manifest.yaml',
+                          'scripts/check_skill_reliance_manifest.py',
+                          '.claude/skills'] + _ARCHETYPE_INDEX_RELPATHS,
+    'permission_accumulation': ['.claude/settings.local.json', '.claude/settings.json'],
+}
+
+
+def check_signature(agent_path: Path, key: str,
+                    fs: Optional[FsSnapshot] = None) -> Optional[list]:
+    """[[rel, mtime_ns, size], ...] over a check's inputs plus this script.
+
+    The script's own stat is included so upgrading health_check.py
+    invalidates every cached result. None for checks without CHECK_INPUTS.
+    """
+    rels = CHECK_INPUTS.get(key)
+    if rels is None:
+        return None
+    fs = fs or FsSnapshot(agent_path)
+    signature = []
+    for rel in rels:
+        found = fs.entry(rel)
+        signature.append([rel, found[2], found[1]] if found else [rel, None, None])
+    st = Path(__file__).stat()
+    signature.append(['<health_check.py>', st.st_mtime_ns, st.st_size])
+    return signature
+
+
+def load_check_journal(agent_path: Path) -> Dict[str, Any]:
+    """{key: {'inputs': signature, 'result': check dict}} ({} when unusable)."""
+    try:
+        journal = json.loads((agent_path / CHECK_JOURNAL_RELPATH).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(journal, dict) or journal.get('version') != CHECK_JOURNAL_VERSION:
+        return {}
+    return journal.get('checks', {})
+
+
+def save_check_journal(agent_path: Path, checks: Dict[str, Any]) -> bool:
+    """Atomically write the journal. Returns False on failure (fail-soft)."""
+    path = agent_path / CHECK_JOURNAL_RELPATH
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({'version': CHECK_JOURNAL_VERSION, 'checks': checks}))
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+def run_housekeeping(agent_path: Path, verbose: bool = False,
+                     max_workers: Optional[int] = None,
+                     incremental: bool = False,
+                     fs: Optional[FsSnapshot] = None) -> Dict[str, Any]:
     """
     Run all housekeeping checks.
 
+    With incremental, passing results whose recorded inputs are unchanged
+    are reused from the check journal, and each check dict is marked
+    'freshness': 'fresh' or 'cached'. One FsSnapshot (fs, or a new one)
+    serves every check and the journal signatures, so the tree is listed
+    once per run.
+
     Returns structured dict suitable for JSON or human output.
     """
+    started = time.perf_counter()
+    fs = fs or FsSnapshot(agent_path)
+    reuse: Dict[str, CheckResult] = {}
+    if incremental:
+        signatures = {key: check_signature(agent_path, key, fs)
+                      for key, _, _ in CHECK_REGISTRY}
+        journal = load_check_journal(agent_path)
+        for key, signature in signatures.items():
+            entry = journal.get(key)
+            if (signature is not None and entry and entry.get('inputs') == signature
+                    and entry.get('result', {}).get('passed')):
+                r = entry['result']
+                reuse[key] = CheckResult(r['name'], True, r.get('message', ''),
+                                         r.get('severity', 'info'), r.get('fixable', False))
     data = {
         'timestamp': datetime.now().isoformat(),
         'agent_path': str(agent_path),
@@ -523,29 +895,13 @@ def run_housekeeping(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
         'status': 'unknown',
     }
 
-    # Run all checks
-    checks = [
-        check_aget_directory,
-        check_version_json,
-        check_identity_json,
-        check_governance_directory,
-        check_evolution_directory,
-        check_5d_structure,
-        check_sessions_directory,
-        check_planning_directory,
-        check_duplicate_ldoc_ids,
-        check_config_size,
-        check_structural_skill_frontmatter,
-        check_reliance_manifest,
-        check_permission_accumulation,
-    ]
-
-    for check_fn in checks:
-        if verbose:
-            log_diagnostic(f"Running {check_fn.__name__}")
-
-        result = check_fn(agent_path)
-        data['checks'].append(result.to_dict())
+    results = run_checks(agent_path, max_workers=max_workers, verbose=verbose,
+                         reuse=reuse, fs=fs)
+    for (key, _, _), result in zip(CHECK_REGISTRY, results):
+        check = result.to_dict()
+        if incremental:
+            check['freshness'] = 'cached' if key in reuse else 'fresh'
+        data['checks'].append(check)
 
         data['summary']['total'] += 1
         if result.passed:
@@ -566,9 +922,24 @@ def run_housekeeping(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
     else:
         data['status'] = 'healthy'
 
+    if incremental:
+        data['summary']['cached'] = len(reuse)
+        journal = {key: {'inputs': signatures[key], 'result': r.to_dict()}
+                   for (key, _, _), r in zip(CHECK_REGISTRY, results)
+                   if signatures[key] is not None}
+        save_check_journal(agent_path, journal)
+
+    data['duration_ms'] = round((time.perf_counter() - started) * 1000, 2)
     return data
 
 
+def slowest_checks(data: Dict[str, Any], n: int = 5) -> List[Dict[str, Any]]:
+    """The n slowest checks of a housekeeping report, slowest first."""
+    timed = [c for c in data.get('checks', []) if c.get('duration_ms') is not None]
+    timed.sort(key=lambda c: c['duration_ms'], reverse=True)
+    return [{'name': c['name'], 'duration_ms': c['duration_ms']} for c in timed[:n]]
+
+
 def format_human_output(data: Dict[str, Any]) -> str:
     """Format data for human-readable output."""
     lines = []
@@ -589,6 +960,8 @@ def format_human_output(data: Dict[str, Any]) -> str:
         lines.append(f"Errors: {summary['errors']}")
     if summary['fixable']:
         lines.append(f"Fixable: {summary['fixable']} (run with --fix)")
+    if summary.get('cached'):
+        lines.append(f"Cached: {summary['cached']} (inputs unchanged since last pass)")
 
     lines.append("")
     lines.append("Checks:")
@@ -604,6 +977,12 @@ def format_human_output(data: Dict[str, Any]) -> str:
         else:
             lines.append(f"  [{symbol}] {name}: {message}")
 
+    if data.get('slowest'):
+        lines.append("")
+        lines.append(f"Slowest checks (total {data.get('duration_ms', 0):.1f}ms wall):")
+        for check in data['slowest']:
+            lines.append(f"  {check['duration_ms']:8.1f}ms  {check['name']}")
+
     lines.append("")
     return "\n".join(lines)
 
@@ -612,10 +991,13 @@ def format_human_output(data: Dict[str, Any]) -> str:
 # Main
 # =============================================================================
 
-def call_extension_hook(agent_path, data, verbose=False):
+def call_extension_hook(agent_path, data, verbose=False, fs=None):
     """HC extension hook (v3.26 C-26-05, gh#1836/#1848): call
     scripts/health_check_ext.py:post_health(data) if present.
 
+    A hook declaring a second parameter, post_health(data, fs), also gets
+    the run's FsSnapshot so its checks reuse the same directory listings.
+
     Same contract as wake_up.py WU-008: hook receives the housekeeping data
     dict, returns an augmented dict (additive-only per L464); absence = no-op;
     failure = warning + continue (ADR-004). Root cause this closes: instances
@@ -626,12 +1008,18 @@ def call_extension_hook(agent_path, data, verbose=False):
     ext_path = agent_path / 'scripts' / 'health_check_ext.py'
     if not ext_path.exists():
         return data
+    import importlib.util
+    import inspect
     try:
         spec = importlib.util.spec_from_file_location('health_check_ext', str(ext_path))
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         if hasattr(module, 'post_health'):
-            result = module.post_health(data)
+            params = inspect.signature(module.post_health).parameters
+            if len(params) >= 2:
+                result = module.post_health(data, fs or FsSnapshot(agent_path))
+            else:
+                result = module.post_health(data)
             if isinstance(result, dict):
                 return result
             if verbose:
@@ -641,6 +1029,39 @@ def call_extension_hook(agent_path, data, verbose=False):
     return data
 
 
+def health_report(agent_path: Path, verbose: bool = False,
+                  incremental: bool = False) -> Dict[str, Any]:
+    """Library entry point: exactly the dict `health_check.py --json` prints.
+
+    Stable contract for in-process callers (wind_down.py): 'status' is one
+    of healthy/warning/error, and when the agent has a .aget/ directory
+    'summary' carries total/passed/warnings/errors/fixable counts and
+    'checks' the per-check dicts (each with duration_ms), extension-hook
+    additions included. Without .aget/ only 'status' ('error') and
+    'errors' are present.
+
+    Args:
+        agent_path: Agent root directory
+        verbose: Emit L039 diagnostics to stderr
+        incremental: Reuse unchanged passing results from the check journal
+
+    Returns:
+        Housekeeping data dict
+    """
+    agent_path = Path(agent_path)
+    if not (agent_path / '.aget').is_dir():
+        return {
+            'status': 'error',
+            'errors': ['Could not find .aget/ directory'],
+        }
+
+    fs = FsSnapshot(agent_path)
+    data = run_housekeeping(agent_path, verbose=verbose, incremental=incremental, fs=fs)
+
+    # Extension hook (v3.26 C-26-05) — instance-specific checks join here
+    return call_extension_hook(agent_path, data, verbose=verbose, fs=fs)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='AGET Housekeeping Protocol (v3.1 template)',
@@ -680,11 +1101,29 @@ Exit codes:
         action='store_true',
         help='Attempt to fix issues (not implemented yet)'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Re-run only checks whose inputs changed; reuse cached passing results'
+    )
+    parser.add_argument(
+        '--slowest',
+        type=int,
+        nargs='?',
+        const=5,
+        metavar='N',
+        help='Report the N slowest checks (default 5) to spot regressions'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Enable diagnostic output to stderr'
     )
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='Print an import-time breakdown against the start-up budget and exit'
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -693,6 +1132,10 @@ Exit codes:
 
     args = parser.parse_args()
 
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        return profile_startup(__file__)
+
     # L039: Diagnostic timing
     if args.verbose:
         log_diagnostic("Starting housekeeping protocol")
@@ -706,11 +1149,7 @@ Exit codes:
     # Check .aget/ exists
     if not (agent_path / '.aget').is_dir():
         if args.json:
-            error = {
-                'status': 'error',
-                'errors': ['Could not find .aget/ directory'],
-            }
-            print(json.dumps(error, indent=2 if args.pretty else None))
+            print(json.dumps(health_report(agent_path), indent=2 if args.pretty else None))
         else:
             print("Error: Could not find .aget/ directory", file=sys.stderr)
         return 3
@@ -718,11 +1157,9 @@ Exit codes:
     if args.verbose:
         log_diagnostic(f"Found agent at: {agent_path}")
 
-    # Run housekeeping
-    data = run_housekeeping(agent_path, verbose=args.verbose)
-
-    # Extension hook (v3.26 C-26-05) — instance-specific checks join here
-    data = call_extension_hook(agent_path, data, verbose=args.verbose)
+    data = health_report(agent_path, verbose=args.verbose, incremental=args.incremental)
+    if args.slowest:
+        data['slowest'] = slowest_checks(data, args.slowest)
 
     if args.verbose:
         log_diagnostic(f"Housekeeping complete, status={data['status']}")
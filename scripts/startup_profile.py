@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Startup Profile - Import-Time Budgets for the Session Scripts
+
+Session scripts fire on hooks, so their start-up is felt on every session
+event. Each entry point has a start-up budget: the milliseconds its module
+import may cost on top of bare interpreter start-up (`python -c pass`).
+Heavy modules (subprocess, importlib.util, inspect, concurrent.futures,
+threading, yaml) are imported inside the functions that use them, so paths
+that never spawn, hook or parallelize do not pay for them.
+
+`<script> --profile-startup` prints the breakdown measured here; the
+benchmark in tests/test_startup_budget.py enforces the budgets.
+
+Usage:
+    python3 scripts/health_check.py --profile-startup
+    python3 scripts/startup_profile.py [script ...]    # all budgeted scripts
+
+Exit codes:
+    0: Every profiled script within budget
+    1: At least one over budget
+
+Author: aget-framework (canonical template)
+Version: 1.0.0 (v3.27.0)
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+# Module-import budget per entry point, milliseconds over bare interpreter
+# start-up, as measured under -X importtime (26-30ms on the reference
+# single-core runner, down from 28-47ms before deferring heavy imports;
+# study_topic ~32ms, close_gate_check ~15ms).
+STARTUP_BUDGETS_MS: Dict[str, float] = {
+    'wake_up': 45,
+    'wind_down': 45,
+    'health_check': 45,
+    'study_topic': 50,
+    'close_gate_check': 25,
+}
+
+# Environment multiplier for slower machines (CI runners, laptops on battery).
+BUDGET_SCALE_ENV = 'AGET_STARTUP_BUDGET_SCALE'
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def budget_ms(script: str) -> float:
+    """Budget for a script, scaled by $AGET_STARTUP_BUDGET_SCALE."""
+    try:
+        scale = float(os.environ.get(BUDGET_SCALE_ENV, '1'))
+    except ValueError:
+        scale = 1.0
+    return STARTUP_BUDGETS_MS[script] * scale
+
+
+def _parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """-X importtime lines -> [{name, depth, self_ms, cumulative_ms}] in print order."""
+    rows = []
+    for line in stderr.splitlines():
+        parts = line.split('|')
+        if not line.startswith('import time:') or len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].rsplit(':', 1)[1])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # column header
+        name = parts[2][1:]  # one separator space, then two per nesting level
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        rows.append({'name': name.strip(), 'depth': depth,
+                     'self_ms': self_us / 1000, 'cumulative_ms': cumulative_us / 1000})
+    return rows
+
+
+def _interpreter_ms(runs: int) -> float:
+    """Best wall time of `python -c pass` (start-up the scripts cannot avoid)."""
+    best = float('inf')
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], capture_output=True)
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best
+
+
+def measure_startup(script: str, runs: int = 3,
+                    scripts_dir: str = _SCRIPTS_DIR) -> Dict[str, Any]:
+    """Import-time profile of one script module (best of `runs` fresh interpreters).
+
+    Args:
+        script: Module name (e.g. 'health_check')
+        runs: Fresh interpreters to sample; the fastest is reported
+        scripts_dir: Directory holding the script
+
+    Returns:
+        {'script', 'import_ms', 'interpreter_ms', 'budget_ms', 'within_budget',
+         'imports': direct imports [{name, self_ms, cumulative_ms}], slowest first}
+    """
+    code = f'import sys; sys.path.insert(0, {scripts_dir!r}); import {script}'
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                              capture_output=True, text=True)
+        rows = _parse_importtime(proc.stderr)
+        tops = [i for i, r in enumerate(rows) if r['depth'] == 0 and r['name'] == script]
+        if proc.returncode != 0 or not tops:
+            raise RuntimeError(f'could not import {script}: {proc.stderr.strip()[-300:]}')
+        end = tops[-1]
+        start = max((i for i in range(end) if rows[i]['depth'] == 0), default=-1) + 1
+        sample = (rows[end], [r for r in rows[start:end] if r['depth'] == 1])
+        if best is None or sample[0]['cumulative_ms'] < best[0]['cumulative_ms']:
+            best = sample
+    module, children = best
+    budget = budget_ms(script) if script in STARTUP_BUDGETS_MS else None
+    return {
+        'script': script,
+        'import_ms': round(module['cumulative_ms'], 2),
+        'self_ms': round(module['self_ms'], 2),
+        'interpreter_ms': round(_interpreter_ms(runs), 2),
+        'budget_ms': budget,
+        'within_budget': budget is None or module['cumulative_ms'] <= budget,
+        'imports': sorted(({'name': r['name'], 'self_ms': round(r['self_ms'], 2),
+                            'cumulative_ms': round(r['cumulative_ms'], 2)} for r in children),
+                          key=lambda r: r['cumulative_ms'], reverse=True),
+    }
+
+
+def format_profile(profile: Dict[str, Any], top: int = 12) -> str:
+    """Human-readable import-time breakdown."""
+    budget = profile['budget_ms']
+    verdict = ('no budget' if budget is None else
+               f"{'within' if profile['within_budget'] else 'OVER'} {budget:.0f}ms budget")
+    lines = [
+        f"Startup profile: {profile['script']}.py",
+        f"  interpreter start-up  {profile['interpreter_ms']:8.1f}ms  (python -c pass)",
+        f"  module import         {profile['import_ms']:8.1f}ms  ({verdict})",
+        f"    own top-level code  {profile['self_ms']:8.1f}ms",
+        "",
+        "  cumulative      self  direct import",
+    ]
+    for row in profile['imports'][:top]:
+        lines.append(f"  {row['cumulative_ms']:8.1f}ms {row['self_ms']:7.1f}ms  {row['name']}")
+    hidden = len(profile['imports']) - top
+    if hidden > 0:
+        lines.append(f"  ... {hidden} more")
+    return "\n".join(lines)
+
+
+def profile_startup(script_file: str) -> int:
+    """--profile-startup handler: print the breakdown; 1 if over budget."""
+    script = os.path.splitext(os.path.basename(script_file))[0]
+    profile = measure_startup(script, scripts_dir=os.path.dirname(os.path.abspath(script_file)))
+    print(format_profile(profile))
+    return 0 if profile['within_budget'] else 1
+
+
+def main(argv: List[str]) -> int:
+    scripts = argv or sorted(STARTUP_BUDGETS_MS)
+    status = 0
+    for i, script in enumerate(scripts):
+        if i:
+            print()
+        status |= profile_startup(os.path.join(_SCRIPTS_DIR, script + '.py'))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+"""
+Study Index - Persistent Inverted Index for study_topic.py
+
+Token -> postings index over the study surfaces, so a topic query is a
+dictionary lookup instead of a full-corpus regex rescan. Built on first use.
+
+Incremental refresh: the index doubles as a stat manifest (mtime_ns, size)
+over the surfaces. Each query stats the surfaces; only added, deleted, or
+stat-changed files are read, and a stat-changed file whose content hash is
+unchanged (touch, checkout) is not re-tokenized. Each document keeps its
+term list and newline offsets, so it can be dropped from the postings
+without touching any other file. `generation` increments whenever indexed
+content changes (cache key for derived results).
+
+Location: .aget/cache/study_index.json (derived data; safe to delete).
+
+Matching contract — answers exactly what study_topic._token_pattern matches
+for keywords made only of word characters:
+  - short tokens (<= short_token_len): whole word, s/es/ed/ing tolerated
+  - longer tokens: case-insensitive substring (always inside one word)
+Keywords carrying punctuation ("v3.26", "gh#1850") are not answerable from
+word postings; candidate_docs() narrows the file set and the caller verifies
+with the regex scan.
+
+Postings are offsets into the study haystack (content + '\\n' + filename
+tokens), the same string search_file_for_topic matches against, so offsets
+>= body_len are filename-derived matches. On disk each term's postings are
+one encoded string, decoded only when a query touches that term.
+
+Ranking: bm25f() scores documents for `study_topic.py --ranker bm25` from
+per-document field lengths (body / heading / filename) stored at index time.
+
+Related: study_topic.py (search contract v3.26 C-26-11)
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import stat
+from bisect import bisect_right
+from fnmatch import fnmatch
+from datetime import datetime
+from pathlib import Path
+
+INDEX_VERSION = 5  # bump when tokenization or classifier output changes
+INDEX_RELPATH = Path('.aget') / 'cache' / 'study_index.json'
+
+_WORD_RE = re.compile(r'\w+')
+_NEWLINE_RE = re.compile(r'\n')
+_HEADING_RE = re.compile(r'^#{1,6}[ \t].*$', re.MULTILINE)
+INFLECTIONS = ('', 's', 'es', 'ed', 'ing')  # mirrors _token_pattern's suffix group
+
+# Term keys are case-folded as study_topic._fold_case does: lower(), except
+# the characters re.IGNORECASE pairs with ASCII letters (İ ı ſ K) fold to
+# that letter. Keeps every term's length, so in-term offsets stay valid, and
+# makes ASCII substring tests on a key equal IGNORECASE matching.
+_FOLDS_TO_ASCII = re.compile('[\u0130\u0131\u017f\u212a]')
+_ASCII_FOLDS = str.maketrans('\u0130\u0131\u017f\u212a', 'iisk')
+
+
+def fold_case(text: str) -> str:
+    """Case-fold text to an index term key (see _ASCII_FOLDS)."""
+    if _FOLDS_TO_ASCII.search(text):
+        text = text.translate(_ASCII_FOLDS)
+    return text.lower()
+
+
+def filename_text(stem: str) -> str:
+    """Filename tokens joined to the haystack (raw stem + slug-normalized)."""
+    return stem + ' ' + re.sub(r'[_\-.]+', ' ', stem)
+
+
+def _scan_surfaces(agent_root: Path, surface_globs: list):
+    """walk_surfaces on plain path strings (no per-file Path objects).
+
+    Yields:
+        (surface, path str, os.stat_result)
+    """
+    for surface, base, pattern, recursive in surface_globs:
+        stack = [os.path.join(agent_root, base)]
+        found = []
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    if not fnmatch(entry.name, pattern):
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    found.append((entry.path, st))
+        # Path order (component-wise, as Path sorts), not plain string order
+        for path, st in sorted(found, key=lambda item: item[0].split(os.sep)):
+            yield surface, path, st
+
+
+def walk_surfaces(agent_root: Path, surface_globs: list):
+    """Single traversal of the study surfaces.
+
+    Each surface base directory is listed once with os.scandir (recursively
+    for recursive surfaces, not following directory symlinks — rglob
+    semantics); regular files whose name matches the surface glob are
+    yielded in sorted path order within each surface.
+
+    Yields:
+        (surface, Path, os.stat_result)
+    """
+    for surface, path, st in _scan_surfaces(agent_root, surface_globs):
+        yield surface, Path(path), st
+
+
+def list_corpus(agent_root: Path, surface_globs: list) -> dict:
+    """Stat the study surfaces (one walk_surfaces pass).
+
+    Args:
+        agent_root: Agent root directory
+        surface_globs: [(surface, base_dir, glob, recursive), ...]
+
+    Returns:
+        {relpath: [mtime_ns, size, surface]} in sorted relpath order
+    """
+    corpus = {}
+    prefix = len(os.path.join(agent_root, ''))  # scanned paths all start with it
+    for surface, path, st in _scan_surfaces(agent_root, surface_globs):
+        corpus[path[prefix:]] = [st.st_mtime_ns, st.st_size, surface]
+    return dict(sorted(corpus.items()))
+
+
+def tokenize_document(content: str, stem: str) -> tuple:
+    """Tokenize one document.
+
+    Returns:
+        (terms, newlines, headings, lengths):
+          terms = {fold_case(word): [haystack offsets]}
+          newlines = offsets of '\\n' in content (line lookup via bisect)
+          headings = flat [start, end, ...] spans of markdown heading lines
+          lengths = word counts per BM25F field [body, heading, name]
+    """
+    haystack = content + '\n' + filename_text(stem)
+    body_len = len(content)
+    headings = []
+    for m in _HEADING_RE.finditer(content):
+        headings.extend((m.start(), m.end()))
+    terms = {}
+    lengths = [0, 0, 0]
+    for m in _WORD_RE.finditer(haystack):
+        start = m.start()
+        terms.setdefault(fold_case(m.group()), []).append(start)
+        lengths[field_of(start, body_len, headings)] += 1
+    newlines = [m.start() for m in _NEWLINE_RE.finditer(content)]
+    return terms, newlines, headings, lengths
+
+
+FIELD_BODY, FIELD_HEADING, FIELD_NAME = 0, 1, 2
+
+
+def field_of(offset: int, body_len: int, headings: list) -> int:
+    """BM25F field of a haystack offset: filename tokens, heading line, or body."""
+    if offset >= body_len:
+        return FIELD_NAME
+    i = bisect_right(headings, offset)
+    return FIELD_HEADING if i % 2 else FIELD_BODY
+
+
+def content_hash(content: str) -> str:
+    """Content hash confirming a stat change is a real edit."""
+    return hashlib.sha1(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def read_document(agent_root: Path, rel: str):
+    """Read a corpus file the way search_file_for_topic does; None if unreadable."""
+    try:
+        return (agent_root / rel).read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+# Storage encoding: one string per term ("id:off,off;id:off") and per-doc
+# strings for the term list and newline offsets. json.loads then handles a
+# few thousand strings instead of millions of ints, and only the terms a
+# query touches are ever decoded.
+
+def encode_ints(values) -> str:
+    return ','.join(map(str, values))
+
+
+def decode_ints(text: str) -> list:
+    return [int(v) for v in text.split(',')] if text else []
+
+
+def decode_postings(entry: str) -> dict:
+    """Decode one term's postings: {doc_id: [offsets]}."""
+    out = {}
+    for part in entry.split(';'):
+        doc_id, _, offsets = part.partition(':')
+        out[int(doc_id)] = decode_ints(offsets)
+    return out
+
+
+def posting_ids(entry: str) -> list:
+    """Doc ids in one term's postings, without decoding offsets."""
+    return [int(part.partition(':')[0]) for part in entry.split(';')]
+
+
+def prepare_document(agent_root: Path, rel: str, entry: list, content: str = None,
+                     classify=None) -> tuple:
+    """Read (when needed) and tokenize one corpus file.
+
+    Pure function of the file, so refresh_index can run it in worker
+    processes; add_document assigns the doc id and posts the result.
+
+    Returns:
+        (doc, encoded): doc fields (no id) and {term: encoded offsets}
+    """
+    mtime_ns, size, surface = entry
+    doc = {'surface': surface, 'mtime_ns': mtime_ns, 'size': size}
+    if content is None:
+        content = read_document(agent_root, rel)
+    if content is None:
+        doc['readable'] = False  # scan path returns None for these too
+        return doc, {}
+    terms, newlines, headings, lengths = tokenize_document(content, Path(rel).stem)
+    doc['sha1'] = content_hash(content)
+    doc['body_len'] = len(content)
+    doc['newlines'] = encode_ints(newlines)
+    doc['headings'] = encode_ints(headings)
+    doc['lengths'] = lengths
+    doc['terms'] = ' '.join(terms)
+    if classify is not None:
+        doc['meta'] = classify(surface, agent_root / rel, content)
+    return doc, {term: encode_ints(offsets) for term, offsets in terms.items()}
+
+
+def _prepare_task(task: tuple) -> tuple:
+    """Process-pool entry point for prepare_document."""
+    return prepare_document(*task)
+
+
+def add_document(index: dict, agent_root: Path, rel: str, entry: list,
+                 content: str = None, pending: dict = None, classify=None,
+                 prepared: tuple = None) -> None:
+    """Tokenize and post one corpus file into the index.
+
+    Args:
+        index: Index to update
+        agent_root: Agent root directory
+        rel: Relative path of the file
+        entry: [mtime_ns, size, surface] from list_corpus()
+        content: Already-read content (read from disk when None)
+        pending: Optional {term: [encoded postings]} batch, merged by
+            flush_postings() (avoids re-joining hot terms once per file)
+        classify: Optional (surface, Path, content) -> dict of per-surface
+            metadata (titles, plan status), stored as doc['meta']
+        prepared: prepare_document() result computed elsewhere (worker pool)
+    """
+    doc, encoded = prepared or prepare_document(agent_root, rel, entry, content, classify)
+    doc_id = index['next_id']
+    index['next_id'] += 1
+    doc['id'] = doc_id
+    index['docs'][rel] = doc
+    index['_paths'][doc_id] = rel
+    index.pop('_field_avg', None)
+    batch = {} if pending is None else pending
+    for term, offsets in encoded.items():
+        batch.setdefault(term, []).append(f"{doc_id}:{offsets}")
+    if pending is None:
+        flush_postings(index, batch)
+
+
+def flush_postings(index: dict, pending: dict) -> None:
+    """Merge a batch of encoded postings into the index."""
+    postings = index['postings']
+    for term, parts in pending.items():
+        existing = postings.get(term)
+        postings[term] = ';'.join([existing] + parts if existing else parts)
+    pending.clear()
+
+
+def remove_document(index: dict, rel: str) -> None:
+    """Drop one document and its postings (via its cached term list)."""
+    doc = index['docs'].pop(rel, None)
+    if doc is None:
+        return
+    index['_paths'].pop(doc['id'], None)
+    index.pop('_field_avg', None)
+    prefix = f"{doc['id']}:"
+    postings = index['postings']
+    for term in doc.get('terms', '').split():
+        entry = postings.get(term)
+        if entry is None:
+            continue
+        parts = [part for part in entry.split(';') if not part.startswith(prefix)]
+        if parts:
+            postings[term] = ';'.join(parts)
+        else:
+            del postings[term]
+
+
+def new_index() -> dict:
+    """Empty index skeleton."""
+    now = datetime.now().isoformat()
+    return {
+        'version': INDEX_VERSION,
+        'built': now,
+        'updated': now,
+        'generation': 0,
+        'last_refresh': {},
+        'next_id': 0,
+        'docs': {},
+        'postings': {},
+        '_paths': {},  # doc_id -> relpath; runtime only, not persisted
+    }
+
+
+def build_index(agent_root: Path, corpus: dict, classify=None, jobs: int = 1) -> dict:
+    """Build a fresh index over a corpus listing from list_corpus()."""
+    index = new_index()
+    refresh_index(index, agent_root, corpus, classify=classify, jobs=jobs)
+    return index
+
+
+PARALLEL_MIN_FILES = 64  # below this, worker start-up costs more than it saves
+
+
+def prepare_documents(agent_root: Path, work: list, classify=None, jobs: int = 1) -> list:
+    """prepare_document over [(rel, entry, content)], in order.
+
+    With jobs > 1 and enough files the work is sharded across a process
+    pool (workers read the files themselves); results keep input order, so
+    doc ids are assigned deterministically. Falls back to serial when a
+    pool cannot be started.
+    """
+    if jobs > 1 and len(work) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        tasks = [(agent_root, rel, entry, None, classify) for rel, entry, _ in work]
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                return list(pool.map(_prepare_task, tasks,
+                                     chunksize=max(1, len(tasks) // (jobs * 4))))
+        except (OSError, RuntimeError, ImportError):
+            pass  # no process support here (sandbox, frozen build): serial
+    return [prepare_document(agent_root, rel, entry, content, classify)
+            for rel, entry, content in work]
+
+
+def refresh_index(index: dict, agent_root: Path, corpus: dict, classify=None,
+                  jobs: int = 1) -> dict:
+    """Bring the index in line with a corpus listing, reprocessing only drift.
+
+    Returns:
+        {'added', 'changed', 'deleted', 'touched'} counts; 'touched' files had
+        new stat data but identical content and were not re-tokenized
+    """
+    docs = index['docs']
+    delta = {'added': 0, 'changed': 0, 'deleted': 0, 'touched': 0}
+
+    for rel in [rel for rel in docs if rel not in corpus]:
+        remove_document(index, rel)
+        delta['deleted'] += 1
+
+    work = []  # (rel, entry, content) to (re)tokenize, in corpus order
+    for rel, entry in corpus.items():
+        doc = docs.get(rel)
+        if doc is None:
+            work.append((rel, entry, None))
+            delta['added'] += 1
+            continue
+        if [doc['mtime_ns'], doc['size'], doc['surface']] == entry:
+            continue
+        content = read_document(agent_root, rel)
+        if (content is not None and doc.get('sha1') == content_hash(content)
+                and doc['surface'] == entry[2]):
+            doc['mtime_ns'], doc['size'] = entry[0], entry[1]
+            delta['touched'] += 1
+            continue
+        remove_document(index, rel)
+        work.append((rel, entry, content))
+        delta['changed'] += 1
+
+    pending = {}
+    prepared = prepare_documents(agent_root, work, classify=classify, jobs=jobs)
+    for (rel, entry, _), result in zip(work, prepared):
+        add_document(index, agent_root, rel, entry, pending=pending, prepared=result)
+    flush_postings(index, pending)
+
+    if delta['added'] or delta['changed'] or delta['deleted']:
+        index['generation'] += 1
+    if any(delta.values()):
+        index['updated'] = datetime.now().isoformat()
+    index['last_refresh'] = delta
+    return delta
+
+
+def fingerprint(index: dict) -> dict:
+    """Corpus listing the index was built from (list_corpus() shape)."""
+    return {rel: [d['mtime_ns'], d['size'], d['surface']]
+            for rel, d in index['docs'].items()}
+
+
+def load_index(agent_root: Path):
+    """Load the on-disk index; None when missing, corrupt, or another version."""
+    path = agent_root / INDEX_RELPATH
+    try:
+        index = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+        return None
+    index['_paths'] = {doc['id']: rel for rel, doc in index['docs'].items()}
+    return index
+
+
+def save_index(agent_root: Path, index: dict) -> bool:
+    """Atomically write the index. Returns False on failure (fail-soft)."""
+    path = agent_root / INDEX_RELPATH
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stored = {k: v for k, v in index.items() if not k.startswith('_')}
+        tmp.write_text(json.dumps(stored, separators=(',', ':')))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        return False
+
+
+def ensure_index(agent_root: Path, surface_globs: list, reindex: bool = False,
+                 classify=None, jobs: int = 1) -> dict:
+    """Return an index that matches the current corpus.
+
+    Loads the on-disk index and refreshes it incrementally; builds from
+    scratch on first use, version change, or reindex=True. classify is
+    passed to add_document for every (re)tokenized file; jobs > 1
+    tokenizes across a process pool.
+    """
+    corpus = list_corpus(agent_root, surface_globs)
+    index = None if reindex else load_index(agent_root)
+    if index is None:
+        index = build_index(agent_root, corpus, classify=classify, jobs=jobs)
+        save_index(agent_root, index)
+        return index
+    if fingerprint(index) == corpus:
+        index['last_refresh'] = {'added': 0, 'changed': 0, 'deleted': 0, 'touched': 0}
+        return index
+    refresh_index(index, agent_root, corpus, classify=classify, jobs=jobs)
+    save_index(agent_root, index)
+    return index
+
+
+def index_stats(index: dict, agent_root: Path) -> dict:
+    """Summary of an index for --index-stats."""
+    docs = index['docs']
+    surfaces = {}
+    for doc in docs.values():
+        surfaces[doc['surface']] = surfaces.get(doc['surface'], 0) + 1
+    try:
+        size_bytes = (agent_root / INDEX_RELPATH).stat().st_size
+    except OSError:
+        size_bytes = None
+    return {
+        'path': str(INDEX_RELPATH),
+        'version': index['version'],
+        'generation': index['generation'],
+        'built': index['built'],
+        'updated': index['updated'],
+        'documents': len(docs),
+        'unreadable': sum(1 for d in docs.values() if d.get('readable') is False),
+        'documents_by_surface': dict(sorted(surfaces.items())),
+        'terms': len(index['postings']),
+        'postings': sum(entry.count(';') + 1 for entry in index['postings'].values()),
+        'size_bytes': size_bytes,
+        'last_refresh': index.get('last_refresh', {}),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Query
+# ---------------------------------------------------------------------------
+
+def is_indexable(keyword: str) -> bool:
+    """True when the keyword is answerable from word postings alone.
+
+    Non-ASCII keywords are not: IGNORECASE pairs some of their letters
+    with characters fold_case keeps apart (e.g. σ and ς), so they are
+    regex-verified instead.
+    """
+    return keyword.isascii() and bool(_WORD_RE.fullmatch(keyword))
+
+
+def keyword_postings(index: dict, keyword: str, short_token_len: int) -> dict:
+    """Match offsets for one word-only keyword.
+
+    Returns:
+        {relpath: sorted haystack offsets}, identical to the starts of
+        re.finditer(_token_pattern(keyword), haystack, re.IGNORECASE)
+    """
+    k = keyword.lower()
+    postings = index['postings']
+    paths = index['_paths']
+    hits = {}
+    if len(keyword) <= short_token_len:
+        for suffix in INFLECTIONS:
+            entry = postings.get(k + suffix)
+            if entry is None:
+                continue
+            for doc_id, offsets in decode_postings(entry).items():
+                hits.setdefault(paths[doc_id], []).extend(offsets)
+    else:
+        step = len(k)
+        for term, entry in postings.items():
+            if k not in term:
+                continue
+            inner = []
+            i = term.find(k)
+            while i != -1:
+                inner.append(i)
+                i = term.find(k, i + step)
+            for doc_id, offsets in decode_postings(entry).items():
+                bucket = hits.setdefault(paths[doc_id], [])
+                for off in offsets:
+                    bucket.extend(off + i for i in inner)
+    for offsets in hits.values():
+        offsets.sort()
+    return hits
+
+
+def body_contains(index: dict, keyword: str) -> set:
+    """Docs whose body (not filename) contains a word-only keyword as a
+    case-folded substring — the compute_domain_boost test."""
+    k = keyword.lower()
+    found = set()
+    docs = index['docs']
+    paths = index['_paths']
+    for term, entry in index['postings'].items():
+        if k not in term:
+            continue
+        for part in entry.split(';'):
+            doc_id, _, offsets = part.partition(':')
+            rel = paths[int(doc_id)]
+            first = int(offsets.partition(',')[0])
+            if rel not in found and first < docs[rel]['body_len']:
+                found.add(rel)
+    return found
+
+
+def candidate_docs(index: dict, keyword: str):
+    """Superset of docs that can match a keyword carrying punctuation.
+
+    Every ASCII word piece of the keyword must appear inside some term of
+    the doc (non-ASCII pieces do not narrow; see is_indexable). Returns None
+    when there is no such piece (no narrowing possible).
+    """
+    pieces = [p for p in _WORD_RE.findall(keyword.lower()) if p.isascii()]
+    if not pieces:
+        return None
+    paths = index['_paths']
+    result = None
+    for piece in pieces:
+        docs = set()
+        for term, entry in index['postings'].items():
+            if piece in term:
+                docs.update(paths[doc_id] for doc_id in posting_ids(entry))
+        result = docs if result is None else result & docs
+        if not result:
+            break
+    return result
+
+
+# ---------------------------------------------------------------------------
+# BM25F ranking (study_topic --ranker bm25)
+#
+# Document field lengths are precomputed at index time; IDF comes from the
+# number of documents a keyword matches (its expanded postings), so it is
+# keyword-level, not term-level — "check" and "checks" share one IDF.
+# ---------------------------------------------------------------------------
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def corpus_stats(index: dict) -> tuple:
+    """(readable document count, average [body, heading, name] word counts)."""
+    if '_field_avg' not in index:
+        lengths = [d['lengths'] for d in index['docs'].values() if 'lengths' in d]
+        n = len(lengths)
+        index['_field_avg'] = (n, [sum(x[f] for x in lengths) / (n or 1) for f in range(3)])
+    return index['_field_avg']
+
+
+def idf(n: int, df: int) -> float:
+    """BM25 inverse document frequency (non-negative Robertson-Sparck Jones)."""
+    return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+
+def bm25f(index: dict, rel: str, kw_offsets: list, dfs: list, weights: list,
+          k1: float = BM25_K1, b: float = BM25_B) -> float:
+    """BM25F score of one document.
+
+    Args:
+        index: Study index
+        rel: Document relpath
+        kw_offsets: Match offsets per keyword (as for _assemble_match)
+        dfs: Number of documents each keyword matches
+        weights: Field weights [body, heading, name]
+
+    Returns:
+        Sum over keywords of idf * tf' / (k1 + tf'), where tf' is the
+        field-weighted, length-normalized term frequency
+    """
+    doc = index['docs'][rel]
+    n, avg = corpus_stats(index)
+    lengths = doc['lengths']
+    headings = decode_ints(doc['headings'])
+    body_len = doc['body_len']
+    norms = [(1 - b + b * lengths[f] / avg[f]) if avg[f] else 1.0 for f in range(3)]
+    score = 0.0
+    for offsets, df in zip(kw_offsets, dfs):
+        if not offsets:
+            continue
+        tf = [0, 0, 0]
+        for offset in offsets:
+            tf[field_of(offset, body_len, headings)] += 1
+        weighted = sum(weights[f] * tf[f] / norms[f] for f in range(3))
+        score += idf(n, df) * weighted / (k1 + weighted)
+    return score
@@ -26,14 +26,59 @@ Usage:
     python3 study_topic.py --topic "wind down"       # Research wind down
     python3 study_topic.py --topic "release" --json  # JSON output
     python3 study_topic.py --verify                  # Migration verification
+    python3 study_topic.py --topic "release" --no-index  # Bypass the study index
+    python3 study_topic.py --reindex                 # Rebuild the study index
+    python3 study_topic.py --index-stats             # Study index report
+    python3 study_topic.py --topic "release" --ranker bm25  # BM25F ranking
+    python3 study_topic.py --topic "release" --no-index --jobs 0  # Parallel scan
+    python3 study_topic.py --topic "release" --no-cache  # Bypass the result cache
+    python3 study_topic.py --topic "release" --jsonl --stream  # Streamed JSON lines
+    python3 study_topic.py --topic "release" --top 5  # Best 5 per surface
+
+Study index: queries are answered from .aget/cache/study_index.json
+(scripts/study_index.py), built on first use and refreshed when the searched
+surfaces change. Refresh is incremental: only added, deleted, or edited
+files are reprocessed. Results are identical to the direct scan (--no-index).
+
+Result cache: final findings are cached in .aget/cache/study_results.json
+(LRU) and dropped whenever any searched surface changes; --json reports
+'result_cache' hits. --no-cache (or --reindex) bypasses it.
+
+JSON lines (--jsonl): one {'type': 'surface'} record per surface, then a
+{'type': 'summary'} record (the --json document minus 'findings', plus
+per-surface 'counts'). --stream writes each surface record as soon as that
+surface is ranked; without the index, files are read surface by surface.
+
+Rankers: 'composite' (default; composite_score) or 'bm25' (BM25F over
+filename / heading / body fields with precomputed lengths; needs the index).
+Config: study_topic.ranker, study_topic.bm25_relevance_floor.
+
+Top K (--top K): only the K best results per surface are reported. On the
+index path, documents that cannot reach their surface's top K skip their
+domain-boost work. The direct scan has no score bound before a file is
+read, so it still reads and scores every file and only trims the output.
 """
 
+import os
+import sys
+
+# Thin client (scripts/agent_service.py): with AGET_SERVICE=1 a warm service
+# runs this script, so hand off before paying for the imports below.
+if __name__ == '__main__' and os.environ.get('AGET_SERVICE'):
+    try:
+        from agent_service import run_via_service
+    except ImportError:
+        run_via_service = None
+    _served = run_via_service(__file__) if run_via_service else None
+    if _served is not None:
+        sys.exit(_served)
+
 import argparse
-import importlib.util
 import json
 import re
-import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -106,14 +151,18 @@ def compute_purpose_boost(file_path_str, purpose_globs):
 def compute_domain_boost(content, domain_keywords):
     """Compute domain relevance boost based on keyword presence.
 
-    Returns 1.0 + 0.25 per matching keyword (max 2.0).
+    Returns 1.0 + 0.25 per matching keyword (max DOMAIN_BOOST_MAX).
 
     Implements: CAP-SESSION-007-07 (domain relevance weighting)
     """
     if not domain_keywords:
         return 1.0
-    matches = sum(1 for kw in domain_keywords if kw.lower() in content.lower())
-    return min(2.0, 1.0 + matches * 0.25)
+    folded = _fold_case(content)
+    matches = sum(1 for kw in domain_keywords if _fold_case(kw) in folded)
+    return min(DOMAIN_BOOST_MAX, 1.0 + matches * 0.25)
+
+
+DOMAIN_BOOST_MAX = 2.0  # cap; also bounds how far a boost can lift a score (--top)
 
 
 # ---------------------------------------------------------------------------
@@ -141,6 +190,18 @@ SHORT_TOKEN_LEN = 5      # tokens ≤ this use word-boundary matching (audit M4)
 FILENAME_BOOST = 3.0     # name/title match is the strongest feature (audit R2, #1757)
 RELEVANCE_FLOOR_DEFAULT = 2.0  # composite-score floor (audit R3, #1560); --no-floor escapes
 
+# BM25F ranker (--ranker bm25): field weights [body, heading, filename]. The
+# filename weight IS FILENAME_BOOST — the name feature enters BM25F as a field
+# rather than a post-hoc multiplier. Scores live on a different scale than
+# composite_score, hence a separate floor (config: bm25_relevance_floor).
+# Each term contributes at most IDF x saturation (< IDF), so a term common
+# across the corpus scores well below 1 wherever it matches; the default
+# floor keeps every match and leaves noise control to the ranking itself.
+HEADING_WEIGHT = 2.0
+BM25F_WEIGHTS = [1.0, HEADING_WEIGHT, FILENAME_BOOST]
+BM25_RELEVANCE_FLOOR_DEFAULT = 0.0
+RANKERS = ('composite', 'bm25')
+
 SURFACES_SEARCHED = [
     '.aget/evolution/L*.md', 'docs/patterns/PATTERN_*.md',
     'planning/PROJECT_PLAN*.md', 'sops/SOP_*.md', 'governance/*.md',
@@ -152,9 +213,21 @@ SURFACES_EXCLUDED = [
     'docs/ outside patterns/, planning/initiatives/, handoffs/, release-notes/, .claude/skills/ '
     '(unconfigured — candidates for a future scope ruling)',
 ]
+# Machine-readable twin of SURFACES_SEARCHED: (surface, base dir, glob, recursive).
+# Keep the two in step — the index and the scan path both walk this list.
+SURFACE_GLOBS = [
+    ('ldocs', '.aget/evolution', 'L*.md', False),
+    ('patterns', 'docs/patterns', 'PATTERN_*.md', False),
+    ('project_plans', 'planning', 'PROJECT_PLAN*.md', False),
+    ('sops', 'sops', 'SOP_*.md', False),
+    ('governance', 'governance', '*.md', False),
+    ('knowledge', 'knowledge', '*.md', True),
+    ('knowledge', 'ontology', '*.md', True),
+    ('inbox', 'inbox', '*.md', True),
+]
 
 
-def prepare_keywords(topic: str) -> list:
+def prepare_keywords(topic: str, stopwords=None) -> list:
     """Token hygiene (audit M1-M3): tokenize, drop punctuation-only tokens and
     stopwords, dedupe case-insensitively (order-preserving), fold trailing
     possessive ("supervisor's" -> "supervisor"). Light folds only — not a stemmer.
@@ -164,7 +237,12 @@ def prepare_keywords(topic: str) -> list:
     handling — a trailing comma ("health,") previously survived into the token
     and broke word-boundary matching silently. Internal punctuation survives
     ("v3.26" is untouched; only token edges are stripped).
+
+    stopwords: word set to drop; defaults to STOPWORDS unless the run disabled
+    the list (--keep-stopwords, where BM25 IDF discounts common words instead).
     """
+    if stopwords is None:
+        stopwords = STOPWORDS if _search_state['stopwords'] else ()
     raw = [kw for kw in topic.split() if re.search(r'\w', kw)]
     seen, out = set(), []
     for kw in raw:
@@ -173,7 +251,7 @@ def prepare_keywords(topic: str) -> list:
             continue
         kw = kw[:-2] if kw.lower().endswith("'s") else kw
         key = kw.lower()
-        if key in STOPWORDS or key in seen:
+        if key in stopwords or key in seen:
             continue
         seen.add(key)
         out.append(kw)
@@ -203,6 +281,94 @@ def composite_score(item: dict) -> float:
             * (1 + math.log2(count)))
 
 
+def _assemble_match(file_path: Path, keywords: list, kw_offsets: list, body_len: int,
+                    line_of, line_text, domain_boost=None):
+    """Shared tail of a topic match, so the scan and index paths rank identically.
+
+    Args:
+        file_path: Matched file
+        keywords: Hygiened keywords (may be empty for an all-punctuation topic)
+        kw_offsets: One list of match start offsets per searched keyword, in
+            keyword order; offsets index content + '\\n' + filename tokens
+        body_len: len(content); offsets at or beyond it are filename-derived
+        line_of: offset -> 0-based line number (None: skip context extraction)
+        line_text: 0-based line number -> raw line text
+        domain_boost: Optional zero-arg callable returning the domain boost
+
+    Returns:
+        Dict with match info or None if no match. 'contexts' is present only
+        when line readers are given.
+    """
+    if len(keywords) <= 1:
+        matches = kw_offsets[0] if kw_offsets else []
+    else:
+        # Multi-keyword: each searched independently, require majority coverage
+        keyword_matches = {kw for kw, offsets in zip(keywords, kw_offsets) if offsets}
+        # Require at least 50% of (hygiened) keywords present
+        min_required = max(1, (len(keywords) + 1) // 2) if len(keywords) >= 2 else 1
+        if len(keyword_matches) < min(min_required, len(keywords)):
+            return None
+        matches = [offset for offsets in kw_offsets for offset in offsets]
+
+    if not matches:
+        return None
+
+    # Extract context lines for first few matches
+    contexts = []
+    seen_lines = set()
+    for offset in (matches if line_of is not None else ()):
+        if offset >= body_len:
+            continue  # filename-derived match; no body context to show
+        line_start = line_of(offset)
+        if line_start in seen_lines:
+            continue
+        seen_lines.add(line_start)
+        context_line = line_text(line_start).strip()
+        if len(context_line) > 100:
+            context_line = context_line[:100] + '...'
+        contexts.append({
+            'line': line_start + 1,
+            'context': context_line
+        })
+        if len(contexts) >= 3:
+            break
+
+    result = {
+        'file': str(file_path.relative_to(get_agent_root())),
+        'match_count': len(matches),
+        'contexts': contexts
+    }
+    if line_of is None:
+        del result['contexts']
+    # Add keyword coverage for multi-word ranking
+    if len(keywords) > 1:
+        result['keyword_coverage'] = len(keyword_matches) / len(keywords)
+    # Add domain boost if keywords provided (CAP-SESSION-007-07)
+    if domain_boost is not None:
+        result['domain_boost'] = domain_boost()
+    # Filename boost (audit R2, #1757): a token in the file's own name is
+    # the strongest single relevance feature in the corpus.
+    stem = file_path.stem.lower()
+    if any(kw.lower() in stem for kw in keywords):
+        result['filename_boost'] = FILENAME_BOOST
+    result['score'] = composite_score(result)
+    return result
+
+
+def bm25_score(item: dict) -> float:
+    """Ranking contract for --ranker bm25: precomputed BM25F relevance (length-
+    and rarity-aware, filename as a weighted field) times the same epistemic
+    boosts composite_score applies."""
+    return (item['bm25']
+            * item.get('purpose_boost', 1.0)
+            * item.get('domain_boost', 1.0))
+
+
+def rank_score(item: dict) -> float:
+    """Score an item with whichever ranker produced it."""
+    return bm25_score(item) if 'bm25' in item else composite_score(item)
+
+
 def search_file_for_topic(file_path: Path, topic: str, case_insensitive: bool = True,
                           domain_keywords: list = None) -> dict:
     """Search a file for topic matches.
@@ -217,82 +383,652 @@ def search_file_for_topic(file_path: Path, topic: str, case_insensitive: bool =
         Dict with match info or None if no match
     """
     try:
+        if file_path.stat().st_size >= MMAP_MIN_BYTES:
+            match = _match_mapped(file_path, topic, case_insensitive, domain_keywords)
+            if match is not _UNMAPPED:
+                return match
         content = file_path.read_text()
-        flags = re.IGNORECASE if case_insensitive else 0
-
-        # Filename-index (instance fix 2026-06-26, canonicalized v3.26 C-26-11):
-        # filename tokens (raw stem + slug-normalized) join the searchable text,
-        # so a topic equal to an artifact's name surfaces that artifact even
-        # when the body never echoes the slug. Recall-half of audit R2/#1757;
-        # the rank-half is FILENAME_BOOST below.
-        fname_text = file_path.stem + ' ' + re.sub(r'[_\-.]+', ' ', file_path.stem)
-        haystack = content + '\n' + fname_text
-
-        # Token hygiene (v3.26 C-26-11): stopwords/dupes dropped, possessive folded
-        keywords = prepare_keywords(topic)
-        if len(keywords) <= 1:
-            single = keywords[0] if keywords else topic
-            matches = list(re.finditer(_token_pattern(single), haystack, flags))
+        return _match_content(file_path, content, topic, case_insensitive, domain_keywords)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+_WORD_RE = re.compile(r'\w+')
+_INFLECTIONS = ('', 's', 'es', 'ed', 'ing')  # _token_pattern's suffix group
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+_ASCII_FOLDS = str.maketrans('\u0130\u0131\u017f\u212a', 'iisk')  # the _FOLDS_TO_ASCII set
+
+
+def _fold_case(text: str) -> str:
+    """lower(), except İ ı ſ K fold to the ASCII letter re.IGNORECASE matches
+    them with. Length-preserving (lower() alone turns İ into two characters),
+    so offsets into the folded text are offsets into text."""
+    if _FOLDS_TO_ASCII.search(text):
+        text = text.translate(_ASCII_FOLDS)
+    return text.lower()
+
+
+@lru_cache(maxsize=64)
+def compile_matcher(searched: tuple, case_insensitive: bool = True):
+    """Compile searched keywords into one single-pass matcher.
+
+    Word-only keywords share one compiled alternation that finds, in a
+    single pass, every word containing any keyword; each hit word is then
+    dispatched per keyword with exact _token_pattern semantics (short:
+    whole word plus inflection, via a dict; long: substring occurrences).
+    A plain alternation cannot do this — it would drop the overlapping
+    per-keyword counts ("lesson" and "lessons" in "lessons") that
+    separate finditer passes report. Keywords carrying punctuation keep
+    their own regex, as do non-ASCII keywords under case_insensitive:
+    folding equals re.IGNORECASE matching only for ASCII keywords.
+
+    Returns:
+        haystack -> [[match start offsets] per keyword], identical to
+        re.finditer(_token_pattern(kw), haystack, flags) for each kw
+    """
+    flags = re.IGNORECASE if case_insensitive else 0
+    fold = _fold_case if case_insensitive else str
+    short, long, regex = {}, [], []
+    for i, kw in enumerate(searched):
+        if not _WORD_RE.fullmatch(kw) or (case_insensitive and not kw.isascii()):
+            regex.append((i, re.compile(_token_pattern(kw), flags)))
+        elif len(kw) <= SHORT_TOKEN_LEN:
+            for suffix in _INFLECTIONS:
+                short.setdefault(fold(kw + suffix), []).append(i)
         else:
-            # Multi-keyword: search each independently, require majority coverage
-            keyword_matches = {}
-            all_matches = []
-            for kw in keywords:
-                kw_matches = list(re.finditer(_token_pattern(kw), haystack, flags))
-                if kw_matches:
-                    keyword_matches[kw] = len(kw_matches)
-                    all_matches.extend(kw_matches)
-            # Require at least 50% of (hygiened) keywords present
-            min_required = max(1, (len(keywords) + 1) // 2) if len(keywords) >= 2 else 1
-            if len(keyword_matches) < min(min_required, len(keywords)):
-                return None
-            matches = all_matches
-
-        if not matches:
+            long.append((i, fold(kw)))
+    regex_ids = {i for i, _ in regex}
+    needles = sorted({re.escape(fold(kw)) for i, kw in enumerate(searched) if i not in regex_ids},
+                     key=len, reverse=True)
+    # One fold of the haystack, then a case-sensitive scan of the folded text
+    hits = re.compile('|'.join(needles)) if needles else None
+
+    def dispatch(word: str, start: int, offsets: list) -> None:
+        # word: one whole folded word found at start
+        for i in short.get(word, ()):
+            offsets[i].append(start)
+        for i, needle in long:
+            j = word.find(needle)
+            while j != -1:
+                offsets[i].append(start + j)
+                j = word.find(needle, j + len(needle))
+
+    def match(haystack: str) -> list:
+        offsets = [[] for _ in searched]
+        text = fold(haystack) if hits is not None else haystack
+        end = 0  # end of the last dispatched word; later hits inside it are covered
+        for hit in (hits.finditer(text) if hits is not None else ()):
+            if hit.start() < end:
+                continue
+            start = hit.start()
+            while start and _is_word_char(text[start - 1]):
+                start -= 1
+            end = _WORD_RE.match(text, hit.start()).end()
+            dispatch(text[start:end], start, offsets)
+        for i, pattern in regex:
+            offsets[i] = [m.start() for m in pattern.finditer(haystack)]
+        return offsets
+
+    match.dispatch = dispatch  # per-word step, for callers that find words themselves
+    return match
+
+
+def _match_content(file_path: Path, content: str, topic: str, case_insensitive: bool = True,
+                   domain_keywords: list = None, with_contexts: bool = True) -> dict:
+    """search_file_for_topic over already-read content (single-read callers).
+
+    with_contexts=False skips context-line extraction (the find_* reports
+    never show contexts).
+    """
+    # Filename-index (instance fix 2026-06-26, canonicalized v3.26 C-26-11):
+    # filename tokens (raw stem + slug-normalized) join the searchable text,
+    # so a topic equal to an artifact's name surfaces that artifact even
+    # when the body never echoes the slug. Recall-half of audit R2/#1757;
+    # the rank-half is FILENAME_BOOST in _assemble_match.
+    fname_text = file_path.stem + ' ' + re.sub(r'[_\-.]+', ' ', file_path.stem)
+    haystack = content + '\n' + fname_text
+
+    # Token hygiene (v3.26 C-26-11): stopwords/dupes dropped, possessive folded
+    keywords = prepare_keywords(topic)
+    searched = keywords if len(keywords) > 1 else [keywords[0] if keywords else topic]
+    kw_offsets = compile_matcher(tuple(searched), case_insensitive)(haystack)
+
+    # Line numbers from a newline offset table (bisect), built on first use
+    newlines = []
+
+    def line_of(offset):
+        if not newlines:
+            newlines.extend(m.start() for m in re.finditer('\n', content))
+            newlines.append(len(content))  # sentinel: end of the last line
+        return bisect_left(newlines, offset)
+
+    def line_text(line):
+        start = newlines[line - 1] + 1 if line > 0 else 0
+        return content[start:newlines[line]]
+
+    return _assemble_match(
+        file_path, keywords, kw_offsets, len(content),
+        line_of=line_of if with_contexts else None, line_text=line_text,
+        domain_boost=(lambda: compute_domain_boost(content, domain_keywords))
+        if domain_keywords else None)
+
+
+# Large files (exported knowledge notes, inbox dumps) are scanned through
+# mmap instead of read_text(): bytes are matched in fixed-size chunks and
+# only the reported context lines are decoded, so peak memory does not grow
+# with the file. Results equal _match_content's. The byte scan runs only when
+# that is guaranteed — ASCII word-only keywords, UTF-8 locale, no character
+# that case-folds onto ASCII — and otherwise reports _UNMAPPED so the
+# caller falls back to the text path.
+
+MMAP_MIN_BYTES = 1 << 20   # files at least this large are scanned via mmap
+MMAP_CHUNK = 1 << 20       # bytes lowered/matched per step (bounds the working set)
+_UNMAPPED = object()       # _match_mapped cannot guarantee text-path results
+_FOLDS_TO_ASCII = re.compile('[\u0130\u0131\u017f\u212a]')  # İ ı ſ K under IGNORECASE/lower()
+_WORDISH_BYTES = re.compile(rb'[A-Za-z0-9_\x80-\xff]*')  # superset of \w in UTF-8
+
+
+def _is_wordish_byte(byte: int) -> bool:
+    return byte >= 0x80 or byte == 0x5f or 0x30 <= byte <= 0x39 or 0x41 <= byte <= 0x5a \
+        or 0x61 <= byte <= 0x7a
+
+
+def _count_line_breaks(mm, start: int, stop: int) -> int:
+    """Universal-newline line breaks (\\r\\n, \\r, \\n) in mm[start:stop], chunked."""
+    count, previous_cr = 0, False
+    for a in range(start, stop, MMAP_CHUNK):
+        chunk = mm[a:min(a + MMAP_CHUNK, stop)]
+        count += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+        if previous_cr and chunk.startswith(b'\n'):
+            count -= 1  # \r\n split across chunks
+        previous_cr = chunk.endswith(b'\r')
+    return count
+
+
+def _mapped_line_reader(mm):
+    """(line_of, line_text) over a mapped file, text-mode line numbering."""
+    known = [(0, 0)]  # (offset, line) pairs, ascending; counting resumes from the nearest
+    spans = {}
+
+    def line_of(offset):
+        i = bisect_right(known, (offset, float('inf')))
+        base_offset, base_line = known[i - 1]
+        line = base_line + _count_line_breaks(mm, base_offset, offset)
+        if base_offset != offset:
+            known.insert(i, (offset, line))
+        if line not in spans:
+            start = max(mm.rfind(b'\n', 0, offset), mm.rfind(b'\r', 0, offset)) + 1
+            ends = [e for e in (mm.find(b'\n', offset), mm.find(b'\r', offset)) if e != -1]
+            spans[line] = (start, min(ends) if ends else len(mm))
+        return line
+
+    def line_text(line):
+        start, end = spans[line]
+        return mm[start:end].decode('utf-8')
+
+    return line_of, line_text
+
+
+def _match_mapped(file_path: Path, topic: str, case_insensitive: bool = True,
+                  domain_keywords: list = None, with_contexts: bool = True):
+    """search_file_for_topic for a large file, scanned through mmap.
+
+    Returns:
+        Match dict, None when nothing matches, or _UNMAPPED when only the
+        text path can guarantee identical results
+    """
+    import codecs
+    import locale
+    import mmap
+
+    keywords = prepare_keywords(topic)
+    searched = keywords if len(keywords) > 1 else [keywords[0] if keywords else topic]
+    if (not all(kw.isascii() and _WORD_RE.fullmatch(kw) for kw in searched)
+            or not all(kw.isascii() for kw in domain_keywords or ())
+            or codecs.lookup(locale.getpreferredencoding(False)).name != 'utf-8'):
+        return _UNMAPPED
+
+    matcher = compile_matcher(tuple(searched), case_insensitive)
+    needles = sorted({(kw.lower() if case_insensitive else kw).encode() for kw in searched},
+                     key=len, reverse=True)
+    hits = re.compile(b'|'.join(re.escape(n) for n in needles))
+    domain = {kw.lower().encode() for kw in domain_keywords or ()}
+    overlap = max(len(n) for n in [*needles, *domain]) - 1  # hits may straddle chunks
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    dontneed = getattr(mmap, 'MADV_DONTNEED', None)
+    released = 0
+
+    try:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            kw_offsets = [[] for _ in searched]
+            domain_found = set()
+            end = 0  # end of the last matched word run; later hits inside it are covered
+            for start in range(0, size, MMAP_CHUNK):
+                chunk = mm[start:start + MMAP_CHUNK]
+                if _FOLDS_TO_ASCII.search(decoder.decode(chunk, final=start + MMAP_CHUNK >= size)):
+                    return _UNMAPPED
+                window = chunk + mm[start + MMAP_CHUNK:start + MMAP_CHUNK + overlap]
+                lowered = window.lower() if case_insensitive or domain else window
+                for hit in hits.finditer(lowered if case_insensitive else window):
+                    pos = start + hit.start()
+                    if pos < end:
+                        continue
+                    # Widen to the run of possible word bytes; str semantics decide inside it
+                    run = pos
+                    while run and _is_wordish_byte(mm[run - 1]):
+                        run -= 1
+                    end = _WORDISH_BYTES.match(mm, pos).end()
+                    text = mm[run:end].decode('utf-8')
+                    if text.isascii():  # an ASCII run is exactly one \w word
+                        matcher.dispatch(text.lower() if case_insensitive else text, run, kw_offsets)
+                        continue
+                    for i, offsets in enumerate(matcher(text)):
+                        kw_offsets[i].extend(run + len(text[:o].encode('utf-8')) for o in offsets)
+                domain_found.update(n for n in domain if n in lowered)
+                behind = start - start % mmap.PAGESIZE
+                if dontneed is not None and behind > released:
+                    # Release pages already scanned: resident size stays ~one chunk
+                    try:
+                        mm.madvise(dontneed, released, behind - released)
+                        released = behind
+                    except OSError:
+                        dontneed = None
+
+            fname_text = file_path.stem + ' ' + re.sub(r'[_\-.]+', ' ', file_path.stem)
+            for i, offsets in enumerate(matcher(fname_text)):
+                kw_offsets[i].extend(size + 1 + o for o in offsets)
+
+            line_of, line_text = _mapped_line_reader(mm) if with_contexts else (None, None)
+            return _assemble_match(
+                file_path, keywords, kw_offsets, size,
+                line_of=line_of, line_text=line_text,
+                domain_boost=(lambda: min(DOMAIN_BOOST_MAX, 1.0 + 0.25 * sum(
+                    1 for kw in domain_keywords if kw.lower().encode() in domain_found)))
+                if domain_keywords else None)
+    except (ValueError, UnicodeDecodeError):
+        return _UNMAPPED  # emptied/truncated under us, or invalid UTF-8: text path decides
+
+
+# ---------------------------------------------------------------------------
+# Surface classifiers: per-surface metadata pulled from the same single read
+# as the topic match (L-doc title, plan activity). Stored in the study index
+# for the index path — bump study_index.INDEX_VERSION when output changes.
+# ---------------------------------------------------------------------------
+
+INBOX_WINDOW_DAYS = 14
+
+
+def classify_ldoc(path: Path, content: str) -> dict:
+    """L-doc title from first heading."""
+    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    return {'title': title_match.group(1) if title_match else path.stem}
+
+
+def classify_plan(path: Path, content: str) -> dict:
+    """PROJECT_PLAN activity.
+
+    v3.25 C-25-14 (gh#1809 + gh#1791): case-insensitive, Plan_Status-first.
+    Plans write "In Progress" (title case) — the old upper-case-only probe
+    rendered every live plan [inactive]. Prefer the disambiguated
+    Plan_Status header (CAP-PP-003); fall back to legacy header Status,
+    then to whole-content scan for pre-template-2.1 plans.
+    """
+    m = (re.search(r'\*\*Plan_Status\*\*:\s*([^\n]*)', content)
+         or re.search(r'\*\*Status\*\*:\s*([^\n]*)', content))
+    probe = m.group(1) if m else content
+    return {'is_active': 'IN PROGRESS' in probe.upper()}
+
+
+SURFACE_CLASSIFIERS = {
+    'ldocs': classify_ldoc,
+    'project_plans': classify_plan,
+}
+
+
+def classify_document(surface: str, path: Path, content: str) -> dict:
+    """Fan one parsed document out to its surface classifier (fail-soft)."""
+    classifier = SURFACE_CLASSIFIERS.get(surface)
+    if classifier is None:
+        return {}
+    try:
+        return classifier(path, content)
+    except Exception:
+        return {}
+
+
+# ---------------------------------------------------------------------------
+# Index-backed search (scripts/study_index.py). The index answers the same
+# question as search_file_for_topic for word-only keywords; topics carrying
+# punctuation use it to narrow candidates and then verify by regex scan.
+# Absence or failure of the index degrades to the scan path (ADR-004).
+# ---------------------------------------------------------------------------
+
+# Per-run search options (set by main) and the loaded index / memoized results.
+_search_state = {'enabled': True, 'reindex': False, 'ranker': 'composite',
+                 'stopwords': True, 'jobs': 1, 'stream': False, 'top': None,
+                 'index': None, 'results': {}}
+
+
+def get_study_index():
+    """Load (building on first use) the study index, or None to scan."""
+    if not _search_state['enabled']:
+        return None
+    if _search_state['index'] is None:
+        try:
+            import study_index
+            _search_state['index'] = study_index.ensure_index(
+                get_agent_root(), SURFACE_GLOBS, reindex=_search_state['reindex'],
+                classify=classify_document, jobs=_search_state['jobs'])
+        except Exception as e:
+            print(f"Warning: study index unavailable, scanning: {e}", file=sys.stderr)
+            _search_state['enabled'] = False
             return None
+    return _search_state['index']
 
-        # Extract context lines for first few matches
-        lines = content.split('\n')
-        contexts = []
-        seen_lines = set()
-        for match in matches:
-            if match.start() >= len(content):
-                continue  # filename-derived match; no body context to show
-            line_start = content.count('\n', 0, match.start())
-            if line_start in seen_lines:
+
+def _index_line_reader(path: Path, newlines_encoded: str, content: str = None):
+    """(line_of, line_text) for one indexed file; the file is read lazily."""
+    import study_index
+    from bisect import bisect_left
+
+    newlines = study_index.decode_ints(newlines_encoded)
+    loaded = [] if content is None else [content]
+
+    def line_text(line):
+        if not loaded:
+            loaded.append(path.read_text())
+        start = newlines[line - 1] + 1 if line > 0 else 0
+        end = newlines[line] if line < len(newlines) else None
+        return loaded[0][start:end]
+
+    return (lambda offset: bisect_left(newlines, offset)), line_text
+
+
+def index_search(index: dict, topic: str, domain_keywords: list = None,
+                 with_contexts: bool = False, ranker: str = 'composite',
+                 top: int = None) -> dict:
+    """Match every indexed document against a topic.
+
+    Word-only keywords are answered from postings. Keywords carrying
+    punctuation are regex-verified over the candidates the postings allow.
+
+    Args:
+        index: Study index (study_index.ensure_index)
+        topic: Topic to search for
+        domain_keywords: Optional domain keywords for boosting
+        with_contexts: Also extract context lines (reads each matched file).
+            The find_* reports never show contexts, so they skip this.
+        ranker: 'composite' (composite_score) or 'bm25' (bm25_score)
+        top: Optional per-surface K (--top). Documents that provably cannot
+            reach their surface's top K are dropped before their domain
+            boost is computed (no effect without domain keywords or with
+            contexts). The recency-windowed inbox surface is never pruned.
+
+    Returns:
+        {relpath: match dict} — same dicts search_file_for_topic returns
+        (plus 'bm25' under the BM25 ranker)
+    """
+    import study_index
+
+    agent_root = get_agent_root()
+    docs = index['docs']
+    keywords = prepare_keywords(topic)
+    searched = keywords if len(keywords) > 1 else [keywords[0] if keywords else topic]
+    indexable = [study_index.is_indexable(kw) for kw in searched]
+    per_kw = [study_index.keyword_postings(index, kw, SHORT_TOKEN_LEN) if ok else {}
+              for kw, ok in zip(searched, indexable)]
+
+    contents = {}  # regex-verified candidates: relpath -> content
+    if not all(indexable):
+        candidates = set().union(*per_kw)
+        for kw, ok in zip(searched, indexable):
+            if not ok:
+                narrowed = study_index.candidate_docs(index, kw)
+                candidates.update(docs if narrowed is None else narrowed)
+        for rel in sorted(candidates):
+            content = study_index.read_document(agent_root, rel)
+            if content is None:
                 continue
-            seen_lines.add(line_start)
-            if line_start < len(lines):
-                context_line = lines[line_start].strip()
-                if len(context_line) > 100:
-                    context_line = context_line[:100] + '...'
-                contexts.append({
-                    'line': line_start + 1,
-                    'context': context_line
-                })
-            if len(contexts) >= 3:
+            contents[rel] = content
+            haystack = content + '\n' + study_index.filename_text(Path(rel).stem)
+            for i, (kw, ok) in enumerate(zip(searched, indexable)):
+                if ok:
+                    continue
+                offsets = [m.start() for m in
+                           re.finditer(_token_pattern(kw), haystack, re.IGNORECASE)]
+                if offsets:
+                    per_kw[i][rel] = offsets
+
+    in_body = None
+    if domain_keywords and all(study_index.is_indexable(kw) for kw in domain_keywords):
+        in_body = {kw: study_index.body_contains(index, kw) for kw in domain_keywords}
+    dfs = [len(p) for p in per_kw]
+
+    def domain_boost(rel):
+        if in_body is not None:
+            hits = sum(1 for kw in domain_keywords if rel in in_body[kw])
+            return min(DOMAIN_BOOST_MAX, 1.0 + hits * 0.25)
+        content = contents.get(rel)
+        return compute_domain_boost(
+            content if content is not None else (agent_root / rel).read_text(), domain_keywords)
+
+    results = {}
+    for rel in sorted(set().union(*per_kw)):
+        doc = docs[rel]
+        path = agent_root / rel
+        line_of, line_text = (_index_line_reader(path, doc['newlines'], contents.get(rel))
+                              if with_contexts else (None, None))
+
+        kw_offsets = [p.get(rel, []) for p in per_kw]
+        try:
+            match = _assemble_match(path, keywords, kw_offsets, doc['body_len'],
+                                    line_of=line_of, line_text=line_text)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if not match:
+            continue
+        if ranker == 'bm25':
+            match['bm25'] = study_index.bm25f(index, rel, kw_offsets, dfs, BM25F_WEIGHTS)
+            match['score'] = bm25_score(match)
+        results[rel] = match
+    if not domain_keywords:
+        return results
+
+    # Domain boost last: it may read the file. The boost only multiplies a
+    # score, by at most DOMAIN_BOOST_MAX, so under top K each surface is
+    # visited best-bound-first and stops once the bound of the next document
+    # falls below the K-th exact score — no later document can reach top K.
+    import heapq
+    prune = top is not None and not with_contexts
+    groups = {}
+    for rel in results:
+        surface = docs[rel]['surface']
+        groups.setdefault(surface if prune and surface != 'inbox' else None, []).append(rel)
+    for surface, rels in groups.items():
+        if surface is not None:
+            rels.sort(key=lambda r: results[r]['score'], reverse=True)
+        best = []  # min-heap of the surface's top exact scores so far
+        for i, rel in enumerate(rels):
+            match = results[rel]
+            if surface is not None and len(best) >= top and match['score'] * DOMAIN_BOOST_MAX < best[0]:
+                for pruned in rels[i:]:
+                    del results[pruned]
                 break
+            try:
+                match['domain_boost'] = domain_boost(rel)
+            except (OSError, UnicodeDecodeError):
+                del results[rel]
+                continue
+            match['score'] = rank_score(match)
+            if surface is not None:
+                (heapq.heappush if len(best) < top else heapq.heappushpop)(best, match['score'])
+    return results
 
-        result = {
-            'file': str(file_path.relative_to(get_agent_root())),
-            'match_count': len(matches),
-            'contexts': contexts
-        }
-        # Add keyword coverage for multi-word ranking
-        if len(keywords) > 1:
-            result['keyword_coverage'] = len(keyword_matches) / len(keywords)
-        # Add domain boost if keywords provided (CAP-SESSION-007-07)
-        if domain_keywords:
-            result['domain_boost'] = compute_domain_boost(content, domain_keywords)
-        # Filename boost (audit R2, #1757): a token in the file's own name is
-        # the strongest single relevance feature in the corpus.
-        stem = file_path.stem.lower()
-        if any(kw.lower() in stem for kw in keywords):
-            result['filename_boost'] = FILENAME_BOOST
-        result['score'] = composite_score(result)
-        return result
+
+_DEFERRED = object()  # scan-path record not yet matched (inbox beyond the default window)
+
+
+def study_documents(topic: str, domain_keywords: list = None) -> list:
+    """Match every study surface against a topic in one pass.
+
+    Index path: the index refresh is the only corpus walk; matches come from
+    postings and classifier metadata from the index. Scan path: one
+    walk_surfaces traversal, each file read exactly once and fanned out to
+    the topic matcher and its surface classifier. Inbox files outside the
+    default recency window are not read unless a caller widens the window.
+    When streaming (--stream), no file is read here: each surface's records
+    stay deferred until surface_documents asks for that surface.
+    Memoized per run, so the find_* views share one pass.
+
+    Returns:
+        Records {'surface', 'path', 'mtime', 'match', 'meta'} in path order
+    """
+    import study_index
+
+    ranker = _search_state['ranker']
+    index = get_study_index()
+    key = (topic, tuple(domain_keywords or ()), ranker, _search_state['stopwords'],
+           _search_state['top'], index is not None)
+    if key in _search_state['results']:
+        return _search_state['results'][key]
+
+    agent_root = get_agent_root()
+    records = []
+    if index is not None:
+        docs = index['docs']
+        for rel, match in index_search(index, topic, domain_keywords, ranker=ranker,
+                                       top=_search_state['top']).items():
+            doc = docs[rel]
+            records.append({'surface': doc['surface'], 'path': agent_root / rel,
+                            'mtime': doc['mtime_ns'] / 1e9, 'match': match,
+                            'meta': doc.get('meta', {})})
+    else:
+        import time
+        inbox_cutoff = time.time() - INBOX_WINDOW_DAYS * 86400
+        lazy = _search_state['stream']
+        walked, due = [], []
+        for surface, path, st in study_index.walk_surfaces(agent_root, SURFACE_GLOBS):
+            record = {'surface': surface, 'path': path, 'mtime': st.st_mtime,
+                      'match': _DEFERRED, 'meta': {}}
+            walked.append(record)
+            if not lazy and (surface != 'inbox' or st.st_mtime >= inbox_cutoff):
+                due.append(record)
+        _resolve_records(due, topic, domain_keywords, _search_state['jobs'])
+        records = walked if lazy else [r for r in walked if r['match'] is not None]
+    _search_state['results'][key] = records
+    return records
+
+
+PARALLEL_MIN_FILES = 64  # below this, process start-up costs more than it saves
+
+
+def _init_scan_worker(agent_root: str, stopwords: bool) -> None:
+    """Process-pool initializer: mirror the parent's agent root and options."""
+    global get_agent_root
+    root = Path(agent_root)
+    get_agent_root = lambda: root  # noqa: E731 — pin the parent's root in the worker
+    _search_state['stopwords'] = stopwords
+
+
+def _scan_shard(shard: list, topic: str, domain_keywords: list = None) -> list:
+    """Process-pool worker: resolve a shard of (surface, path) records."""
+    out = []
+    for surface, path in shard:
+        record = {'surface': surface, 'path': path}
+        _resolve_record(record, topic, domain_keywords)
+        out.append((record['match'], record.get('meta', {})))
+    return out
+
+
+def _resolve_records(records: list, topic: str, domain_keywords: list = None,
+                     jobs: int = 1) -> None:
+    """Resolve scan records in place, sharded across a process pool when jobs > 1.
+
+    Shards are contiguous slices and results are merged back in input order,
+    so the outcome (and every later stable sort) matches the serial scan.
+    Falls back to serial when a pool cannot be started.
+    """
+    if jobs > 1 and len(records) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        items = [(r['surface'], r['path']) for r in records]
+        size = max(1, -(-len(items) // (jobs * 4)))
+        shards = [items[i:i + size] for i in range(0, len(items), size)]
+        try:
+            with ProcessPoolExecutor(
+                    max_workers=jobs, initializer=_init_scan_worker,
+                    initargs=(str(get_agent_root()), _search_state['stopwords'])) as pool:
+                futures = [pool.submit(_scan_shard, shard, topic, domain_keywords)
+                           for shard in shards]
+                resolved = [item for future in futures for item in future.result()]
+            for record, (match, meta) in zip(records, resolved):
+                record['match'], record['meta'] = match, meta
+            return
+        except (OSError, RuntimeError, ImportError):
+            pass  # no process support here (sandbox, frozen build): serial
+    for record in records:
+        _resolve_record(record, topic, domain_keywords)
+
+
+def _resolve_record(record: dict, topic: str, domain_keywords: list = None) -> None:
+    """Read a scan-path record once: topic match plus surface classification."""
+    path = record['path']
+    try:
+        if (record['surface'] not in SURFACE_CLASSIFIERS
+                and path.stat().st_size >= MMAP_MIN_BYTES):
+            match = _match_mapped(path, topic, domain_keywords=domain_keywords,
+                                  with_contexts=False)
+            if match is not _UNMAPPED:
+                record['match'] = match
+                return
+        content = path.read_text()
     except (OSError, UnicodeDecodeError):
-        return None
+        record['match'] = None
+        return
+    record['match'] = _match_content(path, content, topic, domain_keywords=domain_keywords,
+                                     with_contexts=False)
+    if record['match'] is not None:
+        record['meta'] = classify_document(record['surface'], path, content)
+
+
+def surface_documents(surface: str, topic: str, domain_keywords: list = None,
+                      min_mtime: float = None) -> list:
+    """Matched records for one study surface (a view over study_documents).
+
+    Args:
+        surface: Surface name from SURFACE_GLOBS (e.g. 'ldocs')
+        topic: Topic to search for
+        domain_keywords: Optional domain keywords for boosting
+        min_mtime: Optional recency cutoff (epoch seconds); older files skipped
+
+    Returns:
+        Records {'surface', 'path', 'mtime', 'match', 'meta'} in path order
+    """
+    selected = [r for r in study_documents(topic, domain_keywords)
+                if r['surface'] == surface and (min_mtime is None or r['mtime'] >= min_mtime)]
+    _resolve_records([r for r in selected if r['match'] is _DEFERRED], topic,
+                     domain_keywords, _search_state['jobs'])
+    return [r for r in selected if r['match'] is not None]
+
+
+def rank_top(results: list) -> list:
+    """Rank a surface's results by score; under --top K keep only the K best.
+
+    heapq.nlargest keeps a bounded K-heap and equals the first K items of the
+    full stable sort, ties included. Output trimming only: every result was
+    already scored (index_search prunes earlier; the scan path cannot).
+    """
+    top = _search_state['top']
+    if top is None:
+        results.sort(key=lambda x: x['score'], reverse=True)
+        return results
+    import heapq
+    return heapq.nlargest(top, results, key=lambda x: x['score'])
 
 
 def search_directory(path: Path, topic: str, extensions: list = None,
@@ -329,7 +1065,7 @@ def search_directory(path: Path, topic: str, extensions: list = None,
     # Composite ranking (v3.26 C-26-11): recompute score once purpose_boost is
     # attached; log-damped count per the ranking contract (audit R1).
     for x in results:
-        x['score'] = composite_score(x)
+        x['score'] = rank_score(x)
     results.sort(key=lambda x: x['score'], reverse=True)
     return results
 
@@ -344,36 +1080,20 @@ def find_ldocs(topic: str, domain_keywords: list = None) -> list:
     Returns:
         List of matching L-doc info
     """
-    agent_root = get_agent_root()
-    evolution_path = agent_root / '.aget' / 'evolution'
-
     results = []
-    if not evolution_path.exists():
-        return results
+    for doc in surface_documents('ldocs', topic, domain_keywords):
+        file, match = doc['path'], doc['match']
+        results.append({
+            'ldoc': file.stem,
+            'title': doc['meta'].get('title', file.stem),  # classify_ldoc
+            'file': match['file'],
+            'match_count': match['match_count'],
+            'keyword_coverage': match.get('keyword_coverage', 1.0),
+            'domain_boost': match.get('domain_boost', 1.0),
+            'score': match.get('score', 0.0)
+        })
 
-    for file in evolution_path.glob('L*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-        if match:
-            # Extract L-doc title from first heading
-            try:
-                content = file.read_text()
-                title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-                title = title_match.group(1) if title_match else file.stem
-            except Exception:
-                title = file.stem
-
-            results.append({
-                'ldoc': file.stem,
-                'title': title,
-                'file': match['file'],
-                'match_count': match['match_count'],
-                'keyword_coverage': match.get('keyword_coverage', 1.0),
-                'domain_boost': match.get('domain_boost', 1.0),
-                'score': match.get('score', 0.0)
-            })
-
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return rank_top(results)
 
 
 def find_patterns(topic: str, domain_keywords: list = None) -> list:
@@ -386,25 +1106,17 @@ def find_patterns(topic: str, domain_keywords: list = None) -> list:
     Returns:
         List of matching pattern info
     """
-    agent_root = get_agent_root()
-    patterns_path = agent_root / 'docs' / 'patterns'
-
     results = []
-    if not patterns_path.exists():
-        return results
-
-    for file in patterns_path.glob('PATTERN_*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-        if match:
-            results.append({
-                'pattern': file.stem,
-                'file': match['file'],
-                'match_count': match['match_count'],
-                'score': match.get('score', 0.0)
-            })
+    for doc in surface_documents('patterns', topic, domain_keywords):
+        file, match = doc['path'], doc['match']
+        results.append({
+            'pattern': file.stem,
+            'file': match['file'],
+            'match_count': match['match_count'],
+            'score': match.get('score', 0.0)
+        })
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return rank_top(results)
 
 
 def find_project_plans(topic: str, domain_keywords: list = None) -> list:
@@ -417,41 +1129,18 @@ def find_project_plans(topic: str, domain_keywords: list = None) -> list:
     Returns:
         List of matching plan info
     """
-    agent_root = get_agent_root()
-    planning_path = agent_root / 'planning'
-
     results = []
-    if not planning_path.exists():
-        return results
+    for doc in surface_documents('project_plans', topic, domain_keywords):
+        file, match = doc['path'], doc['match']
+        results.append({
+            'plan': file.name,
+            'file': match['file'],
+            'match_count': match['match_count'],
+            'is_active': doc['meta'].get('is_active', False),  # classify_plan
+            'score': match.get('score', 0.0)
+        })
 
-    for file in planning_path.glob('PROJECT_PLAN*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-        if match:
-            # Check if active
-            try:
-                content = file.read_text()
-                # v3.25 C-25-14 (gh#1809 + gh#1791): case-insensitive, Plan_Status-first.
-                # Plans write "In Progress" (title case) — the old upper-case-only probe
-                # rendered every live plan [inactive]. Prefer the disambiguated
-                # Plan_Status header (CAP-PP-003); fall back to legacy header Status,
-                # then to whole-content scan for pre-template-2.1 plans.
-                m = (re.search(r'\*\*Plan_Status\*\*:\s*([^\n]*)', content)
-                     or re.search(r'\*\*Status\*\*:\s*([^\n]*)', content))
-                probe = m.group(1) if m else content
-                is_active = 'IN PROGRESS' in probe.upper()
-            except Exception:
-                is_active = False
-
-            results.append({
-                'plan': file.name,
-                'file': match['file'],
-                'match_count': match['match_count'],
-                'is_active': is_active,
-                'score': match.get('score', 0.0)
-            })
-
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return rank_top(results)
 
 
 def find_sops(topic: str, domain_keywords: list = None) -> list:
@@ -464,25 +1153,17 @@ def find_sops(topic: str, domain_keywords: list = None) -> list:
     Returns:
         List of matching SOP info
     """
-    agent_root = get_agent_root()
-    sops_path = agent_root / 'sops'
-
     results = []
-    if not sops_path.exists():
-        return results
-
-    for file in sops_path.glob('SOP_*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-        if match:
-            results.append({
-                'sop': file.name,
-                'file': match['file'],
-                'match_count': match['match_count'],
-                'score': match.get('score', 0.0)
-            })
+    for doc in surface_documents('sops', topic, domain_keywords):
+        file, match = doc['path'], doc['match']
+        results.append({
+            'sop': file.name,
+            'file': match['file'],
+            'match_count': match['match_count'],
+            'score': match.get('score', 0.0)
+        })
 
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return rank_top(results)
 
 
 def find_knowledge(topic: str, domain_keywords: list = None) -> list:
@@ -495,21 +1176,15 @@ def find_knowledge(topic: str, domain_keywords: list = None) -> list:
     """
     agent_root = get_agent_root()
     results = []
-    for area in ('knowledge', 'ontology'):
-        base = agent_root / area
-        if not base.exists():
-            continue
-        for file in base.rglob('*.md'):
-            match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-            if match:
-                results.append({
-                    'doc': str(file.relative_to(agent_root)),
-                    'file': match['file'],
-                    'match_count': match['match_count'],
-                    'score': match.get('score', 0.0)
-                })
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    for doc in surface_documents('knowledge', topic, domain_keywords):
+        file, match = doc['path'], doc['match']
+        results.append({
+            'doc': str(file.relative_to(agent_root)),
+            'file': match['file'],
+            'match_count': match['match_count'],
+            'score': match.get('score', 0.0)
+        })
+    return rank_top(results)
 
 
 def find_governance(topic: str, domain_keywords: list = None) -> list:
@@ -522,29 +1197,22 @@ def find_governance(topic: str, domain_keywords: list = None) -> list:
     Returns:
         List of matching governance doc info
     """
-    agent_root = get_agent_root()
-    governance_path = agent_root / 'governance'
-
     results = []
-    if not governance_path.exists():
-        return results
+    for doc in surface_documents('governance', topic, domain_keywords):
+        file, match = doc['path'], doc['match']
+        results.append({
+            'doc': file.name,
+            'file': match['file'],
+            'match_count': match['match_count'],
+            'keyword_coverage': match.get('keyword_coverage', 1.0),
+            'score': match.get('score', 0.0)
+        })
 
-    for file in governance_path.glob('*.md'):
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-        if match:
-            results.append({
-                'doc': file.name,
-                'file': match['file'],
-                'match_count': match['match_count'],
-                'keyword_coverage': match.get('keyword_coverage', 1.0),
-                'score': match.get('score', 0.0)
-            })
-
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    return rank_top(results)
 
 
-def find_inbox(topic: str, domain_keywords: list = None, window_days: int = 14) -> list:
+def find_inbox(topic: str, domain_keywords: list = None,
+               window_days: int = INBOX_WINDOW_DAYS) -> list:
     """Find recent inbox items related to topic (v3.26 C-26-11, gh#1850).
 
     Scope ruling (audit S2 revisit, enacted with the search-contract change):
@@ -556,29 +1224,18 @@ def find_inbox(topic: str, domain_keywords: list = None, window_days: int = 14)
     """
     import time
     agent_root = get_agent_root()
-    inbox_path = agent_root / 'inbox'
 
     results = []
-    if not inbox_path.exists():
-        return results
-
     cutoff = time.time() - window_days * 86400
-    for file in inbox_path.rglob('*.md'):
-        try:
-            if file.stat().st_mtime < cutoff:
-                continue
-        except OSError:
-            continue
-        match = search_file_for_topic(file, topic, domain_keywords=domain_keywords)
-        if match:
-            results.append({
-                'doc': str(file.relative_to(agent_root)),
-                'file': match['file'],
-                'match_count': match['match_count'],
-                'score': match.get('score', 0.0)
-            })
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results
+    for doc in surface_documents('inbox', topic, domain_keywords, min_mtime=cutoff):
+        file, match = doc['path'], doc['match']
+        results.append({
+            'doc': str(file.relative_to(agent_root)),
+            'file': match['file'],
+            'match_count': match['match_count'],
+            'score': match.get('score', 0.0)
+        })
+    return rank_top(results)
 
 
 def generate_report(topic: str, findings: dict, floor_info: dict = None) -> str:
@@ -723,6 +1380,7 @@ def call_extension_hook(payload):
     ext_path = get_agent_root() / 'scripts' / 'study_topic_ext.py'
     if not ext_path.exists():
         return payload
+    import importlib.util
     try:
         spec = importlib.util.spec_from_file_location('study_topic_ext', str(ext_path))
         module = importlib.util.module_from_spec(spec)
@@ -736,6 +1394,75 @@ def call_extension_hook(payload):
     return payload
 
 
+# ---------------------------------------------------------------------------
+# Query result cache
+#
+# Agents study the same or overlapping topics many times per session. Final
+# (floored) findings are cached in .aget/cache/study_results.json, keyed on
+# the normalized keywords, purpose, domain keywords, floor, ranker and
+# stopword mode, plus the inbox files inside the recency window. The whole
+# cache is dropped when the corpus signature — a digest of the stat listing
+# of every searched surface — changes, so any add/edit/delete invalidates
+# it without loading the index. The extension hook still runs on every hit.
+# Failure degrades to an uncached search (ADR-004).
+# ---------------------------------------------------------------------------
+
+RESULT_CACHE_RELPATH = Path('.aget') / 'cache' / 'study_results.json'
+RESULT_CACHE_VERSION = 1
+RESULT_CACHE_MAX_ENTRIES = 32  # LRU bound
+
+
+def corpus_signature(agent_root: Path) -> tuple:
+    """(digest of the searched-surface stat listing, in-window inbox files)."""
+    import hashlib
+    import time
+    import study_index
+    corpus = study_index.list_corpus(agent_root, SURFACE_GLOBS)
+    digest = hashlib.sha1(json.dumps(sorted(corpus.items())).encode()).hexdigest()
+    cutoff_ns = (time.time() - INBOX_WINDOW_DAYS * 86400) * 1e9
+    inbox = sorted(rel for rel, (mtime_ns, _, surface) in corpus.items()
+                   if surface == 'inbox' and mtime_ns >= cutoff_ns)
+    return digest, inbox
+
+
+def result_cache_key(topic: str, purpose: str, domain_keywords: list, floor,
+                     ranker: str, inbox: list) -> str:
+    """Cache key for one query: everything that shapes the findings.
+
+    Keywords are case-folded — the find_* searches are case-insensitive.
+    """
+    keywords = [kw.lower() for kw in prepare_keywords(topic) or [topic]]
+    return json.dumps([keywords, purpose, domain_keywords or [], floor, ranker,
+                       _search_state['stopwords'], _search_state['top'], inbox])
+
+
+def load_result_cache(agent_root: Path, digest: str) -> dict:
+    """Cached entries for this corpus signature ({} when absent or stale)."""
+    try:
+        cache = json.loads((agent_root / RESULT_CACHE_RELPATH).read_text())
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    if (not isinstance(cache, dict) or cache.get('version') != RESULT_CACHE_VERSION
+            or cache.get('corpus') != digest):
+        return {}
+    return cache.get('entries', {})
+
+
+def save_result_cache(agent_root: Path, digest: str, entries: dict) -> bool:
+    """Atomically write the cache, keeping the most recently used entries."""
+    path = agent_root / RESULT_CACHE_RELPATH
+    tmp = path.with_name(path.name + '.tmp')
+    kept = dict(list(entries.items())[-RESULT_CACHE_MAX_ENTRIES:])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({'version': RESULT_CACHE_VERSION, 'corpus': digest,
+                                   'entries': kept}, separators=(',', ':')))
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Study Topic Protocol - Focused Topic Research',
@@ -746,6 +1473,14 @@ Examples:
   python3 study_topic.py --topic "release" --json  # JSON output
   python3 study_topic.py --topic "L477"            # Find L477 references
   python3 study_topic.py --verify                  # Migration verification
+  python3 study_topic.py --topic "release" --no-index  # Direct scan, no index
+  python3 study_topic.py --reindex                 # Rebuild the study index
+  python3 study_topic.py --index-stats             # Study index report
+  python3 study_topic.py --topic "release" --ranker bm25  # BM25F ranking
+  python3 study_topic.py --topic "release" --no-index --jobs 0  # Parallel scan
+  python3 study_topic.py --topic "release" --no-cache  # Bypass the result cache
+  python3 study_topic.py --topic "release" --jsonl --stream  # Streamed JSON lines
+  python3 study_topic.py --topic "release" --top 5  # Best 5 per surface
         '''
     )
     parser.add_argument('--topic', '-t', type=str, help='Topic to research')
@@ -754,10 +1489,32 @@ Examples:
     parser.add_argument('--domain-keywords', nargs='*', metavar='KEYWORD',
                         help='Domain keywords for relevance boosting (CAP-SESSION-007-07)')
     parser.add_argument('--json', action='store_true', help='Output in JSON format')
+    parser.add_argument('--top', type=int, metavar='K',
+                        help='Keep only the K best results per surface (with the index, '
+                             'documents that cannot reach the top K skip domain-boost work; '
+                             'the direct scan still reads and scores every file)')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Output JSON lines: one record per surface, then a summary record')
+    parser.add_argument('--stream', action='store_true',
+                        help='With --jsonl: write each surface record as soon as it is ranked')
     parser.add_argument('--no-floor', action='store_true',
                         help='Disable the relevance floor (v3.26 C-26-11; useful for exhaustive ID lookups)')
     parser.add_argument('--verify', action='store_true', help='Verification mode for migration')
     parser.add_argument('--quiet', '-q', action='store_true', help='Minimal output')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Scan files directly instead of using the study index (.aget/cache/)')
+    parser.add_argument('--reindex', action='store_true',
+                        help='Rebuild the study index from scratch before searching')
+    parser.add_argument('--index-stats', action='store_true',
+                        help='Report study index statistics (documents, terms, last refresh) and exit')
+    parser.add_argument('--ranker', choices=RANKERS,
+                        help='Ranking model: composite (default) or bm25 (BM25F; requires the index)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Worker processes for scanning and index builds (0 = all cores; default 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the query result cache (.aget/cache/study_results.json)')
+    parser.add_argument('--keep-stopwords', action='store_true',
+                        help='Keep stopwords as keywords (pairs with --ranker bm25, whose IDF discounts them)')
 
     args = parser.parse_args()
 
@@ -766,6 +1523,47 @@ Examples:
         print("VERIFY: study_topic protocol (study_topic.py)")
         return 0
 
+    _search_state['enabled'] = not args.no_index
+    _search_state['reindex'] = args.reindex
+    _search_state['jobs'] = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.stream and not args.jsonl:
+        parser.error('--stream requires --jsonl')
+    if args.top is not None and args.top < 1:
+        parser.error('--top must be at least 1')
+    _search_state['top'] = args.top
+    _search_state['stream'] = args.stream
+
+    # Index report (refreshes first, so last_refresh shows what this run reprocessed)
+    if args.index_stats:
+        index = get_study_index()
+        if index is None:
+            print("Error: study index unavailable")
+            return 2
+        import study_index
+        stats = study_index.index_stats(index, get_agent_root())
+        if args.json:
+            print(json.dumps(stats, indent=2))
+        else:
+            print(f"Study index: {stats['path']} (v{stats['version']}, generation {stats['generation']})")
+            print(f"  Built: {stats['built']}  Updated: {stats['updated']}")
+            print(f"  Documents: {stats['documents']} ({stats['unreadable']} unreadable)")
+            for surface, count in stats['documents_by_surface'].items():
+                print(f"    {surface}: {count}")
+            print(f"  Terms: {stats['terms']}  Postings: {stats['postings']}")
+            if stats['size_bytes'] is not None:
+                print(f"  Size: {stats['size_bytes'] / 1024:.1f} KB")
+            refresh = stats['last_refresh']
+            print("  Last refresh: " + ", ".join(f"{k} {v}" for k, v in refresh.items()))
+        return 0
+
+    # Reindex with no topic: rebuild and report
+    if args.reindex and not args.topic:
+        if get_study_index() is None:
+            print("Error: study index unavailable")
+            return 2
+        print("Study index rebuilt")
+        return 0
+
     # Topic is required for actual research
     if not args.topic:
         print("Error: --topic is required for research")
@@ -781,26 +1579,80 @@ Examples:
     # Domain keywords: explicit flag > config > none
     domain_keywords = args.domain_keywords or config.get('domain_keywords')
 
-    # Perform focused research with epistemic parameters
-    findings = {
-        'ldocs': find_ldocs(args.topic, domain_keywords=domain_keywords),
-        'patterns': find_patterns(args.topic, domain_keywords=domain_keywords),
-        'project_plans': find_project_plans(args.topic, domain_keywords=domain_keywords),
-        'sops': find_sops(args.topic, domain_keywords=domain_keywords),
-        'governance': find_governance(args.topic, domain_keywords=domain_keywords),
-        'knowledge': find_knowledge(args.topic, domain_keywords=domain_keywords),
-        'inbox': find_inbox(args.topic, domain_keywords=domain_keywords)
-    }
+    # Ranker: explicit flag > config > composite. BM25 needs corpus statistics,
+    # which only the index carries — degrade to composite without it.
+    ranker = args.ranker or config.get('ranker', 'composite')
+    if ranker not in RANKERS:
+        ranker = 'composite'
+    if ranker == 'bm25' and get_study_index() is None:
+        print("Warning: --ranker bm25 requires the study index; using composite",
+              file=sys.stderr)
+        ranker = 'composite'
+    _search_state['ranker'] = ranker
+    _search_state['stopwords'] = not args.keep_stopwords
 
     # Relevance floor (v3.26 C-26-11; audit R3, gh#1560): suppress items whose
-    # composite score sits below the floor. Configurable; --no-floor escapes.
-    floor = None if args.no_floor else config.get('relevance_floor', RELEVANCE_FLOOR_DEFAULT)
-    suppressed = 0
-    if floor is not None:
-        for key in findings:
-            kept = [x for x in findings[key] if x.get('score', floor) >= floor]
-            suppressed += len(findings[key]) - len(kept)
-            findings[key] = kept
+    # score sits below the floor. Configurable per ranker; --no-floor escapes.
+    if args.no_floor:
+        floor = None
+    elif ranker == 'bm25':
+        floor = config.get('bm25_relevance_floor', BM25_RELEVANCE_FLOOR_DEFAULT)
+    else:
+        floor = config.get('relevance_floor', RELEVANCE_FLOOR_DEFAULT)
+
+    # Query result cache: a repeat query skips the search entirely
+    agent_root = get_agent_root()
+    cache_state = {'enabled': not (args.no_cache or args.reindex), 'hit': False}
+    if cache_state['enabled']:
+        try:
+            digest, inbox = corpus_signature(agent_root)
+            cache_key = result_cache_key(args.topic, purpose, domain_keywords, floor, ranker, inbox)
+            cache_entries = load_result_cache(agent_root, digest)
+        except Exception as e:
+            print(f"Warning: study result cache unavailable: {e}", file=sys.stderr)
+            cache_state['enabled'] = False
+    cached = cache_entries.pop(cache_key, None) if cache_state['enabled'] else None
+
+    # JSON-lines streaming: each surface record is written the moment that
+    # surface is ranked and floored (scan path: read on demand per surface)
+    streamed = set()
+
+    def emit_surface(surface, items):
+        if args.stream:
+            print(json.dumps({'type': 'surface', 'surface': surface, 'count': len(items),
+                              'results': items}, default=str), flush=True)
+            streamed.add(surface)
+
+    if cached is not None:
+        cache_state['hit'] = True
+        findings, suppressed = cached['findings'], cached['suppressed']
+        for surface, items in findings.items():
+            emit_surface(surface, items)
+    else:
+        # Perform focused research with epistemic parameters
+        finders = {
+            'ldocs': find_ldocs,
+            'patterns': find_patterns,
+            'project_plans': find_project_plans,
+            'sops': find_sops,
+            'governance': find_governance,
+            'knowledge': find_knowledge,
+            'inbox': find_inbox,
+        }
+        findings, suppressed = {}, 0
+        for surface, finder in finders.items():
+            items = finder(args.topic, domain_keywords=domain_keywords)
+            if floor is not None:
+                kept = [x for x in items if x.get('score', floor) >= floor]
+                suppressed += len(items) - len(kept)
+                items = kept
+            findings[surface] = items
+            emit_surface(surface, items)
+    if cache_state['enabled']:
+        # Re-inserted last: most recently used (hits included)
+        cache_entries[cache_key] = cached or {'findings': findings, 'suppressed': suppressed}
+        save_result_cache(agent_root, digest, cache_entries)
+        cache_state['entries'] = min(len(cache_entries), RESULT_CACHE_MAX_ENTRIES)
     floor_info = {'floor': floor, 'suppressed': suppressed} if floor is not None else None
 
     # Extension hook (v3.26 C-26-05) — instance surfaces/annotations join here
@@ -810,24 +1662,38 @@ Examples:
     floor_info = payload.get('floor_info', floor_info)
 
     # JSON output
-    if args.json:
+    if args.json or args.jsonl:
         output = {
             'timestamp': datetime.now().isoformat(),
-            'agent_path': str(get_agent_root()),
+            'agent_path': str(agent_root),
             'topic': args.topic,
             'purpose': purpose,
             'domain_keywords': domain_keywords,
             'findings': findings,
             'total_artifacts': sum(len(v) for v in findings.values() if isinstance(v, list)),
+            'result_cache': cache_state,
             'search_contract': {
                 'keywords': prepare_keywords(args.topic),
+                'ranker': ranker,
+                'top': args.top,
                 'surfaces_searched': SURFACES_SEARCHED,
                 'surfaces_excluded': SURFACES_EXCLUDED,
                 'relevance_floor': floor,
                 'suppressed_below_floor': suppressed if floor is not None else None
             }
         }
-        print(json.dumps(output, indent=2, default=str))
+        if not args.jsonl:
+            print(json.dumps(output, indent=2, default=str))
+            return 0
+        # JSON lines: one record per surface, then the summary. Surfaces the
+        # extension hook adds (or any surface, when not streaming) go out
+        # here; hook edits to an already-streamed surface are not re-sent.
+        for surface, items in output.pop('findings').items():
+            if surface not in streamed and isinstance(items, list):
+                print(json.dumps({'type': 'surface', 'surface': surface, 'count': len(items),
+                                  'results': items}, default=str))
+        output['counts'] = {k: len(v) for k, v in findings.items() if isinstance(v, list)}
+        print(json.dumps({'type': 'summary', **output}, default=str), flush=True)
         return 0
 
     # Human-readable output
@@ -18,12 +18,25 @@ Usage:
     python3 wake_up.py --json --pretty    # Pretty-printed JSON
     python3 wake_up.py --dir /path/agent  # Run on specific agent
     python3 wake_up.py --verify           # Migration verification (L491)
+    python3 wake_up.py --refresh          # Ignore the wake snapshot
 
 Exit codes:
     0: Success
     1: Agent structure validation failed
     2: Configuration error
 
+Probes: git status, pending work, release currency and the reliance
+validator run concurrently under one deadline (config wake_up.wake_deadline,
+default 15s, the validator's own timeout); a probe that fails or misses it
+degrades to its fail-soft default and is listed in 'deadline_exceeded'
+(ADR-004). Each probe's subprocess timeout is capped at the deadline, so
+none outlives wake-up.
+
+Snapshot: sections are cached in .aget/cache/wake_snapshot.json and reused
+while their source files are unchanged (release currency: for
+release_currency_ttl seconds); 'snapshot' in the JSON output lists what was
+reused. Git status is always live. --refresh recomputes everything.
+
 L021 Verification Table:
     | Check | Resource | Before Action |
     |-------|----------|---------------|
@@ -36,12 +49,22 @@ Author: aget-framework (canonical template)
 Version: 2.0.0 (v3.6.0)
 """
 
-import argparse
-import importlib.util
-import json
 import os
-import subprocess
 import sys
+
+# Thin client (scripts/agent_service.py): with AGET_SERVICE=1 a warm service
+# runs this script, so hand off before paying for the imports below.
+if __name__ == '__main__' and os.environ.get('AGET_SERVICE'):
+    try:
+        from agent_service import run_via_service
+    except ImportError:
+        run_via_service = None
+    _served = run_via_service(__file__) if run_via_service else None
+    if _served is not None:
+        sys.exit(_served)
+
+import argparse
+import json
 import time
 from datetime import datetime
 from pathlib import Path
@@ -76,6 +99,8 @@ DEFAULT_CONFIG = {
     'show_pending_work': True,  # gh#1285: surface prior session-note Pending Work
     'show_release_currency': True,  # gh#1833: release-currency signal (v3.26, C-26-01)
     'release_currency_timeout': 5,  # seconds; fail-soft budget for the network check
+    'wake_deadline': 15,  # seconds; overall probe budget (>= every probe's own timeout)
+    'release_currency_ttl': 3600,  # seconds a snapshotted release-currency result is reused
 }
 
 
@@ -111,7 +136,7 @@ def load_json_file(path: Path, default: Any = None) -> Any:
         return default
 
 
-def get_git_status(agent_path: Path) -> Dict[str, Any]:
+def get_git_status(agent_path: Path, timeout: float = 5) -> Dict[str, Any]:
     """Get git status for the agent directory.
 
     Returns the uncommitted-file list (`changes`), not just a clean/dirty
@@ -119,18 +144,36 @@ def get_git_status(agent_path: Path) -> Dict[str, Any]:
     than glossing "(dirty)" and later asserting "nothing changed" without
     having established a baseline. (Reconcile-dirty-tree-at-boot; promotes a
     one-off session critique into the script per L467 single-channel gap.)
+
+    Branch, upstream ahead/behind and changes come from one
+    `git status --porcelain=v2 --branch` (git_probe), given timeout seconds.
     """
+    try:
+        import git_probe
+    except ImportError:  # deployed without git_probe.py: legacy two-process probe
+        return _get_git_status_legacy(agent_path, timeout)
+    probe = git_probe.status(agent_path, timeout)
+    if probe is None:
+        return {'branch': 'unknown', 'clean': None, 'changes': []}
+    return {'branch': probe['branch'], 'clean': not probe['changes'],
+            'changes': probe['changes'], 'upstream': probe['upstream'],
+            'ahead': probe['ahead'], 'behind': probe['behind']}
+
+
+def _get_git_status_legacy(agent_path: Path, timeout: float = 5) -> Dict[str, Any]:
+    """get_git_status() via rev-parse + `status --porcelain` (pre-git_probe)."""
+    import subprocess
     try:
         result = subprocess.run(
             ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            capture_output=True, text=True, timeout=5,
+            capture_output=True, text=True, timeout=timeout,
             cwd=str(agent_path),
         )
         branch = result.stdout.strip() if result.returncode == 0 else 'unknown'
 
         result2 = subprocess.run(
             ['git', 'status', '--porcelain'],
-            capture_output=True, text=True, timeout=5,
+            capture_output=True, text=True, timeout=timeout,
             cwd=str(agent_path),
         )
         if result2.returncode == 0:
@@ -188,6 +231,7 @@ def get_release_currency(own_version: str, timeout: int = 5) -> Dict[str, Any]:
     Reference implementation: main-supervisor _release_banner (accepted at
     source, natural A/B evidence per #1833 p1 grant).
     """
+    import subprocess
     result: Dict[str, Any] = {'status': 'unknown', 'latest': None}
     try:
         # gh api (plain REST) — NOT `gh release view`: the latter blocks
@@ -231,19 +275,32 @@ def compute_active_agents_from_fleet_state(agent_path: Path) -> Optional[Dict[st
 
     Designed to be called from extension hooks (`scripts/wake_up_ext.py`) that surface
     fleet counts; framework-canonical helper, instance artifact opt-in. PyYAML dependency
-    fails gracefully (returns None) if not installed.
+    fails gracefully (returns None) if not installed. The parse is served from the
+    fleet_registry sidecar cache shared with fleet_scope.py while the file is unchanged.
     """
     fleet_state_path = agent_path / '.aget' / 'fleet' / 'FLEET_STATE.yaml'
     if not fleet_state_path.exists():
         return None
     try:
-        import yaml  # type: ignore[import-untyped]
+        import fleet_registry  # shared parsed-registry cache (also used by fleet_scope)
     except ImportError:
-        return None
-    try:
-        with open(fleet_state_path) as f:
-            data = yaml.safe_load(f) or {}
-    except (yaml.YAMLError, IOError):
+        fleet_registry = None
+    if fleet_registry is not None:
+        try:
+            data = fleet_registry.load_registry(fleet_state_path) or {}
+        except (fleet_registry.RegistryError, OSError):
+            return None
+    else:
+        try:
+            import yaml  # type: ignore[import-untyped]
+        except ImportError:
+            return None
+        try:
+            with open(fleet_state_path) as f:
+                data = yaml.safe_load(f) or {}
+        except (yaml.YAMLError, IOError):
+            return None
+    if not isinstance(data, dict):
         return None
 
     fleet = data.get('fleet') or {}
@@ -338,20 +395,177 @@ def get_pending_work(agent_path: Path, max_items: int = 10) -> Dict[str, Any]:
     return result
 
 
-def get_wake_data(agent_path: Path) -> Dict[str, Any]:
-    """Gather all data needed for wake output."""
-    data = {
-        'timestamp': datetime.now().isoformat(),
-        'agent_path': str(agent_path),
-        'valid': True,
-        'errors': [],
+RELIANCE_ERROR_PREFIX = 'validator error: '  # attestation that ran but did not conclude
+RELIANCE_TIMEOUT = 15  # seconds for the validator subprocess
+
+
+def get_reliance_attestation(agent_path: Path,
+                             timeout: float = RELIANCE_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """R-BND-001-03 self-attestation (v3.25, gh#1787).
+
+    When the reliance manifest and its validator are both present, attest
+    conformance at wake-up. Absence is silent (pre-adoption agents; L601
+    expected lag, not an error) and returns None. timeout bounds the
+    validator subprocess; the in-process attest() path takes no timeout of
+    its own and is bounded by the wake probe deadline it runs under.
+    """
+    manifest = agent_path / '.aget' / 'skill_reliance_manifest.yaml'
+    validator = agent_path / 'scripts' / 'check_skill_reliance_manifest.py'
+    if not (manifest.exists() and validator.exists()):
+        return None
+    # In-process via the validator's attest() (saves an interpreter start);
+    # the subprocess remains for validators that predate it.
+    import importlib.util
+    import subprocess
+    try:
+        spec = importlib.util.spec_from_file_location('_reliance_validator', str(validator))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if hasattr(module, 'attest'):
+            ok, summary = module.attest()
+            return {'ok': ok, 'summary': summary}
+    except Exception:
+        pass
+    try:
+        r = subprocess.run([sys.executable, str(validator)], capture_output=True,
+                           text=True, timeout=timeout, cwd=str(agent_path))
+        tail = (r.stdout or r.stderr).strip().splitlines()
+        return {
+            'ok': r.returncode == 0,
+            'summary': tail[-1] if tail else f'exit {r.returncode}',
+        }
+    except Exception as e:
+        return {'ok': False, 'summary': f'{RELIANCE_ERROR_PREFIX}{e}'}
+
+
+def run_wake_probes(probes: Dict[str, Any], deadline: float):
+    """Run independent wake probes concurrently under one overall deadline.
+
+    Each probe runs on a daemon thread, so one still blocked in a subprocess
+    at the deadline neither delays the wake output nor process exit; it is
+    abandoned and reported with its fallback (ADR-004). A probe that raises
+    also gets its fallback.
+
+    Args:
+        probes: {name: (zero-arg callable, fallback value)}
+        deadline: Seconds the whole batch may take
+
+    Returns:
+        ({name: result or fallback}, [names that missed the deadline])
+    """
+    import threading
+    results: Dict[str, Any] = {}
+
+    def run(name, probe, fallback):
+        try:
+            results[name] = probe()
+        except Exception:
+            results[name] = fallback
+
+    threads = []
+    for name, (probe, fallback) in probes.items():
+        thread = threading.Thread(target=run, args=(name, probe, fallback),
+                                  name=f'wake-{name}', daemon=True)
+        thread.start()
+        threads.append(thread)
+    end = time.monotonic() + deadline
+    for thread in threads:
+        thread.join(max(0.0, end - time.monotonic()))
+
+    done = dict(results)  # one snapshot: a probe finishing now is late in both views
+    late = [name for name in probes if name not in done]
+    return {name: done.get(name, fallback) for name, (_, fallback) in probes.items()}, late
+
+
+# =============================================================================
+# Wake snapshot (.aget/cache/wake_snapshot.json)
+# =============================================================================
+# Most wake-ups find the tree as the last wind-down left it. Each cacheable
+# section is stored with a cheap freshness signature (stat of its source
+# files); a matching signature reuses the section, anything else recomputes
+# it. Release currency is reused for release_currency_ttl seconds instead.
+# Git status is always live: unstaged edits leave no cheap trace, and a stale
+# dirty-tree list would defeat reconcile-dirty-tree-at-boot.
+
+WAKE_SNAPSHOT_RELPATH = Path('.aget') / 'cache' / 'wake_snapshot.json'
+WAKE_SNAPSHOT_VERSION = 1
+
+
+def _stat_signature(agent_path: Path, rels: list) -> list:
+    """[[rel, mtime_ns, size], ...] — None fields for missing paths."""
+    signature = []
+    for rel in rels:
+        try:
+            st = (agent_path / rel).stat()
+            signature.append([rel, st.st_mtime_ns, st.st_size])
+        except OSError:
+            signature.append([rel, None, None])
+    return signature
+
+
+def _newest_session_note(agent_path: Path) -> Optional[Path]:
+    """Most recently modified sessions/SESSION_*.md (case-folded, gh#1837)."""
+    sessions_dir = agent_path / 'sessions'
+    if not sessions_dir.is_dir():
+        return None
+    notes = [p for p in sessions_dir.glob('*.md') if p.name.lower().startswith('session_')]
+    return max(notes, key=lambda p: p.stat().st_mtime, default=None)
+
+
+def _reliance_inputs() -> list:
+    """Paths the reliance validator reads: health_check's CHECK_INPUTS entry
+    (manifest, validator, .claude/skills, archetype skills index)."""
+    try:
+        from health_check import CHECK_INPUTS
+        return list(CHECK_INPUTS['reliance_manifest'])
+    except (ImportError, KeyError):  # deployed without health_check.py
+        return ['.aget/skill_reliance_manifest.yaml', 'scripts/check_skill_reliance_manifest.py',
+                '.claude/skills']
+
+
+def wake_signatures(agent_path: Path) -> Dict[str, list]:
+    """Freshness signature per cacheable wake section."""
+    newest = _newest_session_note(agent_path)
+    return {
+        'version': _stat_signature(agent_path, ['.aget/version.json']),
+        'identity': _stat_signature(agent_path, ['.aget/identity.json', '.aget/version.json']),
+        # The root's mtime changes when a probed directory comes or goes
+        # (not .aget's own — the snapshot itself lives under .aget/cache)
+        'structure': _stat_signature(agent_path, ['.']),
+        'pending_work': _stat_signature(
+            agent_path, ['sessions'] + ([str(newest.relative_to(agent_path))] if newest else [])),
+        # The validator reads the tree: commits and staging move the git index
+        'reliance_attestation': _stat_signature(
+            agent_path, _reliance_inputs() + ['.git/index', '.git/HEAD']),
     }
 
-    # L021 Check 1: version.json
-    version_file = agent_path / '.aget' / 'version.json'
-    version_data = load_json_file(version_file, {})
 
-    data['version'] = {
+def load_wake_snapshot(agent_path: Path) -> Dict[str, Any]:
+    """Cached sections ({} when missing, corrupt, or another version)."""
+    snapshot = load_json_file(agent_path / WAKE_SNAPSHOT_RELPATH, {})
+    if not isinstance(snapshot, dict) or snapshot.get('version') != WAKE_SNAPSHOT_VERSION:
+        return {}
+    return snapshot.get('sections', {})
+
+
+def save_wake_snapshot(agent_path: Path, sections: Dict[str, Any]) -> bool:
+    """Atomically write the snapshot. Returns False on failure (fail-soft)."""
+    path = agent_path / WAKE_SNAPSHOT_RELPATH
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({'version': WAKE_SNAPSHOT_VERSION, 'sections': sections},
+                                  default=str))
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+def get_version_info(agent_path: Path) -> Dict[str, Any]:
+    """L021 Check 1: version.json."""
+    version_data = load_json_file(agent_path / '.aget' / 'version.json', {})
+    return {
         'aget_version': version_data.get('aget_version', 'unknown'),
         'updated': version_data.get('updated', ''),
         'agent_name': version_data.get('agent_name', agent_path.name),
@@ -359,82 +573,151 @@ def get_wake_data(agent_path: Path) -> Dict[str, Any]:
         'template': version_data.get('template', ''),
     }
 
-    # L021 Check 2: identity.json
-    identity_file = agent_path / '.aget' / 'identity.json'
-    identity_data = load_json_file(identity_file, {})
 
+def get_identity_info(agent_path: Path, agent_name: str) -> Dict[str, Any]:
+    """L021 Check 2: identity.json (name falls back to version.json's)."""
+    identity_data = load_json_file(agent_path / '.aget' / 'identity.json', {})
     north_star = identity_data.get('north_star', '')
     if isinstance(north_star, dict):
         north_star = north_star.get('statement', '')
-
-    data['identity'] = {
-        'name': identity_data.get('name', data['version']['agent_name']),
+    return {
+        'name': identity_data.get('name', agent_name),
         'north_star': north_star,
     }
 
-    # L021 Check 3: Structure validation
+
+def get_structure_info(agent_path: Path) -> Dict[str, Any]:
+    """L021 Check 3: required and optional directory presence."""
     required_dirs = ['.aget']
     optional_dirs = ['governance', 'sessions', 'planning']
+    return {
+        'required': {d: (agent_path / d).is_dir() for d in required_dirs},
+        'optional': {d: (agent_path / d).is_dir() for d in optional_dirs},
+    }
 
-    data['structure'] = {
-        'required': {},
-        'optional': {},
+
+def get_wake_data(agent_path: Path, use_snapshot: bool = True) -> Dict[str, Any]:
+    """Gather all data needed for wake output.
+
+    Args:
+        agent_path: Agent root
+        use_snapshot: Reuse fresh sections from the wake snapshot (--refresh
+            passes False; the snapshot is still rewritten)
+    """
+    data = {
+        'timestamp': datetime.now().isoformat(),
+        'agent_path': str(agent_path),
+        'valid': True,
+        'errors': [],
     }
 
-    for d in required_dirs:
-        exists = (agent_path / d).is_dir()
-        data['structure']['required'][d] = exists
+    # L021 Check 4: Config (C3 — config-driven display), merged with defaults
+    config_data = load_json_file(agent_path / '.aget' / 'config.json', {})
+    wake_config = config_data.get('wake_up', {})
+    config = {**DEFAULT_CONFIG, **wake_config}
+
+    snapshot = load_wake_snapshot(agent_path) if use_snapshot else {}
+    signatures = wake_signatures(agent_path)
+    sections: Dict[str, Any] = {}  # the snapshot written back
+    reused = []
+
+    def fresh(name):
+        entry = snapshot.get(name)
+        if isinstance(entry, dict) and 'value' in entry and entry.get('deps') == signatures[name]:
+            sections[name] = entry
+            reused.append(name)
+            return True
+        return False
+
+    def store(name, value):
+        sections[name] = {'deps': signatures[name], 'value': value}
+        return value
+
+    # L021 Checks 1-3: version, identity, structure
+    data['version'] = (sections['version']['value'] if fresh('version')
+                       else store('version', get_version_info(agent_path)))
+    data['identity'] = (sections['identity']['value'] if fresh('identity')
+                        else store('identity', get_identity_info(
+                            agent_path, data['version']['agent_name'])))
+    data['structure'] = (sections['structure']['value'] if fresh('structure')
+                         else store('structure', get_structure_info(agent_path)))
+    for d, exists in data['structure']['required'].items():
         if not exists:
             data['valid'] = False
             data['errors'].append(f"Missing required directory: {d}")
 
-    for d in optional_dirs:
-        data['structure']['optional'][d] = (agent_path / d).is_dir()
-
-    # L021 Check 4: Config (C3 — config-driven display)
-    config_file = agent_path / '.aget' / 'config.json'
-    config_data = load_json_file(config_file, {})
-    wake_config = config_data.get('wake_up', {})
-
-    # Merge with defaults
-    data['config'] = {**DEFAULT_CONFIG, **wake_config}
-
-    # Git status (conditional on config toggle)
-    if data['config'].get('show_git_status', True):
-        data['git'] = get_git_status(agent_path)
-
-    # Calendar awareness (CAP-SESSION-011)
-    if data['config'].get('show_calendar', True):
-        data['calendar'] = get_calendar_context(wake_config)
-
+    data['config'] = config
+
+    # Calendar awareness (CAP-SESSION-011) — local and cheap, computed inline
+    calendar = get_calendar_context(wake_config) if config.get('show_calendar', True) else None
+
+    # Release currency is reused within its TTL for the same local version
+    signatures['release_currency'] = [data['version']['aget_version']]
+    rc_entry = snapshot.get('release_currency')
+    rc_fresh = (isinstance(rc_entry, dict)
+                and time.time() - rc_entry.get('computed_at', 0) < config.get('release_currency_ttl', 3600)
+                and fresh('release_currency'))
+
+    # Independent probes (git, pending work, release currency, reliance
+    # attestation) run concurrently under one wake deadline; each fails soft
+    # to its own fallback, so a slow network or validator cannot stall the rest.
+    # Sections the snapshot still vouches for are not probed at all. Every
+    # subprocess timeout is capped at the deadline: a probe abandoned there
+    # has its child killed rather than left running after wake-up exits.
+    deadline = config.get('wake_deadline', DEFAULT_CONFIG['wake_deadline'])
+    probes = {}
+    if config.get('show_git_status', True):
+        probes['git'] = (lambda: get_git_status(agent_path, timeout=min(5, deadline)),
+                         {'branch': 'unknown', 'clean': None, 'changes': []})
     # Pending Work surfacing (gh#1285 — structural-not-discipline)
-    if data['config'].get('show_pending_work', True):
-        data['pending_work'] = get_pending_work(agent_path)
-
+    if config.get('show_pending_work', True) and not fresh('pending_work'):
+        probes['pending_work'] = (lambda: get_pending_work(agent_path),
+                                  {'source': None, 'items': [], 'truncated': False})
     # Release-currency signal (gh#1833, v3.26 C-26-01) — fail-soft, config-gated
-    if data['config'].get('show_release_currency', True):
-        data['release_currency'] = get_release_currency(
-            data['version']['aget_version'],
-            timeout=data['config'].get('release_currency_timeout', 5))
-
-    # R-BND-001-03 self-attestation (v3.25, gh#1787): when the reliance manifest
-    # and its validator are both present, attest conformance at wake-up. Absence
-    # is silent (pre-adoption agents; L601 expected lag, not an error).
-    manifest = agent_path / '.aget' / 'skill_reliance_manifest.yaml'
-    validator = agent_path / 'scripts' / 'check_skill_reliance_manifest.py'
-    if manifest.exists() and validator.exists():
-        import subprocess as _sp
-        try:
-            r = _sp.run([sys.executable, str(validator)], capture_output=True,
-                        text=True, timeout=15, cwd=str(agent_path))
-            tail = (r.stdout or r.stderr).strip().splitlines()
-            data['reliance_attestation'] = {
-                'ok': r.returncode == 0,
-                'summary': tail[-1] if tail else f'exit {r.returncode}',
-            }
-        except Exception as e:
-            data['reliance_attestation'] = {'ok': False, 'summary': f'validator error: {e}'}
-
+    if config.get('show_release_currency', True) and not rc_fresh:
+        probes['release_currency'] = (
+            lambda: get_release_currency(
+                data['version']['aget_version'],
+                timeout=min(config.get('release_currency_timeout', 5), deadline)),
+            {'status': 'unknown', 'latest': None})
+    if not fresh('reliance_attestation'):
+        probes['reliance_attestation'] = (
+            lambda: get_reliance_attestation(agent_path, timeout=min(RELIANCE_TIMEOUT, deadline)),
+            {'ok': False, 'summary': 'validator did not finish'})
+    results, late = run_wake_probes(probes, deadline)
+
+    # Only genuine results are snapshotted — never a fallback (deadline or
+    # raised probe), a validator error, or an 'unknown' currency, which would
+    # silence the signal for a whole TTL
+    def genuine(name):
+        return (name in results and name not in late
+                and results[name] is not probes[name][1])
+
+    if genuine('pending_work'):
+        store('pending_work', results['pending_work'])
+    ra = results.get('reliance_attestation')
+    if genuine('reliance_attestation') and not (
+            ra and str(ra.get('summary', '')).startswith(RELIANCE_ERROR_PREFIX)):
+        store('reliance_attestation', ra)
+    rc = results.get('release_currency')
+    if genuine('release_currency') and rc.get('status') != 'unknown':
+        store('release_currency', rc)
+        sections['release_currency']['computed_at'] = time.time()
+    for name in reused:
+        if name in ('pending_work', 'release_currency', 'reliance_attestation'):
+            results[name] = sections[name]['value']
+
+    # Assembled in the historical key order (JSON consumers diff this output)
+    for key in ('git', 'calendar', 'pending_work', 'release_currency', 'reliance_attestation'):
+        value = calendar if key == 'calendar' else results.get(key)
+        if value is not None:
+            data[key] = value
+    if late:
+        data['deadline_exceeded'] = late
+
+    data['snapshot'] = {'reused': reused, 'recomputed': sorted(set(sections) - set(reused))}
+    if set(reused) != set(sections) or set(sections) != set(snapshot):
+        save_wake_snapshot(agent_path, sections)
     return data
 
 
@@ -452,6 +735,7 @@ def call_extension_hook(agent_path: Path, data: Dict[str, Any],
     if not ext_path.exists():
         return data
 
+    import importlib.util
     try:
         spec = importlib.util.spec_from_file_location('wake_up_ext', str(ext_path))
         module = importlib.util.module_from_spec(spec)
@@ -512,6 +796,9 @@ def format_human_output(data: Dict[str, Any]) -> str:
     if config.get('show_git_status', True) and 'git' in data:
         git = data['git']
         status = 'clean' if git.get('clean') else 'dirty' if git.get('clean') is False else ''
+        drift = [f"{git[k]} {k}" for k in ('ahead', 'behind') if git.get(k)]
+        if drift:
+            status = ', '.join(([status] if status else []) + drift)
         if status:
             lines.append(f"Git: {git['branch']} ({status})")
         else:
@@ -626,10 +913,18 @@ Exit codes:
         '--verbose', '-v', action='store_true',
         help='Enable diagnostic output to stderr',
     )
+    parser.add_argument(
+        '--refresh', action='store_true',
+        help='Recompute every section instead of reusing the wake snapshot',
+    )
     parser.add_argument(
         '--verify', action='store_true',
         help='Migration verification: confirm script is at canonical path (L491)',
     )
+    parser.add_argument(
+        '--profile-startup', action='store_true',
+        help='Print an import-time breakdown against the start-up budget and exit',
+    )
     parser.add_argument(
         '--version', action='version',
         version='wake_up.py 2.0.0 (AGET v3.6.0)',
@@ -637,6 +932,10 @@ Exit codes:
 
     args = parser.parse_args()
 
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        return profile_startup(__file__)
+
     # L491: --verify mode
     if args.verify:
         script_path = Path(__file__).resolve()
@@ -673,7 +972,7 @@ Exit codes:
         log_diagnostic(f"Found agent at: {agent_path}")
 
     # Gather data
-    data = get_wake_data(agent_path)
+    data = get_wake_data(agent_path, use_snapshot=not args.refresh)
 
     if args.verbose:
         log_diagnostic(f"Data gathered, valid={data['valid']}")
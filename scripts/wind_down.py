@@ -43,10 +43,8 @@ Version: 2.0.0 (v3.6.0)
 """
 
 import argparse
-import importlib.util
 import json
 import os
-import subprocess
 import sys
 import time
 from datetime import datetime
@@ -172,6 +170,19 @@ def load_json_file(path: Path, default: Any = None) -> Any:
         return default
 
 
+def summarize_health(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a health_check.py report to the wind-down health summary."""
+    summary = data.get('summary', {})
+    return {
+        'status': data.get('status', 'unknown'),
+        'checks_passed': summary.get('passed', 0),
+        'checks_total': summary.get('total', 0),
+        'warnings': summary.get('warnings', 0),
+        'errors': summary.get('errors', 0),
+        'message': '',
+    }
+
+
 def run_health_check(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
     """CAP-SESSION-012: Run housekeeping health check before wind-down."""
     script_locations = [
@@ -196,24 +207,39 @@ def run_health_check(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
             'message': 'No health check script found',
         }
 
+    # In-process first: interpreter start-up and re-import dominated the
+    # wall time of a wind-down. The subprocess stays as the fallback for
+    # health_check.py copies that predate health_report() or fail to import.
+    # Incremental: passing checks whose inputs are unchanged are reused.
+    import importlib.util
+    import subprocess
     try:
-        result = subprocess.run(
-            [sys.executable, str(script_path), '--json'],
-            capture_output=True, text=True, timeout=30,
-            cwd=str(agent_path),
-        )
+        spec = importlib.util.spec_from_file_location('_wind_down_health', str(script_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if hasattr(module, 'health_report'):
+            return summarize_health(module.health_report(agent_path, verbose=verbose,
+                                                         incremental=True))
+    except Exception as e:
+        if verbose:
+            log_diagnostic(f"In-process health check unavailable, using subprocess: {e}")
+
+    try:
+        # Same incremental semantics as the in-process path; copies too old
+        # to know --incremental reject it as a usage error (exit 2, no
+        # output) and are re-run with --json alone.
+        for args in (['--json', '--incremental'], ['--json']):
+            result = subprocess.run(
+                [sys.executable, str(script_path), *args],
+                capture_output=True, text=True, timeout=30,
+                cwd=str(agent_path),
+            )
+            if not (result.returncode == 2 and not result.stdout):
+                break
 
         if result.stdout:
             try:
-                data = json.loads(result.stdout)
-                return {
-                    'status': data.get('status', 'unknown'),
-                    'checks_passed': data.get('summary', {}).get('passed', 0),
-                    'checks_total': data.get('summary', {}).get('total', 0),
-                    'warnings': data.get('summary', {}).get('warnings', 0),
-                    'errors': data.get('summary', {}).get('errors', 0),
-                    'message': '',
-                }
+                return summarize_health(json.loads(result.stdout))
             except json.JSONDecodeError:
                 pass
 
@@ -349,6 +375,14 @@ def scan_nuggets(agent_path: Path) -> List[Dict[str, Any]]:
 
 def get_uncommitted_changes(agent_path: Path) -> List[str]:
     """Check for uncommitted git changes."""
+    try:
+        import git_probe
+    except ImportError:
+        git_probe = None
+    if git_probe is not None:
+        probe = git_probe.status(agent_path)
+        return probe['changes'] if probe else []
+    import subprocess
     try:
         result = subprocess.run(
             ['git', 'status', '--porcelain'],
@@ -510,6 +544,7 @@ def call_extension_hook(agent_path: Path, data: Dict[str, Any],
     if not ext_path.exists():
         return data
 
+    import importlib.util
     try:
         spec = importlib.util.spec_from_file_location('wind_down_ext', str(ext_path))
         module = importlib.util.module_from_spec(spec)
@@ -692,6 +727,10 @@ Exit codes:
         '--verify', action='store_true',
         help='Migration verification: confirm script is at canonical path (L491)',
     )
+    parser.add_argument(
+        '--profile-startup', action='store_true',
+        help='Print an import-time breakdown against the start-up budget and exit',
+    )
     parser.add_argument(
         '--version', action='version',
         version='wind_down.py 2.0.0 (AGET v3.6.0)',
@@ -699,6 +738,10 @@ Exit codes:
 
     args = parser.parse_args()
 
+    if args.profile_startup:
+        from startup_profile import profile_startup
+        return profile_startup(__file__)
+
     # gh#1795 double-fire guard: recent close-session file wins; stub defers
     if not getattr(args, 'force', False):
         _recent = _recent_close_session_exists(Path.cwd())
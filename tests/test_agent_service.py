@@ -0,0 +1,185 @@
+"""
+Optional warm agent service tests (scripts/agent_service.py).
+
+A script served by the service must print the same bytes and exit with the
+same code as a direct run; without a service it runs in-process.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+SCRIPTS = REPO / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import agent_service  # noqa: E402
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    run = tmp_path / "run"
+    run.mkdir()
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(run))
+    return run
+
+
+@pytest.fixture
+def agent(tmp_path):
+    root = tmp_path / "agent"
+    (root / ".aget").mkdir(parents=True)
+    (root / ".aget/version.json").write_text(json.dumps({"aget_version": "3.26.0"}))
+    (root / "planning").mkdir()
+    (root / "planning/PROJECT_PLAN_x.md").write_text("**Gate_Status:** Pending\n")
+    return root
+
+
+@pytest.fixture
+def service(runtime_dir):
+    proc = subprocess.Popen([sys.executable, str(SCRIPTS / "agent_service.py"),
+                             "serve", "--idle", "30"], env=dict(os.environ))
+    sock = Path(agent_service.socket_path(str(SCRIPTS)))
+    deadline = time.time() + 10
+    while not sock.exists() and time.time() < deadline:
+        time.sleep(0.05)
+    yield proc
+    subprocess.run([sys.executable, str(SCRIPTS / "agent_service.py"), "stop"],
+                   capture_output=True)
+    proc.wait(timeout=10)
+
+
+def _run(script, *args, cwd, served):
+    env = dict(os.environ, AGET_SERVICE="1" if served else "")
+    return subprocess.run([sys.executable, str(SCRIPTS / script), *args],
+                          capture_output=True, cwd=str(cwd), env=env)
+
+
+def _served_count():
+    header, _, _ = agent_service._request({"op": "status"}, timeout=5)
+    return header["served"]
+
+
+def test_disabled_service_runs_in_process(monkeypatch):
+    monkeypatch.delenv("AGET_SERVICE", raising=False)
+    assert agent_service.run_via_service(str(SCRIPTS / "health_check.py"), []) is None
+
+
+def test_local_only_flags_stay_in_process(monkeypatch, runtime_dir):
+    monkeypatch.setenv("AGET_SERVICE", "1")
+    monkeypatch.setattr(agent_service, "_request",
+                        lambda *a, **k: pytest.fail("contacted the service"))
+    for argv in (["topic", "--jsonl", "--stream"], ["topic", "--jobs=4"]):
+        assert agent_service.run_via_service(str(SCRIPTS / "study_topic.py"), argv) is None
+
+
+def test_served_run_matches_direct_run(service, agent):
+    direct = _run("close_gate_check.py", "planning/PROJECT_PLAN_x.md", cwd=agent, served=False)
+    served = _run("close_gate_check.py", "planning/PROJECT_PLAN_x.md", cwd=agent, served=True)
+    assert (served.returncode, served.stdout, served.stderr) == \
+        (direct.returncode, direct.stdout, direct.stderr)
+    assert direct.returncode == 2
+    assert _served_count() == 1
+
+    direct = _run("health_check.py", "--json", cwd=agent, served=False)
+    served = _run("health_check.py", "--json", cwd=agent, served=True)
+    assert served.returncode == direct.returncode
+    strip = lambda d: [(c["name"], c["passed"], c["message"]) for c in d["checks"]]  # noqa: E731
+    assert strip(json.loads(served.stdout)) == strip(json.loads(direct.stdout))
+    assert _served_count() == 2
+
+
+def test_usage_errors_pass_through(service, agent):
+    direct = _run("close_gate_check.py", cwd=agent, served=False)
+    served = _run("close_gate_check.py", cwd=agent, served=True)
+    assert (served.returncode, served.stderr) == (direct.returncode, direct.stderr)
+    assert direct.returncode == 2  # argparse usage error
+
+
+def test_missing_service_is_started_for_next_time(runtime_dir, agent):
+    first = _run("close_gate_check.py", "planning/PROJECT_PLAN_x.md", cwd=agent, served=True)
+    assert first.returncode == 2  # ran in-process
+    sock = Path(agent_service.socket_path(str(SCRIPTS)))
+    deadline = time.time() + 10
+    while not sock.exists() and time.time() < deadline:
+        time.sleep(0.05)
+    try:
+        assert _served_count() == 0
+    finally:
+        agent_service._request({"op": "stop"}, timeout=5)
+
+
+def test_service_exits_when_idle(runtime_dir):
+    proc = subprocess.Popen([sys.executable, str(SCRIPTS / "agent_service.py"),
+                             "serve", "--idle", "0.3"])
+    assert proc.wait(timeout=10) == 0
+    assert not Path(agent_service.socket_path(str(SCRIPTS))).exists()
+
+
+# --- Trust boundary: private socket directory, same-uid peers, env allowlist ---
+
+def test_insecure_socket_directory_is_refused(runtime_dir, monkeypatch):
+    sock_dir = Path(agent_service.socket_path(str(SCRIPTS))).parent
+    sock_dir.mkdir(mode=0o755)
+    sock_dir.chmod(0o755)
+    proc = subprocess.run([sys.executable, str(SCRIPTS / "agent_service.py"), "serve"],
+                          capture_output=True, text=True, timeout=10)
+    assert proc.returncode == 1 and "mode 755" in proc.stderr
+    with pytest.raises(PermissionError):
+        agent_service._request({"op": "status"}, timeout=5)
+    sock_dir.rmdir()
+    sock_dir.symlink_to(runtime_dir)
+    with pytest.raises(PermissionError, match="not a directory"):
+        agent_service._secure_dir(str(sock_dir))
+    monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+    sock_dir.unlink()
+    with pytest.raises(PermissionError, match="owned by uid"):
+        agent_service._secure_dir(str(sock_dir), create=True)
+
+
+def test_foreign_peer_is_rejected(monkeypatch):
+    import socket
+    a, b = socket.socketpair()
+    with a, b:
+        agent_service._check_peer(a)  # same process, same uid
+        monkeypatch.setattr(agent_service, "_peer_uid", lambda conn: os.getuid() + 1)
+        with pytest.raises(PermissionError, match="peer runs as uid"):
+            agent_service._check_peer(a)
+
+
+def test_only_allowlisted_environment_is_sent():
+    env = agent_service.service_env({"PATH": "/bin", "HOME": "/h", "LC_ALL": "C",
+                                     "AGET_FLEET_STATE": "f", "GIT_DIR": "g",
+                                     "GITHUB_TOKEN": "secret", "AWS_SECRET_ACCESS_KEY": "k"})
+    assert env == {"PATH": "/bin", "HOME": "/h", "LC_ALL": "C", "AGET_FLEET_STATE": "f",
+                   "GIT_DIR": "g"}
+
+
+def test_stalled_client_does_not_block_the_service(service):
+    import socket
+    stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stalled.connect(agent_service.socket_path(str(SCRIPTS)))  # never sends a line
+    try:
+        started = time.monotonic()
+        assert _served_count() == 0
+        assert time.monotonic() - started < agent_service.REQUEST_TIMEOUT + 2
+    finally:
+        stalled.close()
+
+
+def test_service_timeout_falls_back_in_process(monkeypatch, runtime_dir):
+    import socket
+    monkeypatch.setenv("AGET_SERVICE", "1")
+    seen = []
+
+    def hung(message, timeout=None):
+        seen.append(timeout)
+        raise socket.timeout("timed out")
+
+    monkeypatch.setattr(agent_service, "_request", hung)
+    monkeypatch.setattr(agent_service, "start_service", lambda *a: pytest.fail("restarted"))
+    assert agent_service.run_via_service(str(SCRIPTS / "wake_up.py"), []) is None
+    assert seen == [agent_service.RUN_TIMEOUTS["wake_up"]]
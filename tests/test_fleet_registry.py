@@ -0,0 +1,123 @@
+"""
+Parsed-registry cache tests (scripts/fleet_registry.py).
+
+FLEET_STATE.yaml is parsed once per content change and the result shared
+by fleet_scope.py and wake_up.py through a sidecar cache.
+"""
+import datetime
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import fleet_registry  # noqa: E402
+import fleet_scope  # noqa: E402
+import wake_up  # noqa: E402
+
+REGISTRY = """\
+metadata:
+  active_agents: 3
+  updated: 2026-10-01
+fleet:
+  core:
+    agents:
+      - {name: alpha, location: ~/github/alpha, status: active}
+      - {name: beta, path: /srv/beta, status: active}
+  labs:
+    agents:
+      - {location: /srv/gamma, status: paused}
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(fleet_registry, "CACHE_DIR", cache)
+    fleet_registry._memo.clear()
+    return cache
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "agent/.aget/fleet/FLEET_STATE.yaml"
+    path.parent.mkdir(parents=True)
+    path.write_text(REGISTRY)
+    return path
+
+
+def _forbid_parse(monkeypatch):
+    monkeypatch.setattr(yaml, "load", lambda *a, **k: pytest.fail("re-parsed"))
+
+
+def test_sidecar_matches_safe_load_and_keeps_types(registry, cache_dir, monkeypatch):
+    expected = yaml.safe_load(registry.read_text())
+    assert fleet_registry.load_registry(registry) == expected
+    fleet_registry._memo.clear()
+    _forbid_parse(monkeypatch)
+    data = fleet_registry.load_registry(registry)
+    assert data == expected
+    assert isinstance(data["metadata"]["updated"], datetime.date)
+    assert fleet_registry.registry_records(registry) == [
+        ("alpha", "~/github/alpha"), ("beta", "/srv/beta"), (None, "/srv/gamma")]
+
+
+def test_touch_reuses_parse_edit_reparses(registry, cache_dir, monkeypatch):
+    fleet_registry.load_registry(registry)
+    st = registry.stat()
+    os.utime(registry, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    fleet_registry._memo.clear()
+    with monkeypatch.context() as m:
+        _forbid_parse(m)
+        fleet_registry.load_registry(registry)
+    registry.write_text(REGISTRY.replace("active_agents: 3", "active_agents: 2"))
+    assert fleet_registry.load_registry(registry)["metadata"]["active_agents"] == 2
+
+
+def test_corrupt_sidecar_is_rebuilt(registry, cache_dir):
+    fleet_registry.load_registry(registry)
+    sidecar, = cache_dir.iterdir()
+    sidecar.write_bytes(b"not a pickle")
+    fleet_registry._memo.clear()
+    assert fleet_registry.load_registry(registry)["metadata"]["active_agents"] == 3
+
+
+def test_sidecar_dir_is_private(registry, cache_dir):
+    fleet_registry.load_registry(registry)
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+
+def test_group_writable_sidecar_dir_is_never_unpickled(registry, cache_dir, monkeypatch):
+    fleet_registry.load_registry(registry)
+    cache_dir.chmod(0o777)
+    fleet_registry._memo.clear()
+    monkeypatch.setattr(fleet_registry.pickle, "load",
+                        lambda *a, **k: pytest.fail("unpickled from an insecure dir"))
+    assert fleet_registry.load_registry(registry)["metadata"]["active_agents"] == 3
+    assert fleet_registry._entry(registry)["source"] != "cache"
+
+
+def test_invalid_yaml_raises_registry_error(tmp_path, cache_dir):
+    bad = tmp_path / "FLEET_STATE.yaml"
+    bad.write_text("fleet: [unclosed\n")
+    with pytest.raises(fleet_registry.RegistryError):
+        fleet_registry.load_registry(bad)
+
+
+def test_prefers_libyaml_loader():
+    assert fleet_registry.safe_loader() is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def test_consumers_share_one_parse(registry, cache_dir, monkeypatch):
+    agents = fleet_scope.load_agents(registry)
+    assert [n for n, _ in agents] == ["alpha", "beta", "gamma"]
+    assert agents[0][1] == Path(os.path.expanduser("~/github/alpha"))
+    _forbid_parse(monkeypatch)
+    fleet = wake_up.compute_active_agents_from_fleet_state(registry.parents[2])
+    assert (fleet["filesystem_count"], fleet["metadata_count"], fleet["drift"]) == (2, 3, True)
+    assert fleet["portfolios"] == [{"name": "core", "active": 2}, {"name": "labs", "active": 0}]
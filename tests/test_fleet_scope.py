@@ -0,0 +1,243 @@
+"""
+Fleet scope scanner tests (scripts/fleet_scope.py).
+
+Seats are probed concurrently with a per-seat deadline; --queries answers
+many artifact questions in one pass and must agree with the single-flag modes.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+SCRIPT = REPO / "scripts/fleet_scope.py"
+sys.path.insert(0, str(REPO / "scripts"))
+
+import fleet_scope  # noqa: E402
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    seats = []
+    for i, body in enumerate(["a\n", "a\n", "b\n", None]):
+        seat = tmp_path / f"seat{i}"
+        (seat / "scripts").mkdir(parents=True)
+        if body is not None:
+            (seat / "scripts/x.py").write_text(body)
+        seats.append({"name": f"seat{i}", "location": str(seat)})
+    (tmp_path / "seat0/scripts/health_check.py").write_text("see SOP_p\n")
+    (tmp_path / "seat1/scripts/health_check.py").write_text("see SOP_p\n")
+    (tmp_path / "seat1/sops").mkdir()
+    (tmp_path / "seat1/sops/SOP_p.md").write_text("sop\n")
+    seats.append({"name": "gone", "location": str(tmp_path / "missing")})
+    registry = tmp_path / "FLEET_STATE.yaml"
+    registry.write_text(json.dumps({"agents": seats}))  # JSON is valid YAML
+    return registry
+
+
+def _run(registry, *args):
+    env = dict(os.environ, HOME=str(registry.parent))  # keep the hash cache in tmp
+    proc = subprocess.run([sys.executable, str(SCRIPT), "--registry", str(registry), *args, "--json"],
+                          capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout)
+
+
+def test_query_batch_matches_single_flag_modes(fleet, tmp_path):
+    questions = ["has scripts/x.py", "lacks scripts/x.py", "diverge scripts/x.py",
+                 "resolves scripts/health_check.py:SOP_p:sops/SOP_p.md"]
+    (tmp_path / "q.txt").write_text("# fleet questions\n\n" + "\n".join(questions) + "\n")
+    batch = _run(fleet, "--queries", str(tmp_path / "q.txt"))
+    assert (batch["agents"], batch["resolvable"], batch["unresolvable"]) == (5, 4, 1)
+    for question, answer in zip(questions, batch["queries"]):
+        kind, arg = question.split(" ", 1)
+        single = _run(fleet, f"--{kind}", arg)
+        assert answer == {"query": question, **{k: v for k, v in single.items()
+                                                if k not in ("registry", "agents", "resolvable",
+                                                             "unresolvable")}}
+    assert batch["queries"][2]["distinct_versions"] == 2
+    assert batch["queries"][3]["dangling_seats"] == ["seat0"]
+
+
+def test_bad_query_file_is_reported(fleet, tmp_path):
+    (tmp_path / "q.txt").write_text("has a\nsmells b\n")
+    proc = subprocess.run([sys.executable, str(SCRIPT), "--registry", str(fleet),
+                           "--queries", str(tmp_path / "q.txt")], capture_output=True, text=True,
+                          env=dict(os.environ, HOME=str(tmp_path)))
+    assert proc.returncode == 1
+    assert "q.txt:2: unknown query kind 'smells'" in proc.stderr
+
+
+def test_seats_probed_concurrently(monkeypatch, tmp_path):
+    agents = [(f"s{i}", tmp_path) for i in range(8)]
+    real_probe = fleet_scope.probe_seat
+
+    def slow_probe(path, queries, hashes=None):
+        time.sleep(0.2)
+        return real_probe(path, queries, hashes)
+
+    monkeypatch.setattr(fleet_scope, "probe_seat", slow_probe)
+    started = time.perf_counter()
+    results = fleet_scope.scan_fleet(agents, [], jobs=8)
+    assert time.perf_counter() - started < 0.8
+    assert all(r == {"exists": True, "answers": []} for r in results)
+
+
+def test_hung_seat_times_out_without_stalling_fleet(monkeypatch, tmp_path):
+    hung = tmp_path / "hung"
+    agents = [("hung", hung)] + [(f"s{i}", tmp_path) for i in range(4)]
+    real_probe = fleet_scope.probe_seat
+
+    def probe(path, queries, hashes=None):
+        if path == hung:
+            time.sleep(5)
+        return real_probe(path, queries, hashes)
+
+    monkeypatch.setattr(fleet_scope, "probe_seat", probe)
+    started = time.perf_counter()
+    results = fleet_scope.scan_fleet(agents, [fleet_scope.parse_query("has", "x")],
+                                     jobs=1, timeout=0.3)
+    assert time.perf_counter() - started < 2
+    assert results[0] is None
+    assert results[1:] == [{"exists": True, "answers": [False]}] * 4
+
+
+def test_each_artifact_stat_once_per_seat(monkeypatch, tmp_path):
+    (tmp_path / "x.py").write_text("x\n")
+    stats = []
+    real_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stats.append(self.name)
+        return real_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    queries = [fleet_scope.parse_query("has", "x.py"), fleet_scope.parse_query("lacks", "x.py"),
+               fleet_scope.parse_query("diverge", "x.py")]
+    result = fleet_scope.probe_seat(tmp_path, queries)
+    assert result["answers"][:2] == [True, True]
+    assert stats.count("x.py") == 1
+
+
+# --- Content-hash cache (--diverge) ---
+
+def test_streamed_digests_match_whole_file_hashes(tmp_path):
+    import hashlib
+    import zlib
+    blob = os.urandom(fleet_scope.HASH_CHUNK_BYTES * 2 + 17)
+    (tmp_path / "big.bin").write_bytes(blob)
+    assert fleet_scope.file_digest(tmp_path / "big.bin") == hashlib.md5(blob).hexdigest()
+    assert fleet_scope.file_digest(tmp_path / "big.bin", "crc32") == f"{zlib.crc32(blob):08x}"
+
+
+def test_hash_cache_reuses_digest_until_file_changes(tmp_path, monkeypatch):
+    seat = tmp_path / "seat"
+    seat.mkdir()
+    (seat / "x.py").write_text("one\n")
+    cache_file = tmp_path / "cache/hashes.json"
+    query = dict(fleet_scope.parse_query("diverge", "x.py"), digest="md5")
+
+    first = fleet_scope.HashCache(cache_file)
+    digest = fleet_scope.probe_seat(seat, [query], first)["answers"][0]
+    assert first.save() and cache_file.is_file()
+
+    warm = fleet_scope.HashCache(cache_file)
+    monkeypatch.setattr(fleet_scope, "file_digest", lambda *a: pytest.fail("re-hashed"))
+    assert fleet_scope.probe_seat(seat, [query], warm)["answers"][0] == digest
+    assert (warm.hits, warm.misses, warm.dirty) == (1, 0, False)
+
+    monkeypatch.undo()
+    (seat / "x.py").write_text("two, longer\n")
+    changed = fleet_scope.probe_seat(seat, [query], warm)["answers"][0]
+    assert changed != digest and warm.misses == 1
+
+
+def test_hash_cache_evicts_stale_and_oldest_entries(tmp_path):
+    seats = [tmp_path / "a", tmp_path / "b"]
+    for seat in seats:
+        seat.mkdir()
+        for name in ("x.py", "y.py"):
+            (seat / name).write_text(name)
+    cache_file = tmp_path / "hashes.json"
+    first = fleet_scope.HashCache(cache_file)
+    for seat in seats:
+        fleet_scope.probe_seat(seat, [fleet_scope.parse_query("diverge-all", "*.py")], first)
+    assert first.save(seats) and len(first.entries) == 4
+
+    (seats[0] / "y.py").unlink()  # a's y.py is gone; b was not scanned this run
+    second = fleet_scope.HashCache(cache_file)
+    fleet_scope.probe_seat(seats[0], [fleet_scope.parse_query("diverge-all", "*.py")], second)
+    assert second.save([seats[0]])
+    kept = fleet_scope.HashCache(cache_file).entries
+    assert sorted(k.split("\0")[1] for k in kept) == ["x.py", "x.py", "y.py"]
+    assert f"{seats[0]}\0y.py" not in kept
+
+    assert second.evict(max_entries=1) == 2
+    assert list(second.entries) == [f"{seats[0]}\0x.py"]  # used this run: kept
+
+
+def test_diverge_digest_option_and_cache_on_disk(fleet):
+    md5 = _run(fleet, "--diverge", "scripts/x.py")
+    crc = _run(fleet, "--diverge", "scripts/x.py", "--digest", "crc32")
+    assert [g["seats"] for g in md5["groups"]] == [g["seats"] for g in crc["groups"]]
+    assert all(len(g["crc32"]) == 8 for g in crc["groups"])
+    cache = json.loads((fleet.parent / ".aget/cache/fleet_scope_hashes.json").read_text())
+    assert len(cache["entries"]) == 3
+    assert all({"md5", "crc32"} <= set(e) for e in cache["entries"].values())
+
+
+# --- Divergence matrix (--diverge-all) ---
+
+def test_matrix_clusters_and_divergence(fleet):
+    data = _run(fleet, "--diverge-all")
+    assert data["artifacts"] == ["scripts/health_check.py", "scripts/x.py"]
+    assert [d["artifact"] for d in data["divergent"]] == ["scripts/x.py"]  # health_check.py agrees
+    assert data["matrix"]["seat3"] == [None, None]
+    single = _run(fleet, "--diverge", "scripts/x.py")
+    x_col = {seat: row[1] for seat, row in data["matrix"].items() if row[1]}
+    assert {g["md5"]: sorted(g["seats"]) for g in single["groups"]} == \
+        {d: sorted(s for s, v in x_col.items() if v == d) for d in set(x_col.values())}
+    assert sum(len(c["seats"]) for c in data["clusters"]) == 4
+
+
+def test_matrix_csv(fleet):
+    proc = subprocess.run([sys.executable, str(SCRIPT), "--registry", str(fleet), "--diverge-all",
+                           "--glob", "scripts/x.py", "--csv"], capture_output=True, text=True,
+                          env=dict(os.environ, HOME=str(fleet.parent)))
+    rows = proc.stdout.splitlines()
+    assert rows[0] == "seat,scripts/x.py"
+    assert [r.split(",")[0] for r in rows[1:]] == ["seat0", "seat1", "seat2", "seat3"]
+    assert rows[1].split(",")[1] == rows[2].split(",")[1] != rows[3].split(",")[1]
+    assert rows[4] == "seat3,"
+
+
+def test_matrix_snapshot_drift(fleet, tmp_path, monkeypatch):
+    snap = tmp_path / "matrix.json"
+    first = _run(fleet, "--diverge-all", "--snapshot", str(snap))
+    assert "drift" not in first and snap.is_file()
+    (tmp_path / "seat1/scripts/x.py").write_text("c\n")
+    (tmp_path / "seat3/scripts/x.py").write_text("a\n")
+    drift = _run(fleet, "--diverge-all", "--since", str(snap))["drift"]
+    assert [(c["seat"], c["artifact"]) for c in drift["changes"]] == \
+        [("seat1", "scripts/x.py"), ("seat3", "scripts/x.py")]
+    assert drift["changes"][1]["was"] is None
+    assert (drift["seats_added"], drift["seats_removed"]) == ([], [])
+    proc = subprocess.run([sys.executable, str(SCRIPT), "--registry", str(fleet), "--diverge-all",
+                           "--since", str(snap), "--digest", "crc32"], capture_output=True, text=True,
+                          env=dict(os.environ, HOME=str(fleet.parent)))
+    assert proc.returncode == 1 and "snapshot digest md5" in proc.stderr
+
+
+def test_invalid_matrix_glob_is_an_error(fleet, tmp_path):
+    env = dict(os.environ, HOME=str(tmp_path))
+    proc = subprocess.run([sys.executable, str(SCRIPT), "--registry", str(fleet), "--diverge-all",
+                           "--glob", "scripts/a**"], capture_output=True, text=True, env=env)
+    assert proc.returncode == 1 and "invalid diverge-all glob 'scripts/a**'" in proc.stderr
+    (tmp_path / "q.txt").write_text("diverge-all\n")
+    proc = subprocess.run([sys.executable, str(SCRIPT), "--registry", str(fleet),
+                           "--queries", str(tmp_path / "q.txt")], capture_output=True, text=True, env=env)
+    assert proc.returncode == 1 and "q.txt:1: diverge-all needs an argument" in proc.stderr
@@ -0,0 +1,188 @@
+"""
+Batched git probe tests (scripts/git_probe.py).
+
+One porcelain-v2 status call must report what the separate rev-parse /
+`status --porcelain` / `log @{u}..HEAD` calls did, and one `git log
+--name-only` pass must date every file as `git log -1 -- <file>` does.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import git_probe  # noqa: E402
+import wake_up  # noqa: E402
+import wind_down  # noqa: E402
+
+
+def _git(cwd, *args, date=None):
+    env = None
+    if date:
+        env = dict(os.environ, GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    return subprocess.run(["git", *args], cwd=str(cwd), capture_output=True,
+                          text=True, check=True, env=env).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "t")
+    (root / "docs").mkdir()
+    for name in ("a.txt", "b c.txt", "old.txt", "docs/x.md", "é.txt"):
+        (root / name).write_text("one\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-qm", "first", date="2026-01-01T10:00:00+00:00")
+    (root / "docs/x.md").write_text("two\n")
+    _git(root, "commit", "-qam", "second", date="2026-02-01T10:00:00+00:00")
+    git_probe._dates_cache.clear()
+    return root
+
+
+def test_status_matches_porcelain_v1(repo):
+    (repo / "a.txt").write_text("changed\n")
+    (repo / "b c.txt").write_text("staged\n")
+    _git(repo, "add", "b c.txt")
+    (repo / "b c.txt").write_text("staged then changed\n")
+    (repo / "é.txt").unlink()
+    _git(repo, "mv", "old.txt", "new name.txt")
+    (repo / "new file.txt").write_text("untracked\n")
+
+    probe = git_probe.status(repo)
+    assert probe["changes"] == _git(repo, "status", "--porcelain").splitlines()
+    assert probe["branch"] == _git(repo, "rev-parse", "--abbrev-ref", "HEAD").strip()
+    assert (probe["upstream"], probe["ahead"], probe["behind"]) == (None, None, None)
+
+
+def test_status_ahead_behind_upstream(repo, tmp_path):
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "clone", "-q", "--bare", str(repo), str(remote))
+    _git(repo, "remote", "add", "origin", str(remote))
+    _git(repo, "fetch", "-q", "origin")
+    _git(repo, "branch", "-q", "--set-upstream-to=origin/main")
+    (repo / "a.txt").write_text("local\n")
+    _git(repo, "commit", "-qam", "local 1")
+    _git(repo, "commit", "-q", "--allow-empty", "-m", "local 2")
+
+    probe = git_probe.status(repo)
+    assert (probe["upstream"], probe["ahead"], probe["behind"]) == ("origin/main", 2, 0)
+    assert probe["changes"] == []
+    assert probe["ahead"] == len(_git(repo, "log", "@{u}..HEAD", "--oneline").splitlines())
+
+
+def test_status_detached_and_outside_work_tree(repo, tmp_path):
+    _git(repo, "checkout", "-q", "--detach")
+    assert git_probe.status(repo)["branch"] == "HEAD"
+    outside = tmp_path / "plain"
+    outside.mkdir()
+    assert git_probe.status(outside) is None
+    assert git_probe.last_commit_dates(outside) == {}
+
+
+def test_last_commit_dates_match_per_file_log(repo):
+    dates = git_probe.last_commit_dates(repo)
+    tracked = _git(repo, "-c", "core.quotePath=false", "ls-files").splitlines()
+    assert sorted(dates) == sorted(tracked)
+    for rel in tracked:
+        assert dates[rel] == _git(repo, "log", "-1", "--format=%aI", "--", rel).strip()
+    assert dates["docs/x.md"].startswith("2026-02-01")
+    assert git_probe.last_commit_dates(repo, "docs") == {"docs/x.md": dates["docs/x.md"]}
+
+
+def test_last_commit_dates_memoized(repo, monkeypatch):
+    git_probe.last_commit_dates(repo)
+    monkeypatch.setattr(git_probe, "_git", lambda *a: pytest.fail("git ran twice"))
+    assert git_probe.last_commit_date(repo, "a.txt").startswith("2026-01-01")
+    assert git_probe.last_commit_date(repo, "untracked.txt") is None
+
+
+def test_session_scripts_use_one_status_call(repo, monkeypatch):
+    (repo / "a.txt").write_text("changed\n")
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", counting_run)
+    status = wake_up.get_git_status(repo)
+    assert (status["branch"], status["clean"], status["changes"]) == ("main", False, [" M a.txt"])
+    assert wind_down.get_uncommitted_changes(repo) == [" M a.txt"]
+    assert len(calls) == 2
+
+
+# --- Persistent commit-date index (.aget/cache, keyed by HEAD) ---
+
+def _counting(monkeypatch):
+    calls = []
+    real_git = git_probe._git
+
+    def counting_git(repo_path, args, timeout):
+        calls.append(args[0] if args[0] != "-c" else args[2])
+        return real_git(repo_path, args, timeout)
+
+    monkeypatch.setattr(git_probe, "_git", counting_git)
+    return calls
+
+
+def test_index_warm_run_costs_one_rev_parse(repo, monkeypatch):
+    full = git_probe.commit_date_index(repo)
+    assert (repo / git_probe.COMMIT_INDEX_RELPATH).is_file()
+    git_probe._dates_cache.clear()
+    calls = _counting(monkeypatch)
+    assert git_probe.commit_date_index(repo) == full
+    assert calls == ["rev-parse"]
+
+
+def test_index_walks_only_new_commits_when_head_advances(repo, monkeypatch):
+    git_probe.commit_date_index(repo)
+    (repo / "a.txt").write_text("three\n")
+    (repo / "fresh.txt").write_text("new\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-qm", "third", date="2026-03-01T10:00:00+00:00")
+    git_probe._dates_cache.clear()
+    calls = _counting(monkeypatch)
+    dates = git_probe.commit_date_index(repo)
+    assert calls == ["rev-parse", "merge-base", "log"]
+    git_probe._dates_cache.clear()
+    assert dates == git_probe.last_commit_dates(repo)
+    assert dates["a.txt"].startswith("2026-03-01") and dates["b c.txt"].startswith("2026-01-01")
+
+
+def test_index_rebuilt_after_history_rewrite(repo, monkeypatch):
+    git_probe.commit_date_index(repo)
+    _git(repo, "reset", "-q", "--hard", "HEAD~1")
+    git_probe._dates_cache.clear()
+    dates = git_probe.commit_date_index(repo)
+    assert dates["docs/x.md"].startswith("2026-01-01")  # the dropped commit is forgotten
+
+
+def test_check_initiatives_git_calls_independent_of_count(repo, monkeypatch):
+    import check_initiatives
+
+    def run_gather(count):
+        init_dir = repo / "planning/initiatives"
+        init_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            (init_dir / f"INIT-T{i}.md").write_text("**Status:** ACTIVE\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-qm", f"{count} initiatives")
+        monkeypatch.setattr(check_initiatives, "REPO", repo.resolve())
+        monkeypatch.setattr(check_initiatives, "INIT_DIR", init_dir)
+        git_probe._dates_cache.clear()
+        calls = _counting(monkeypatch)
+        initiatives, _ = check_initiatives.gather()
+        monkeypatch.undo()
+        assert all(i.get("age_days") is not None for i in initiatives)
+        return len(calls)
+
+    # cold: rev-parse + one log; after HEAD advances: rev-parse + merge-base + log
+    assert (run_gather(3), run_gather(30)) == (2, 3)
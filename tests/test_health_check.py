@@ -0,0 +1,318 @@
+"""
+Housekeeping library API tests (scripts/health_check.py).
+
+wind_down.py and wake_up.py call health_check / the reliance validator
+in-process; the subprocess path remains only as a fallback and must agree.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import health_check  # noqa: E402
+import wake_up  # noqa: E402
+import wind_down  # noqa: E402
+
+
+@pytest.fixture
+def agent(tmp_path):
+    (tmp_path / ".aget").mkdir()
+    (tmp_path / ".aget/version.json").write_text(json.dumps({"aget_version": "3.26.0"}))
+    (tmp_path / ".aget/identity.json").write_text(json.dumps({"name": "test-agent"}))
+    (tmp_path / "scripts").mkdir()
+    shutil.copy(REPO / "scripts/health_check.py", tmp_path / "scripts")
+    return tmp_path
+
+
+@pytest.fixture
+def reliance_agent(agent):
+    (agent / ".claude/skills/aget-wake-up").mkdir(parents=True)
+    (agent / ".aget/skill_reliance_manifest.yaml").write_text(
+        "meta:\n  as_of_version: 3.26.0\ncore_S:\n  - aget-wake-up\n  - aget-missing\n")
+    shutil.copy(REPO / "scripts/check_skill_reliance_manifest.py", agent / "scripts")
+    return agent
+
+
+def _no_subprocess(monkeypatch):
+    def refuse(*args, **kwargs):
+        raise AssertionError(f"unexpected subprocess: {args[0]}")
+    monkeypatch.setattr(subprocess, "run", refuse)
+
+
+def _strip_volatile(data):
+    data = dict(data)
+    data.pop("timestamp", None)
+    data.pop("duration_ms", None)
+    data["checks"] = [{k: v for k, v in c.items() if k != "duration_ms"}
+                      for c in data.get("checks", [])]
+    return data
+
+
+def test_health_report_matches_cli_json(agent):
+    cli = subprocess.run([sys.executable, str(agent / "scripts/health_check.py"), "--json"],
+                         capture_output=True, text=True, cwd=str(agent))
+    assert _strip_volatile(json.loads(cli.stdout)) == \
+        _strip_volatile(health_check.health_report(agent))
+
+
+def test_health_report_without_aget_dir(tmp_path):
+    assert health_check.health_report(tmp_path) == {
+        "status": "error", "errors": ["Could not find .aget/ directory"]}
+
+
+def test_wind_down_health_check_runs_in_process(agent, monkeypatch):
+    expected = wind_down.summarize_health(health_check.health_report(agent))
+    _no_subprocess(monkeypatch)
+    assert wind_down.run_health_check(agent) == expected
+
+
+def test_wind_down_falls_back_to_subprocess(agent):
+    # A deployed health_check.py predating health_report() still works.
+    (agent / "scripts/health_check.py").write_text(
+        "import json\n"
+        "if __name__ == '__main__':\n"
+        "    print(json.dumps({'status': 'warning',"
+        " 'summary': {'total': 4, 'passed': 3, 'warnings': 1, 'errors': 0}}))\n")
+    assert wind_down.run_health_check(agent) == {
+        "status": "warning", "checks_passed": 3, "checks_total": 4,
+        "warnings": 1, "errors": 0, "message": ""}
+
+
+def test_wind_down_subprocess_fallback_is_incremental(agent):
+    script = agent / "scripts/health_check.py"
+    script.write_text(
+        "import json, sys\n"
+        "if __name__ == '__main__':\n"
+        "    open('argv.json', 'w').write(json.dumps(sys.argv[1:]))\n"
+        "    print(json.dumps({'status': 'healthy',"
+        " 'summary': {'total': 1, 'passed': 1, 'warnings': 0, 'errors': 0}}))\n")
+    assert wind_down.run_health_check(agent)["status"] == "healthy"
+    assert json.loads((agent / "argv.json").read_text()) == ["--json", "--incremental"]
+
+    # A copy predating --incremental rejects it (argparse exit 2): --json alone
+    script.write_text(
+        "import argparse, json\n"
+        "if __name__ == '__main__':\n"
+        "    parser = argparse.ArgumentParser()\n"
+        "    parser.add_argument('--json', action='store_true')\n"
+        "    parser.parse_args()\n"
+        "    print(json.dumps({'status': 'warning',"
+        " 'summary': {'total': 2, 'passed': 1, 'warnings': 1, 'errors': 0}}))\n")
+    assert wind_down.run_health_check(agent)["checks_total"] == 2
+
+
+def test_reliance_attestation_in_process_matches_cli(reliance_agent, monkeypatch):
+    validator = reliance_agent / "scripts/check_skill_reliance_manifest.py"
+    cli = subprocess.run([sys.executable, str(validator)], capture_output=True, text=True)
+    cli_tail = cli.stdout.strip().splitlines()[-1]
+
+    _no_subprocess(monkeypatch)
+    check = health_check.check_reliance_manifest(reliance_agent)
+    attestation = wake_up.get_reliance_attestation(reliance_agent)
+    assert (check.passed, check.message) == (cli.returncode == 0, cli_tail)
+    assert attestation == {"ok": cli.returncode == 0, "summary": cli_tail}
+    assert attestation["ok"] is False  # aget-missing is declared but absent
+
+
+def test_reliance_attestation_falls_back_without_attest(reliance_agent):
+    validator = reliance_agent / "scripts/check_skill_reliance_manifest.py"
+    validator.write_text(validator.read_text().replace("def attest(", "def _attest("))
+    check = health_check.check_reliance_manifest(reliance_agent)
+    assert check.passed is False
+    assert check.message.startswith("  [")
+
+
+# --- Check registry (parallel execution, timing) ---
+
+def _check(key, seconds=0.0, log=None, raises=False):
+    def fn(agent_path, fs=None):
+        if log is not None:
+            log.append(("start", key))
+        time.sleep(seconds)
+        if raises:
+            raise OSError("disk went away")
+        if log is not None:
+            log.append(("end", key))
+        return health_check.CheckResult(key, True, "ok")
+    return fn
+
+
+def test_checks_record_duration(agent):
+    data = health_check.run_housekeeping(agent)
+    assert all(isinstance(c["duration_ms"], float) for c in data["checks"])
+    assert [c["name"] for c in data["checks"]][:2] == [".aget_directory", "version_json"]
+
+
+def test_independent_checks_overlap(agent):
+    registry = [(k, _check(k, 0.2), ()) for k in ("a", "b", "c", "d")]
+    started = time.perf_counter()
+    results = health_check.run_checks(agent, registry=registry)
+    assert time.perf_counter() - started < 0.6
+    assert [r.name for r in results] == ["a", "b", "c", "d"]
+    assert all(r.duration_ms >= 200 for r in results)
+
+
+def test_dependencies_order_execution(agent):
+    log = []
+    registry = [
+        ("late", _check("late", 0.0, log), ("early",)),
+        ("early", _check("early", 0.1, log), ()),
+        ("other", _check("other", 0.0, log), ()),
+    ]
+    results = health_check.run_checks(agent, registry=registry)
+    assert log.index(("end", "early")) < log.index(("start", "late"))
+    assert [r.name for r in results] == ["late", "early", "other"]
+
+
+def test_registry_errors(agent):
+    with pytest.raises(ValueError, match="unknown"):
+        health_check.run_checks(agent, registry=[("a", _check("a"), ("missing",))])
+    with pytest.raises(ValueError, match="cycle"):
+        health_check.run_checks(agent, registry=[("a", _check("a"), ("b",)),
+                                                 ("b", _check("b"), ("a",))])
+
+
+def test_raising_check_fails_soft(agent):
+    results = health_check.run_checks(agent, registry=[("boom", _check("boom", raises=True), ()),
+                                                       ("fine", _check("fine"), ())])
+    assert (results[0].passed, results[0].severity) == (False, "error")
+    assert "OSError" in results[0].message
+    assert results[1].passed
+
+
+def test_raising_check_keeps_its_reported_name(agent, monkeypatch):
+    def broken(agent_path, fs):
+        raise OSError("disk gone")
+
+    registry = [("aget_directory", broken, ())]
+    result, = health_check.run_checks(agent, registry=registry)
+    assert result.name == ".aget_directory" and "disk gone" in result.message
+
+
+def test_snapshot_reads_of_different_paths_overlap(agent, monkeypatch):
+    import threading
+    for name in ("a.md", "b.md", "c.md"):
+        (agent / name).write_text(name)
+    real_read_text = Path.read_text
+
+    def slow_read_text(self, *args, **kwargs):
+        time.sleep(0.2)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", slow_read_text)
+    fs = health_check.FsSnapshot(agent)
+    threads = [threading.Thread(target=fs.read_text, args=(name,)) for name in ("a.md", "b.md", "c.md")]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.perf_counter() - started < 0.45
+    monkeypatch.setattr(Path, "read_text", lambda *a, **k: pytest.fail("read twice"))
+    assert fs.read_text("b.md") == "b.md"
+
+
+def test_slowest_report(agent):
+    cli = subprocess.run([sys.executable, str(agent / "scripts/health_check.py"),
+                          "--json", "--slowest", "3"], capture_output=True, text=True)
+    data = json.loads(cli.stdout)
+    durations = [c["duration_ms"] for c in data["slowest"]]
+    assert len(durations) == 3 and durations == sorted(durations, reverse=True)
+    assert durations[0] == max(c["duration_ms"] for c in data["checks"])
+
+
+# --- Incremental mode (change journal) ---
+
+def _freshness(data):
+    return {c["name"]: c["freshness"] for c in data["checks"]}
+
+
+def test_incremental_reuses_unchanged_passing_checks(agent):
+    first = health_check.run_housekeeping(agent, incremental=True)
+    assert set(_freshness(first).values()) == {"fresh"}
+    # .aget/cache was just created, so checks reading .aget's listing re-run once
+    health_check.run_housekeeping(agent, incremental=True)
+    third = health_check.run_housekeeping(agent, incremental=True)
+    passing = {c["name"] for c in third["checks"] if c["passed"]}
+    assert {n for n, f in _freshness(third).items() if f == "cached"} == passing
+    assert third["summary"]["cached"] == len(passing)
+    fresh = health_check.run_housekeeping(agent)
+    assert [{k: v for k, v in c.items() if k not in ("freshness", "duration_ms")}
+            for c in third["checks"]] == _strip_volatile(fresh)["checks"]
+
+
+def test_incremental_reruns_checks_whose_inputs_changed(agent):
+    for _ in range(2):
+        health_check.run_housekeeping(agent, incremental=True)
+    (agent / ".aget/version.json").write_text(json.dumps({"aget_version": "3.27.0"}))
+    data = health_check.run_housekeeping(agent, incremental=True)
+    assert _freshness(data)["version_json"] == "fresh"
+    assert _freshness(data)["config_size"] == "cached"
+    assert {c["name"]: c["message"] for c in data["checks"]}["version_json"] == "v3.27.0"
+
+
+def test_incremental_never_caches_failures(agent):
+    for _ in range(3):
+        data = health_check.run_housekeeping(agent, incremental=True)
+    # identity.json has no north_star, governance/ is absent: both re-run every time
+    assert _freshness(data)["identity_json"] == "fresh"
+    assert _freshness(data)["governance_directory"] == "fresh"
+
+
+def test_non_incremental_output_has_no_freshness(agent):
+    data = health_check.run_housekeeping(agent)
+    assert all("freshness" not in c for c in data["checks"])
+    assert "cached" not in data["summary"]
+
+
+# --- Shared filesystem snapshot ---
+
+def test_each_directory_listed_once_per_run(agent, monkeypatch):
+    evolution = agent / ".aget/evolution"
+    evolution.mkdir()
+    for name in ("L001_a.md", "L002_b.md", "L002_c.md"):
+        (evolution / name).write_text("lesson\n")
+    (agent / "sessions").mkdir()
+    (agent / "sessions/SESSION_2026-10-01.md").write_text("notes\n")
+
+    listed = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(os.path.realpath(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    data = health_check.run_housekeeping(agent, incremental=True)
+    assert listed and len(listed) == len(set(listed))
+    messages = {c["name"]: c["message"] for c in data["checks"]}
+    assert messages["evolution_directory"] == "3 L-docs"
+    assert messages["duplicate_ldoc_ids"].startswith("1 duplicate L-doc ID(s): L002")
+    assert messages["sessions_directory"] == "1 session files"
+
+
+def test_frontmatter_longer_than_snapshot_head(agent):
+    skill = agent / ".claude/skills/aget-file-issue"
+    skill.mkdir(parents=True)
+    padding = "description: " + "x" * health_check.SNAPSHOT_HEAD_BYTES + "\n"
+    (skill / "SKILL.md").write_text(f"---\n{padding}disable-model-invocation: true\n---\nbody\n")
+    result = health_check.check_structural_skill_frontmatter(agent)
+    assert (result.passed, result.severity) == (False, "error")
+
+
+def test_extension_hook_receives_snapshot(agent):
+    (agent / "scripts/health_check_ext.py").write_text(
+        "def post_health(data, fs):\n"
+        "    data['ext_saw_aget'] = fs.is_dir('.aget')\n"
+        "    data['ext_shared_listing'] = fs.listing('.aget') is fs.listing('.aget')\n"
+        "    return data\n")
+    data = health_check.health_report(agent)
+    assert data["ext_saw_aget"] is True and data["ext_shared_listing"] is True
@@ -257,4 +257,68 @@ Configuration content here...""")
 
         # Should include both root and subdirectories
         assert '.' in scanner.projects
-        assert scanner.summary['total_projects'] >= 5  # Root + 4 subdirs
\ No newline at end of file
+        assert scanner.summary['total_projects'] >= 5  # Root + 4 subdirs
+
+    def test_one_listing_per_directory_and_single_agents_md_read(self, temp_workspace, monkeypatch):
+        """Existence checks come from scandir listings; AGENTS.md is read once."""
+        import builtins
+        listed, opened = [], []
+        real_scandir, real_open = os.scandir, builtins.open
+
+        def counting_scandir(path):
+            listed.append(str(path))
+            return real_scandir(path)
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(Path(file).name)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        monkeypatch.setattr(builtins, "open", counting_open)
+        project = Path(temp_workspace) / "fully-migrated"
+        status = ProjectScanner(temp_workspace).scan_directory(project)
+
+        assert status['agents_md_header'] == '@aget-version: 2.0.0'
+        assert len(listed) == len(set(listed)) == 4  # root, scripts/, patterns/, .aget/
+        assert sorted(opened) == ['AGENTS.md', 'version.json']
+
+    def test_multiple_roots(self, temp_workspace):
+        """Several roots are surveyed in one scan, keyed by full path."""
+        with tempfile.TemporaryDirectory() as other:
+            (Path(other) / "unmigrated").mkdir()
+            (Path(other) / "unmigrated" / ".git").mkdir()
+            (Path(other) / "not-a-repo").mkdir()
+
+            scanner = ProjectScanner(roots=[temp_workspace, other], max_workers=4)
+            scanner.scan_all_projects()
+
+            assert scanner.summary['total_projects'] == 5
+            assert str(Path(other) / "unmigrated") in scanner.projects
+            assert str(Path(temp_workspace) / "unmigrated") in scanner.projects
+            assert scanner.results['roots'] == [temp_workspace, other]
+
+    def test_parallel_scan_matches_serial(self, temp_workspace):
+        """Concurrent analysis yields the same projects, in listing order."""
+        serial = ProjectScanner(temp_workspace, max_workers=1)
+        serial.scan_all_projects()
+        parallel = ProjectScanner(temp_workspace, max_workers=8)
+        parallel.scan_all_projects()
+
+        assert list(parallel.projects) == list(serial.projects)
+        assert parallel.projects == serial.projects
+        assert parallel.summary == serial.summary
+
+    def test_public_helpers_agree_with_analysis(self, temp_workspace):
+        """Standalone helper calls give the same answers analyze_project uses."""
+        scanner = ProjectScanner(temp_workspace)
+        project = Path(temp_workspace) / "fully-migrated"
+        (project / ".cursorrules").write_text("")
+        analysis = scanner.analyze_project(project)
+
+        assert scanner.is_git_repo(project) == analysis['is_git_repo']
+        assert scanner.check_file_exists(project, 'scripts/health_check.py') == \
+            analysis['has_housekeeping_protocols']
+        assert scanner.check_agents_md_header(project) == analysis['agents_md_header']
+        assert scanner.detect_compatibility_files(project) == analysis['compatibility_files'] == ['.cursorrules']
+        assert sorted(scanner.detect_pattern_categories(project)) == sorted(analysis['pattern_categories'])
+        assert scanner.extract_version_from_agents_md(project) == '2.0.0'
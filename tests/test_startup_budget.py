@@ -0,0 +1,63 @@
+"""
+Start-up budget benchmark for the session scripts (scripts/startup_profile.py).
+
+Session scripts fire on hooks, so module import time is user-visible. Each
+entry point must import within its budget, and heavy modules stay deferred
+to the code paths that need them. The wall-clock budgets are a benchmark,
+opt-in with AGET_STARTUP_BENCHMARK=1 (shared CI runners are too noisy for a
+fixed threshold); slow runners may scale them with AGET_STARTUP_BUDGET_SCALE.
+The deferred-import checks are deterministic and always run.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+SCRIPTS = REPO / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import startup_profile  # noqa: E402
+
+DEFERRED = ("subprocess", "importlib.util", "inspect", "concurrent.futures", "yaml")
+# health_check's filesystem snapshot holds a lock, so threading loads up front there
+DEFERRED_EXTRA = {"wake_up": ("threading",), "wind_down": ("threading",)}
+BENCHMARK_ENV = "AGET_STARTUP_BENCHMARK"  # opt-in for the wall-clock budgets
+
+
+@pytest.mark.skipif(os.environ.get(BENCHMARK_ENV) != "1",
+                    reason=f"wall-clock benchmark; set {BENCHMARK_ENV}=1 to run")
+@pytest.mark.parametrize("script", sorted(startup_profile.STARTUP_BUDGETS_MS))
+def test_import_within_budget(script):
+    profile = startup_profile.measure_startup(script, runs=5)
+    assert profile["within_budget"], startup_profile.format_profile(profile)
+
+
+@pytest.mark.parametrize("script", sorted(startup_profile.STARTUP_BUDGETS_MS))
+def test_heavy_modules_are_deferred(script):
+    heavy = DEFERRED + DEFERRED_EXTRA.get(script, ())
+    code = (f"import sys; sys.path.insert(0, {str(SCRIPTS)!r}); import {script}; "
+            f"print(','.join(m for m in {heavy!r} if m in sys.modules))")
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ""
+
+
+def test_profile_startup_flag():
+    proc = subprocess.run([sys.executable, str(SCRIPTS / "health_check.py"),
+                           "--profile-startup"], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stdout
+    assert proc.stdout.startswith("Startup profile: health_check.py")
+    assert "argparse" in proc.stdout
+
+
+def test_parse_importtime_depths():
+    stderr = ("import time: self [us] | cumulative | imported package\n"
+              "import time:       100 |        100 |     _abc\n"
+              "import time:       200 |        300 |   abc\n"
+              "import time:       400 |        700 | mymod\n")
+    rows = startup_profile._parse_importtime(stderr)
+    assert [(r["name"], r["depth"]) for r in rows] == [("_abc", 2), ("abc", 1), ("mymod", 0)]
+    assert rows[-1]["cumulative_ms"] == 0.7
@@ -0,0 +1,412 @@
+"""
+Study topic search engine tests (scripts/study_topic.py, scripts/study_index.py).
+
+The study index must be a pure accelerator: for every topic the index path
+returns exactly what the per-file regex scan returns (same files, counts,
+contexts, scores).
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import study_index  # noqa: E402
+import study_topic  # noqa: E402
+
+CORPUS = {
+    ".aget/evolution/L100_wind_down_protocol.md":
+        "# L100: Wind down protocol\n\nAlways run the wind-down checks.\nChecked twice.\n",
+    ".aget/evolution/L101_release_checklist.md":
+        "# L101: Release checklist\n\nThe release checklist covers v3.26 gates.\n"
+        "Lessons from releases.\n",
+    ".aget/evolution/L102_health.md":
+        "# L102: Health\n\nhealth health HEALTH checking the checks\n",
+    "sops/SOP_release.md": "# SOP: Release\n\nRelease process (gh#1850).\n",
+    "governance/CHARTER.md": "# Charter\n\nLessons and releases are governed here.\n",
+    "planning/PROJECT_PLAN_release_v3.md":
+        "# Release v3\n\n**Plan_Status**: In Progress\n\nrelease gates\n",
+    "knowledge/notes/wind.md": "wind speeds, down feathers, windowing\n",
+    # IGNORECASE pairs İ ı ſ K (Kelvin sign) with ASCII letters; lower() does not
+    "knowledge/notes/travel.md": "İSTANBUL stopover: ſtops at the \u212aelvin and Straße museums\n",
+    "ontology/ONTOLOGY_x.md": "Concept: release lesson\n",
+    "inbox/NOTIFY_release.md": "NOTIFY: release cut tomorrow\n",
+}
+
+TOPICS = [
+    "release", "wind down", "check", "health", "lesson", "L101",
+    "release checklist v3.26", "gh#1850", "the", "supervisor's release,",
+    "wind", "checks health", "istanbul stop", "kelvin", "straße", "stopover's",
+]
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    for rel, text in CORPUS.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    monkeypatch.setattr(study_topic, "get_agent_root", lambda: tmp_path)
+    monkeypatch.setattr(study_topic, "_search_state",
+                        dict(study_topic._search_state, index=None, results={}))
+    return tmp_path
+
+
+def _findings(topic, indexed, domain_keywords=None):
+    study_topic._search_state.update(enabled=indexed, index=None, results={})
+    return {
+        "ldocs": study_topic.find_ldocs(topic, domain_keywords=domain_keywords),
+        "patterns": study_topic.find_patterns(topic, domain_keywords=domain_keywords),
+        "project_plans": study_topic.find_project_plans(topic, domain_keywords=domain_keywords),
+        "sops": study_topic.find_sops(topic, domain_keywords=domain_keywords),
+        "governance": study_topic.find_governance(topic, domain_keywords=domain_keywords),
+        "knowledge": study_topic.find_knowledge(topic, domain_keywords=domain_keywords),
+        "inbox": study_topic.find_inbox(topic, domain_keywords=domain_keywords),
+    }
+
+
+def _normalized(findings):
+    return {k: sorted(v, key=lambda x: (-x["score"], x["file"])) for k, v in findings.items()}
+
+
+@pytest.mark.parametrize("topic", TOPICS)
+def test_index_matches_scan(agent, topic):
+    assert _normalized(_findings(topic, True)) == _normalized(_findings(topic, False))
+
+
+@pytest.mark.parametrize("domain_keywords", [["gates"], ["release process", "lesson"], ["museum", "kelvin"]])
+@pytest.mark.parametrize("topic", ["release", "stop"])
+def test_index_matches_scan_with_domain_keywords(agent, domain_keywords, topic):
+    scan = _findings(topic, False, domain_keywords)
+    indexed = _findings(topic, True, domain_keywords)
+    assert _normalized(indexed) == _normalized(scan)
+
+
+def test_index_built_on_first_use(agent):
+    assert not (agent / study_index.INDEX_RELPATH).exists()
+    _findings("release", True)
+    assert (agent / study_index.INDEX_RELPATH).exists()
+
+
+def test_index_rebuilt_when_corpus_changes(agent):
+    _findings("release", True)
+    new = agent / ".aget/evolution/L103_zebra.md"
+    new.write_text("# L103: Zebra\n\nzebra crossing\n")
+    ldocs = _findings("zebra", True)["ldocs"]
+    assert [x["ldoc"] for x in ldocs] == ["L103_zebra"]
+
+
+def test_inbox_recency_window_applies_to_index(agent):
+    old = agent / "inbox/NOTIFY_release.md"
+    stale = time.time() - 30 * 86400
+    os.utime(old, (stale, stale))
+    assert _findings("release", True)["inbox"] == []
+    assert _findings("release", False)["inbox"] == []
+
+
+def _resolved(index):
+    """Index content with doc ids resolved to paths (ids differ across builds)."""
+    paths = index["_paths"]
+    docs = {rel: {k: v for k, v in doc.items() if k not in ("id", "terms")} | {
+        "terms": sorted(doc.get("terms", "").split())} for rel, doc in index["docs"].items()}
+    postings = {term: {paths[i]: offs for i, offs in study_index.decode_postings(entry).items()}
+                for term, entry in index["postings"].items()}
+    return docs, postings
+
+
+def test_incremental_refresh_reprocesses_only_drift(agent):
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    generation = index["generation"]
+
+    (agent / ".aget/evolution/L104_new.md").write_text("# L104: New\n\nnew lesson\n")
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    assert index["last_refresh"] == {"added": 1, "changed": 0, "deleted": 0, "touched": 0}
+    assert index["generation"] == generation + 1
+
+    touched = agent / "sops/SOP_release.md"
+    later = time.time() + 60
+    os.utime(touched, (later, later))
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    assert index["last_refresh"] == {"added": 0, "changed": 0, "deleted": 0, "touched": 1}
+    assert index["generation"] == generation + 1
+
+    (agent / "governance/CHARTER.md").write_text("# Charter\n\nzebra\n")
+    (agent / "knowledge/notes/wind.md").unlink()
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    assert index["last_refresh"] == {"added": 0, "changed": 1, "deleted": 1, "touched": 0}
+    assert "knowledge/notes/wind.md" not in index["docs"]
+    # Incremental result is indistinguishable from a full rebuild
+    rebuilt = study_index.build_index(
+        agent, study_index.list_corpus(agent, study_topic.SURFACE_GLOBS))
+    assert _resolved(index) == _resolved(rebuilt)
+
+
+def test_reindex_rebuilds_from_scratch(agent):
+    study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS, reindex=True)
+    assert index["generation"] == 1
+    assert index["last_refresh"]["added"] == len(CORPUS)
+
+
+@pytest.mark.parametrize("topic", ["release", "check", "wind down", "gh#1850"])
+def test_index_contexts_match_scan(agent, topic):
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    indexed = study_topic.index_search(index, topic, with_contexts=True)
+    scanned = {}
+    for rel in index["docs"]:
+        match = study_topic.search_file_for_topic(agent / rel, topic)
+        if match:
+            scanned[rel] = match
+    assert indexed == scanned
+
+
+def test_bm25_keeps_result_set_and_ranks_by_rarity_and_field(agent):
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    composite = study_topic.index_search(index, "release checklist")
+    bm25 = study_topic.index_search(index, "release checklist", ranker="bm25")
+    assert set(bm25) == set(composite)
+    assert all(m["score"] == study_topic.bm25_score(m) for m in bm25.values())
+    # "checklist" is rarer than "release" and sits in the filename and heading
+    best = max(bm25.values(), key=lambda m: m["score"])
+    assert best["file"] == ".aget/evolution/L101_release_checklist.md"
+
+
+def test_bm25_discounts_kept_stopwords(agent):
+    study_topic._search_state["stopwords"] = False
+    index = study_index.ensure_index(agent, study_topic.SURFACE_GLOBS)
+    with_the = study_topic.index_search(index, "the health", ranker="bm25")
+    study_topic._search_state["stopwords"] = True
+    without = study_topic.index_search(index, "health", ranker="bm25")
+    rel = ".aget/evolution/L102_health.md"
+    # "the" is common across the corpus: IDF keeps its contribution small
+    assert with_the[rel]["bm25"] - without[rel]["bm25"] < without[rel]["bm25"] / 2
+
+
+def test_bm25_default_floor_keeps_common_term_hits(agent, monkeypatch, capsys):
+    def run(*argv):
+        monkeypatch.setattr(sys, "argv", ["study_topic.py", "--json", "--no-cache",
+                                          "--topic", "release", *argv])
+        study_topic._search_state.update(index=None, results={})
+        assert study_topic.main() == 0
+        findings = study_topic.json.loads(capsys.readouterr().out)["findings"]
+        return sorted(m["file"] for items in findings.values() for m in items)
+
+    # "release" matches most of the corpus: its IDF (and every BM25F score) is < 1
+    unfloored = run("--ranker", "bm25", "--no-floor")
+    assert len(unfloored) >= 5
+    assert run("--ranker", "bm25") == unfloored
+
+
+def test_scan_pass_reads_each_file_once(agent, monkeypatch):
+    reads = []
+    original = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    findings = _findings("release", False)
+    assert findings["ldocs"] and findings["project_plans"]
+    assert len(reads) == len(set(reads)) == len(CORPUS)
+
+
+def test_classifier_metadata_from_single_pass(agent):
+    for indexed in (True, False):
+        findings = _findings("release", indexed)
+        ldoc = next(x for x in findings["ldocs"] if x["ldoc"] == "L101_release_checklist")
+        assert ldoc["title"] == "L101: Release checklist"
+        assert findings["project_plans"][0]["is_active"] is True
+
+
+def test_wider_inbox_window_reads_deferred_files(agent):
+    old = agent / "inbox/NOTIFY_release.md"
+    stale = time.time() - 30 * 86400
+    os.utime(old, (stale, stale))
+    for indexed in (True, False):
+        _findings("release", indexed)
+        wide = study_topic.find_inbox("release", window_days=60)
+        assert [x["doc"] for x in wide] == ["inbox/NOTIFY_release.md"]
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_parallel_jobs_match_serial(agent, monkeypatch, indexed):
+    monkeypatch.setattr(study_topic, "PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(study_index, "PARALLEL_MIN_FILES", 1)
+    serial = _findings("release checklist", indexed)
+    (agent / study_index.INDEX_RELPATH).unlink(missing_ok=True)
+    study_topic._search_state["jobs"] = 2
+    parallel = _findings("release checklist", indexed)
+    assert parallel == serial
+
+
+MATCHER_TEXT = ("Lessons lesson LESSONS checks Checked check-list checking aaaaaaaaaaaaa\n"
+                "wind down gh#1850 supervisor's release RELEASES v3.26 gates\n" + "\n".join(CORPUS.values()))
+
+
+@pytest.mark.parametrize("searched", [
+    ("lesson", "lessons"), ("check", "checks"), ("check", "check"), ("release",),
+    ("wind", "down", "gh#1850"), ("aaaaaa",), ("supervisor's",), ("v3.26", "gates"),
+    ("istanbul", "lessons"), ("stop", "kelvin"), ("straße", "ΣΤΟΠ"),
+])
+@pytest.mark.parametrize("case_insensitive", [True, False])
+# lower() grows "İ"; IGNORECASE matches İ ı ſ K (Kelvin sign) with ASCII letters
+@pytest.mark.parametrize("prefix", ["", "İstanbul Lessons check\n",
+                                    "İSTANBUL ıstanbul ſtops \u212aelvin STRASSE straße στοπ\n"])
+def test_compiled_matcher_matches_per_keyword_finditer(searched, case_insensitive, prefix):
+    text = prefix + MATCHER_TEXT
+    flags = study_topic.re.IGNORECASE if case_insensitive else 0
+    expected = [[m.start() for m in study_topic.re.finditer(study_topic._token_pattern(kw), text, flags)]
+                for kw in searched]
+    assert study_topic.compile_matcher(searched, case_insensitive)(text) == expected
+
+
+def _main_json(monkeypatch, capsys, *argv):
+    monkeypatch.setattr(sys, "argv", ["study_topic.py", "--json", *argv])
+    study_topic._search_state.update(index=None, results={})
+    assert study_topic.main() == 0
+    return study_topic.json.loads(capsys.readouterr().out)
+
+
+def test_result_cache_hits_repeat_query_and_invalidates_on_change(agent, monkeypatch, capsys):
+    first = _main_json(monkeypatch, capsys, "--topic", "release")
+    assert first["result_cache"] == {"enabled": True, "hit": False, "entries": 1}
+    # Normalized keywords share an entry: stopwords and case do not matter
+    again = _main_json(monkeypatch, capsys, "--topic", "the Release")
+    assert again["result_cache"]["hit"] is True
+    assert again["findings"] == first["findings"]
+
+    (agent / "sops/SOP_release.md").write_text("# SOP: Release\n\nRelease release release.\n")
+    changed = _main_json(monkeypatch, capsys, "--topic", "release")
+    assert changed["result_cache"]["hit"] is False
+    assert changed["findings"]["sops"][0]["match_count"] > first["findings"]["sops"][0]["match_count"]
+
+    bypass = _main_json(monkeypatch, capsys, "--topic", "release", "--no-cache")
+    assert bypass["result_cache"] == {"enabled": False, "hit": False}
+    assert bypass["findings"] == changed["findings"]
+
+
+def test_result_cache_evicts_least_recently_used(agent, monkeypatch, capsys):
+    monkeypatch.setattr(study_topic, "RESULT_CACHE_MAX_ENTRIES", 2)
+    for topic in ("release", "health", "release", "wind"):
+        _main_json(monkeypatch, capsys, "--topic", topic)
+    # "health" was least recently used when "wind" arrived
+    assert _main_json(monkeypatch, capsys, "--topic", "release")["result_cache"]["hit"] is True
+    assert _main_json(monkeypatch, capsys, "--topic", "health")["result_cache"]["hit"] is False
+
+
+def _main_jsonl(monkeypatch, capsys, *argv):
+    monkeypatch.setattr(sys, "argv", ["study_topic.py", "--jsonl", "--no-cache", *argv])
+    study_topic._search_state.update(index=None, results={})
+    assert study_topic.main() == 0
+    return [study_topic.json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+@pytest.mark.parametrize("extra", [[], ["--stream"], ["--no-index", "--stream"]])
+def test_jsonl_records_match_json_findings(agent, monkeypatch, capsys, extra):
+    document = _main_json(monkeypatch, capsys, "--topic", "release", "--no-cache")
+    records = _main_jsonl(monkeypatch, capsys, "--topic", "release", *extra)
+    *surfaces, summary = records
+    assert [r["type"] for r in surfaces] == ["surface"] * len(document["findings"])
+    assert {r["surface"]: r["results"] for r in surfaces} == document["findings"]
+    assert summary["type"] == "summary"
+    assert summary["total_artifacts"] == document["total_artifacts"]
+    assert summary["counts"] == {k: len(v) for k, v in document["findings"].items()}
+    assert "findings" not in summary
+
+
+def test_stream_emits_each_surface_before_reading_the_next(agent, monkeypatch, capsys):
+    events = []
+    original = Path.read_text
+
+    def logging_read_text(self, *args, **kwargs):
+        events.append(("read", self.relative_to(agent).parts[0]))
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", logging_read_text)
+    monkeypatch.setattr(study_topic, "print",
+                        lambda line, **kw: events.append(("emit", study_topic.json.loads(line)["type"])),
+                        raising=False)
+    monkeypatch.setattr(sys, "argv", ["study_topic.py", "--topic", "release", "--jsonl", "--stream",
+                                      "--no-index", "--no-cache"])
+    assert study_topic.main() == 0
+    first_emit = events.index(("emit", "surface"))
+    # ldocs (.aget/evolution) is streamed before any later surface is read
+    assert {where for _, where in events[:first_emit]} == {".aget"}
+    assert events[-1] == ("emit", "summary")
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+@pytest.mark.parametrize("domain_keywords", [None, ["gates"], ["release process"]])
+@pytest.mark.parametrize("top", [1, 2])
+def test_top_k_is_head_of_full_ranking(agent, indexed, domain_keywords, top):
+    for i in range(6):
+        (agent / f".aget/evolution/L2{i:02d}_note.md").write_text(
+            "# Note\n\n" + "release " * (i + 1) + ("gates\n" if i % 2 else "\n"))
+    full = _findings("release", indexed, domain_keywords)
+    study_topic._search_state["top"] = top
+    limited = _findings("release", indexed, domain_keywords)
+    assert limited == {k: v[:top] for k, v in full.items()}
+
+
+def test_top_k_prunes_domain_boost_work(agent, monkeypatch):
+    for i in range(20):
+        (agent / f".aget/evolution/L3{i:02d}_note.md").write_text("release " * (1 if i else 50))
+    calls = []
+    original = study_topic.compute_domain_boost
+    monkeypatch.setattr(study_topic, "compute_domain_boost",
+                        lambda content, kws: calls.append(1) or original(content, kws))
+    full = _findings("release", True, ["release process"])
+    calls.clear()
+    study_topic._search_state["top"] = 1
+    limited = _findings("release", True, ["release process"])
+    assert limited == {k: v[:1] for k, v in full.items()}
+    matched = sum(len(v) for v in full.values())
+    assert len(calls) < matched / 2
+
+
+MAPPED_TEXTS = [
+    "Release notes\r\nrelease gates\rchecks, checklist\n\nwind-down release process\n",
+    "# Héllo\nreleaseé ñrelease 日本release release\n—release— Release_notes\n",
+    "﻿release at start\n" + "filler line\n" * 40 + "late release process gates\n",
+]
+
+
+@pytest.mark.parametrize("text", MAPPED_TEXTS)
+@pytest.mark.parametrize("topic", ["release", "check", "release checklist", "wind down"])
+@pytest.mark.parametrize("domain_keywords", [None, ["release process", "gates"]])
+def test_mapped_scan_matches_text_scan(agent, monkeypatch, text, topic, domain_keywords):
+    monkeypatch.setattr(study_topic, "MMAP_CHUNK", 7)  # hits and CRLFs straddle chunks
+    path = agent / "knowledge/big_release_note.md"
+    path.write_bytes(text.encode("utf-8"))
+    mapped = study_topic._match_mapped(path, topic, domain_keywords=domain_keywords)
+    assert mapped is not study_topic._UNMAPPED
+    assert mapped == study_topic._match_content(path, path.read_text(), topic,
+                                                domain_keywords=domain_keywords)
+
+
+@pytest.mark.parametrize("raw, topic", [
+    ("Kelvin release\n".encode("utf-8"), "release"),  # case-folds onto ASCII
+    (b"release \xff\xfe broken utf-8\n", "release"),
+    (b"v3.26 release\n", "v3.26"),                          # punctuated keyword
+])
+def test_mapped_scan_defers_to_text_path(agent, monkeypatch, raw, topic):
+    monkeypatch.setattr(study_topic, "MMAP_MIN_BYTES", 1)
+    path = agent / "knowledge/edge.md"
+    path.write_bytes(raw)
+    assert study_topic._match_mapped(path, topic) is study_topic._UNMAPPED
+    try:
+        expected = study_topic._match_content(path, path.read_text(), topic)
+    except UnicodeDecodeError:
+        expected = None
+    assert study_topic.search_file_for_topic(path, topic) == expected
+
+
+def test_scan_findings_unchanged_with_mapped_reads(agent, monkeypatch):
+    indexed = _findings("release", True)
+    monkeypatch.setattr(study_topic, "MMAP_MIN_BYTES", 1)
+    assert _findings("release", False) == indexed
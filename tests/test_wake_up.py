@@ -0,0 +1,193 @@
+"""
+Wake-up data gathering tests (scripts/wake_up.py).
+
+Probes (git, pending work, release currency, reliance attestation) run
+concurrently under one wake deadline and fail soft independently.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "scripts"))
+
+import wake_up  # noqa: E402
+
+
+@pytest.fixture
+def agent(tmp_path):
+    (tmp_path / ".aget").mkdir()
+    (tmp_path / ".aget/version.json").write_text(json.dumps({"aget_version": "3.26.0"}))
+    (tmp_path / "sessions").mkdir()
+    (tmp_path / "sessions/SESSION_2026-10-01.md").write_text("## Pending Work\n- ship it\n")
+    return tmp_path
+
+
+def _slow(value, seconds):
+    def probe(*args, **kwargs):
+        time.sleep(seconds)
+        return value
+    return probe
+
+
+def test_probes_run_concurrently(agent, monkeypatch):
+    monkeypatch.setattr(wake_up, "get_git_status",
+                        _slow({"branch": "main", "clean": True, "changes": []}, 0.4))
+    monkeypatch.setattr(wake_up, "get_release_currency",
+                        _slow({"status": "current", "latest": "3.26.0"}, 0.4))
+    start = time.monotonic()
+    data = wake_up.get_wake_data(agent)
+    assert time.monotonic() - start < 0.75
+    assert data["git"]["branch"] == "main"
+    assert data["release_currency"]["status"] == "current"
+    assert data["pending_work"]["items"] == ["ship it"]
+    assert "deadline_exceeded" not in data
+    assert [k for k in data if k in ("git", "calendar", "pending_work", "release_currency")] == \
+        ["git", "calendar", "pending_work", "release_currency"]
+
+
+def test_deadline_abandons_slow_probe(agent, monkeypatch):
+    (agent / ".aget/config.json").write_text(json.dumps({"wake_up": {"wake_deadline": 0.2}}))
+    monkeypatch.setattr(wake_up, "get_git_status",
+                        _slow({"branch": "main", "clean": True, "changes": []}, 0))
+    monkeypatch.setattr(wake_up, "get_release_currency",
+                        _slow({"status": "behind", "latest": "9.9.9"}, 5))
+    start = time.monotonic()
+    data = wake_up.get_wake_data(agent)
+    assert time.monotonic() - start < 1.0
+    assert data["release_currency"] == {"status": "unknown", "latest": None}
+    assert data["deadline_exceeded"] == ["release_currency"]
+    assert data["git"]["branch"] == "main"
+
+
+def test_deadline_bounds_probe_subprocesses(agent, monkeypatch):
+    import os
+    assert wake_up.DEFAULT_CONFIG["wake_deadline"] >= wake_up.RELIANCE_TIMEOUT
+    (agent / ".aget/config.json").write_text(json.dumps({"wake_up": {"wake_deadline": 0.5}}))
+    (agent / ".aget/skill_reliance_manifest.yaml").write_text("skills: []\n")
+    (agent / "scripts").mkdir()
+    (agent / "scripts/check_skill_reliance_manifest.py").write_text(
+        "import os, time\n"
+        "if __name__ == '__main__':\n"
+        "    open('validator.pid', 'w').write(str(os.getpid()))\n"
+        "    time.sleep(30)\n")
+    monkeypatch.setattr(wake_up, "get_release_currency", _slow({"status": "current"}, 0))
+    data = wake_up.get_wake_data(agent)
+    assert data["reliance_attestation"]["ok"] is False
+    time.sleep(1.0)
+    pid = int((agent / "validator.pid").read_text())
+    with pytest.raises(ProcessLookupError):  # killed at its (deadline-capped) timeout
+        os.kill(pid, 0)
+
+
+def test_late_probes_always_report_their_fallback():
+    fallback = {"status": "unknown"}
+    for _ in range(40):  # probes finishing right at the deadline
+        results, late = wake_up.run_wake_probes(
+            {"rc": (_slow({"status": "current"}, 0.01), fallback)}, 0.01)
+        assert ("rc" in late) == (results["rc"] is fallback)
+
+
+def test_failing_probe_falls_back_alone(agent, monkeypatch):
+    def broken(*args, **kwargs):
+        raise OSError("git exploded")
+
+    monkeypatch.setattr(wake_up, "get_git_status", broken)
+    monkeypatch.setattr(wake_up, "get_release_currency",
+                        _slow({"status": "current", "latest": "3.26.0"}, 0))
+    data = wake_up.get_wake_data(agent)
+    assert data["git"] == {"branch": "unknown", "clean": None, "changes": []}
+    assert data["release_currency"]["status"] == "current"
+    assert data["valid"] is True
+
+
+def _counting(monkeypatch, name, value):
+    calls = []
+
+    def probe(*args, **kwargs):
+        calls.append(1)
+        return value
+
+    monkeypatch.setattr(wake_up, name, probe)
+    return calls
+
+
+def test_snapshot_reuses_unchanged_sections(agent, monkeypatch):
+    rc_calls = _counting(monkeypatch, "get_release_currency", {"status": "current", "latest": "3.26.0"})
+    git_calls = _counting(monkeypatch, "get_git_status", {"branch": "main", "clean": True, "changes": []})
+    first = wake_up.get_wake_data(agent)
+    assert first["snapshot"]["reused"] == []
+    assert (agent / wake_up.WAKE_SNAPSHOT_RELPATH).exists()
+
+    second = wake_up.get_wake_data(agent)
+    assert set(second["snapshot"]["reused"]) == {
+        "version", "identity", "structure", "pending_work", "release_currency", "reliance_attestation"}
+    assert len(rc_calls) == 1 and len(git_calls) == 2  # git status is always live
+    strip = lambda d: {k: v for k, v in d.items() if k not in ("timestamp", "snapshot")}  # noqa: E731
+    assert strip(second) == strip(first)
+
+
+def test_snapshot_recomputes_only_stale_sections(agent, monkeypatch):
+    _counting(monkeypatch, "get_release_currency", {"status": "current", "latest": "3.26.0"})
+    wake_up.get_wake_data(agent)
+    time.sleep(0.01)
+    (agent / "sessions/SESSION_2026-10-02.md").write_text("## Pending Work\n- newer item\n")
+    data = wake_up.get_wake_data(agent)
+    assert data["pending_work"]["items"] == ["newer item"]
+    assert "pending_work" in data["snapshot"]["recomputed"]
+    assert "version" in data["snapshot"]["reused"]
+
+    (agent / ".aget/version.json").write_text(json.dumps({"aget_version": "3.27.0"}))
+    data = wake_up.get_wake_data(agent)
+    assert data["version"]["aget_version"] == "3.27.0"
+    assert {"version", "identity", "release_currency"} <= set(data["snapshot"]["recomputed"])
+
+
+def test_release_currency_ttl_and_unknown_not_cached(agent, monkeypatch):
+    calls = _counting(monkeypatch, "get_release_currency", {"status": "unknown", "latest": None})
+    wake_up.get_wake_data(agent)
+    wake_up.get_wake_data(agent)
+    assert len(calls) == 2  # an 'unknown' result is never snapshotted
+
+    calls = _counting(monkeypatch, "get_release_currency", {"status": "behind", "latest": "3.27.0"})
+    wake_up.get_wake_data(agent)
+    assert wake_up.get_wake_data(agent)["release_currency"]["status"] == "behind"
+    assert len(calls) == 1
+    (agent / ".aget/config.json").write_text(json.dumps({"wake_up": {"release_currency_ttl": 0}}))
+    wake_up.get_wake_data(agent)
+    assert len(calls) == 2
+
+
+def test_refresh_ignores_snapshot(agent, monkeypatch):
+    calls = _counting(monkeypatch, "get_release_currency", {"status": "current", "latest": "3.26.0"})
+    wake_up.get_wake_data(agent)
+    data = wake_up.get_wake_data(agent, use_snapshot=False)
+    assert data["snapshot"]["reused"] == [] and len(calls) == 2
+
+
+def test_reliance_snapshot_tracks_skills_and_skips_errors(agent, monkeypatch):
+    _counting(monkeypatch, "get_release_currency", {"status": "current", "latest": "3.26.0"})
+    calls = _counting(monkeypatch, "get_reliance_attestation", {"ok": True, "summary": "1 skill"})
+    wake_up.get_wake_data(agent)
+    (agent / ".claude/skills/aget-new").mkdir(parents=True)
+    data = wake_up.get_wake_data(agent)
+    assert "reliance_attestation" in data["snapshot"]["recomputed"] and len(calls) == 2
+
+    calls = _counting(monkeypatch, "get_reliance_attestation",
+                      {"ok": False, "summary": "validator error: timed out"})
+    (agent / ".claude/skills/aget-other").mkdir()
+    wake_up.get_wake_data(agent)
+    assert wake_up.get_wake_data(agent)["reliance_attestation"]["summary"].startswith("validator error")
+    assert len(calls) == 2  # an error is never snapshotted
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(wake_up, "get_reliance_attestation", broken)
+    wake_up.get_wake_data(agent)
+    calls = _counting(monkeypatch, "get_reliance_attestation", {"ok": True, "summary": "1 skill"})
+    assert wake_up.get_wake_data(agent)["reliance_attestation"]["ok"] is True
+    assert len(calls) == 1  # the 'did not finish' fallback was not snapshotted either